@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Report Generation Benchmark
+
+Generates synthetic findings corpora (mixing the table, header and inline
+field layouts the parser supports), times load_findings, each renderer and
+`generate_report.py --format all` end to end, and compares the results with
+a stored baseline.
+
+Usage:
+    python benchmarks/bench_report.py [options]
+
+Options:
+    --sizes N [N ...]    Corpus sizes to benchmark (default: 1000 10000 100000)
+    --repeat N           Runs per measurement; the fastest is kept (default: 3)
+    --baseline FILE      Baseline to compare against (default: benchmarks/baseline.json)
+    --tolerance F        Allowed slowdown over baseline, as a fraction (default: 0.5)
+    --update-baseline    Write the results as the new baseline instead of comparing
+    --output FILE        Also write the results as JSON to FILE
+    --keep DIR           Generate corpora under DIR and keep them (default: temp dir)
+
+Examples:
+    python benchmarks/bench_report.py --sizes 1000 10000
+    python benchmarks/bench_report.py --update-baseline
+    python benchmarks/bench_report.py --sizes 100000 --repeat 1 --output bench.json
+
+Output:
+    Per-size timing table; exits 1 if any metric regressed past the tolerance
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "skill" / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from generate_report import (  # noqa: E402
+    WRITE_BUFFER_SIZE,
+    load_audit_context,
+    load_findings,
+    write_csv_report,
+    write_json_report,
+    write_markdown_report,
+)
+
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+# Wall-clock timings on shared machines vary by about a third between runs
+DEFAULT_TOLERANCE = 0.5
+
+# Timings under this many seconds are too noisy to fail a run on
+MIN_COMPARABLE_SECONDS = 0.05
+
+LAYOUTS = ["table", "headers", "inline"]
+
+SEVERITIES = ["Critical", "High", "High", "Medium", "Medium", "Medium", "Low", "Low", "Info"]
+STATUSES = ["Open", "Open", "Open", "In Progress", "Resolved", "Accepted Risk"]
+OWASP = [
+    "A01:2021 - Broken Access Control", "A02:2021 - Cryptographic Failures",
+    "A03:2021 - Injection", "A05:2021 - Security Misconfiguration",
+    "A07:2021 - Identification and Authentication Failures", "A09:2021 - Logging Failures",
+]
+CWES = ["CWE-89: SQL Injection", "CWE-79: Cross-site Scripting", "CWE-287", "CWE-352",
+        "CWE-798: Hard-coded Credentials", "CWE-22", "CWE-502", "CWE-209"]
+VECTORS = [
+    "CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:H",
+    "CVSS:3.1/AV:N/AC:L/PR:L/UI:N/S:C/C:L/I:L/A:N",
+    "CVSS:3.1/AV:L/AC:L/PR:L/UI:N/S:U/C:H/I:N/A:N",
+]
+WORDS = ("request handler user input query token session cookie header payload "
+         "database endpoint service config secret key permission role validation "
+         "sanitization redirect upload template parser cache response").split()
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def _paragraph(rng: random.Random, sentences: int) -> str:
+    return " ".join(_sentence(rng, rng.randint(8, 16)) for _ in range(sentences))
+
+
+def render_finding(n: int, layout: str, rng: random.Random) -> str:
+    """Render one synthetic finding in the given field layout."""
+    fields = {
+        "ID": f"BENCH-{n:06d}",
+        "Title": _sentence(rng, 5).rstrip("."),
+        "Severity": rng.choice(SEVERITIES),
+        "Phase": f"Phase {rng.randint(0, 12)}",
+        "Status": rng.choice(STATUSES),
+        "OWASP": rng.choice(OWASP),
+        "CWE": rng.choice(CWES),
+    }
+    if rng.random() < 0.5:
+        fields["CVSS Score"] = f"{rng.randint(1, 10)}.{rng.randint(0, 9)} ({rng.choice(VECTORS)})"
+    location = f"src/{rng.choice(WORDS)}/{rng.choice(WORDS)}.py:{rng.randint(1, 900)}"
+    body = (
+        f"## Description\n{_paragraph(rng, rng.randint(2, 8))}\n\n"
+        f"**Location:** `{location}`\n\n"
+        f"## Proof of Concept\n```\ncurl -X POST https://example.test/{rng.choice(WORDS)}\n```\n\n"
+        f"## Impact\n{_paragraph(rng, 2)}\n\n"
+        f"## Recommendation\n{_paragraph(rng, 3)}\n"
+    )
+
+    if layout == "table":
+        rows = "\n".join(f"| **{k}** | {v} |" for k, v in fields.items())
+        header = f"# [{fields['ID']}] {fields['Title']}\n\n| Field | Value |\n|-------|-------|\n{rows}\n\n"
+    elif layout == "headers":
+        header = f"# {fields['Title']}\n\n" + "".join(f"## {k}\n{v}\n\n" for k, v in fields.items())
+    else:
+        header = f"# {fields['Title']}\n\n" + "".join(f"**{k}**: {v}\n" for k, v in fields.items()) + "\n"
+    return header + body
+
+
+def generate_corpus(root: Path, count: int, seed: int = 0) -> Path:
+    """Write ``count`` synthetic findings under ``root/.audit`` and return the audit dir."""
+    rng = random.Random(seed)
+    audit_dir = root / ".audit"
+    findings_dir = audit_dir / "findings"
+    findings_dir.mkdir(parents=True, exist_ok=True)
+    (audit_dir / "audit-context.md").write_text(
+        "# Audit Context\n\n| **Project Name** | Benchmark Corpus |\n| **Audit Started** | 2025-01-01 |\n",
+        encoding="utf-8",
+    )
+    for n in range(count):
+        layout = LAYOUTS[n % len(LAYOUTS)]
+        (findings_dir / f"BENCH-{n:06d}.md").write_text(render_finding(n, layout, rng), encoding="utf-8")
+    return audit_dir
+
+
+def _best_of(repeat: int, func) -> float:
+    """Run ``func`` ``repeat`` times and return the fastest wall time."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _child_peak_rss_mb() -> Optional[float]:
+    """Peak RSS of the largest finished child process, in MB.
+
+    Sizes are benchmarked smallest first, so this is the current size's peak.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    # ru_maxrss is KB on Linux and bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def benchmark_size(root: Path, count: int, repeat: int) -> dict:
+    """Benchmark one corpus size and return its metrics."""
+    audit_dir = generate_corpus(root / f"corpus-{count}", count)
+    context = load_audit_context(audit_dir)
+
+    result = {}
+    findings = []
+
+    def load():
+        findings[:] = load_findings(audit_dir)
+
+    result["load_findings"] = _best_of(repeat, load)
+    for name, writer in (("render_markdown", write_markdown_report),
+                         ("render_json", write_json_report)):
+        result[name] = _best_of(repeat, lambda: _write_null(writer, findings, context))
+    result["render_csv"] = _best_of(repeat, lambda: _write_null(write_csv_report, findings))
+
+    # End to end in a fresh process, so peak RSS covers a single full run
+    result["format_all"] = _best_of(repeat, lambda: subprocess.run(
+        [sys.executable, str(SCRIPTS_DIR / "generate_report.py"), str(audit_dir),
+         "--format", "all", "--no-cache"],
+        check=True, stdout=subprocess.DEVNULL,
+    ))
+    result["peak_rss_mb"] = _child_peak_rss_mb()
+    result["findings_per_second"] = round(count / result["format_all"])
+    return {k: round(v, 4) if isinstance(v, float) else v for k, v in result.items()}
+
+
+def _write_null(writer, *args) -> None:
+    """Run a renderer into a buffered handle on the null device."""
+    with open(os.devnull, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as out:
+        writer(out, *args)
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """Return a message for every metric that regressed past ``tolerance``.
+
+    Timings (seconds) and peak RSS regress when they grow; sizes or metrics
+    missing from the baseline are not compared.
+    """
+    regressions = []
+    for size, metrics in results.items():
+        base = baseline.get("sizes", {}).get(size)
+        if not base:
+            continue
+        for metric, value in metrics.items():
+            expected = base.get(metric)
+            if metric == "findings_per_second" or value is None or expected is None:
+                continue
+            if metric != "peak_rss_mb" and expected < MIN_COMPARABLE_SECONDS:
+                continue
+            if value > expected * (1 + tolerance):
+                regressions.append(
+                    f"{size} findings: {metric} {value} vs baseline {expected} "
+                    f"(+{(value / expected - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def format_results(results: dict) -> str:
+    """Format results as a plain-text table."""
+    metrics = ["load_findings", "render_markdown", "render_json", "render_csv",
+               "format_all", "findings_per_second", "peak_rss_mb"]
+    lines = [f"{'findings':>9} " + " ".join(f"{m:>19}" for m in metrics)]
+    for size, values in results.items():
+        lines.append(f"{size:>9} " + " ".join(f"{str(values.get(m, '-')):>19}" for m in metrics))
+    return "\n".join(lines)
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark report generation on synthetic findings corpora.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s --sizes 1000 10000             Quick run against the baseline
+  %(prog)s --update-baseline              Record a new baseline
+  %(prog)s --output bench.json            Keep the raw results
+        """
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="Corpus sizes to benchmark (default: 1000 10000 100000)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Runs per measurement; the fastest is kept (default: 3)")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE,
+                        help="Baseline JSON to compare against (default: benchmarks/baseline.json)")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Allowed slowdown over the baseline as a fraction (default: 0.5)")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Write the results as the new baseline instead of comparing")
+    parser.add_argument("--output", type=Path, help="Also write the results as JSON to this file")
+    parser.add_argument("--keep", type=Path, help="Generate corpora under this directory and keep them")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    root = args.keep or Path(tempfile.mkdtemp(prefix="bench-report-"))
+    root.mkdir(parents=True, exist_ok=True)
+    results = {}
+    try:
+        for count in sorted(args.sizes):
+            print(f"Benchmarking {count} findings...", file=sys.stderr)
+            results[str(count)] = benchmark_size(root, count, args.repeat)
+    finally:
+        if not args.keep:
+            shutil.rmtree(root, ignore_errors=True)
+
+    print(format_results(results))
+    document = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "sizes": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+        print(f"Baseline written: {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --update-baseline to record one")
+        return
+
+    regressions = compare(results, json.loads(args.baseline.read_text(encoding="utf-8")), args.tolerance)
+    if regressions:
+        print("\nRegressions past baseline:")
+        for message in regressions:
+            print(f"  - {message}")
+        sys.exit(1)
+    print("\nNo regressions past baseline.")
+
+
+if __name__ == "__main__":
+    main()
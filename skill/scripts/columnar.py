@@ -0,0 +1,140 @@
+"""
+Columnar finding export.
+
+Writes findings column by column for analytics tools: Parquet through
+pyarrow when it is installed, otherwise a typed NumPy ``.npz`` archive.
+Low-cardinality columns (severity, status, phase, CWE, OWASP) are
+dictionary-encoded as integer codes plus a table of distinct values; text
+columns are stored whole.
+
+In ``.npz`` archives a dictionary column ``name`` is stored as
+``name.codes`` (smallest fitting signed integer type) and ``name.values``;
+a text column is stored Arrow-style as ``name.data`` (concatenated UTF-8
+bytes) and ``name.offsets`` (int64, one more than the row count), so no
+column needs pickling or fixed-width padding. ``read_npz`` decodes both.
+
+Not a standalone script: used by generate_report.py --format columnar.
+"""
+
+from typing import BinaryIO, Iterable, Optional
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - exercised when pyarrow is absent
+    pa = pq = None
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when NumPy is absent
+    np = None
+
+
+DICTIONARY_COLUMNS = ("severity", "status", "phase", "cwe", "owasp")
+
+# Output file per backend, in order of preference
+OUTPUT_FILES = {
+    "parquet": "findings.parquet",
+    "npz": "findings.npz",
+}
+
+
+def available_backend() -> Optional[str]:
+    """Return the preferred installed backend, or None if neither library is installed."""
+    if pa is not None:
+        return "parquet"
+    if np is not None:
+        return "npz"
+    return None
+
+
+def build_columns(records: Iterable[dict], fields: tuple) -> dict:
+    """Pivot finding records into columns in a single pass.
+
+    Columns named in DICTIONARY_COLUMNS become ``(values, codes)`` with
+    values in first-seen order; all others are lists of strings.
+    """
+    columns = {}
+    lookups = {}
+    for field in fields:
+        if field in DICTIONARY_COLUMNS:
+            columns[field] = ([], [])
+            lookups[field] = {}
+        else:
+            columns[field] = []
+
+    for record in records:
+        for field in fields:
+            value = record.get(field) or ""
+            if field in lookups:
+                lookup = lookups[field]
+                values, codes = columns[field]
+                if value not in lookup:
+                    lookup[value] = len(values)
+                    values.append(value)
+                codes.append(lookup[value])
+            else:
+                columns[field].append(value)
+    return columns
+
+
+def write_parquet(out: BinaryIO, columns: dict) -> None:
+    """Write columns as a Parquet file with dictionary-typed categorical columns."""
+    arrays = {}
+    for name, column in columns.items():
+        if isinstance(column, tuple):
+            values, codes = column
+            arrays[name] = pa.DictionaryArray.from_arrays(pa.array(codes, type=pa.int32()),
+                                                          pa.array(values, type=pa.string()))
+        else:
+            arrays[name] = pa.array(column, type=pa.string())
+    pq.write_table(pa.table(arrays), out, compression="zstd")
+
+
+def _code_dtype(size: int):
+    """Smallest signed integer type that can index ``size`` values."""
+    for dtype in (np.int8, np.int16, np.int32):
+        if size <= np.iinfo(dtype).max:
+            return dtype
+    return np.int64
+
+
+def write_npz(out: BinaryIO, columns: dict) -> None:
+    """Write columns as a compressed NumPy archive (layout in the module docstring)."""
+    arrays = {}
+    for name, column in columns.items():
+        if isinstance(column, tuple):
+            values, codes = column
+            arrays[f"{name}.codes"] = np.array(codes, dtype=_code_dtype(len(values)))
+            arrays[f"{name}.values"] = np.array(values, dtype=str)
+        else:
+            encoded = [text.encode("utf-8") for text in column]
+            offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+            np.cumsum([len(b) for b in encoded], out=offsets[1:])
+            arrays[f"{name}.data"] = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+            arrays[f"{name}.offsets"] = offsets
+    np.savez_compressed(out, **arrays)
+
+
+def write_columns(out: BinaryIO, columns: dict, backend: str) -> None:
+    """Write columns with ``backend`` ("parquet" or "npz")."""
+    if backend == "parquet":
+        write_parquet(out, columns)
+    else:
+        write_npz(out, columns)
+
+
+def read_npz(source) -> dict:
+    """Read an archive written by write_npz back into ``name -> list of str`` columns."""
+    columns = {}
+    with np.load(source) as archive:
+        names = dict.fromkeys(key.rsplit(".", 1)[0] for key in archive.files)
+        for name in names:
+            if f"{name}.codes" in archive.files:
+                values = archive[f"{name}.values"].tolist()
+                columns[name] = [values[code] for code in archive[f"{name}.codes"].tolist()]
+            else:
+                data = archive[f"{name}.data"].tobytes()
+                offsets = archive[f"{name}.offsets"].tolist()
+                columns[name] = [data[start:end].decode("utf-8") for start, end in zip(offsets, offsets[1:])]
+    return columns
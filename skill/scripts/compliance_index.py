@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Compliance Index Script
+
+Compiles compliance/compliance-mapping.md into a lookup index of SOC 2,
+GDPR, PCI-DSS, HIPAA and ISO 27001 controls keyed by audit phase and OWASP
+Top 10 category, so each finding resolves to its controls with two dict
+lookups. The compiled index is cached as JSON and rebuilt only when the
+mapping file's size or mtime changes.
+
+An installed skill has no compliance/ directory, so the index compiled from
+the repository mapping also ships as skill/data/compliance-index.json and is
+used when the mapping is not found; regenerate it with --json after editing
+the mapping. With neither available, a warning is printed on stderr and
+reports leave out control coverage.
+
+Usage:
+    python compliance_index.py [options]
+
+Options:
+    --mapping FILE     Compliance mapping markdown (default: compliance/compliance-mapping.md)
+    --cache-dir DIR    Directory for the compiled index cache
+    --json             Print the compiled index as JSON
+
+Examples:
+    python compliance_index.py
+    python compliance_index.py --json
+    python compliance_index.py --mapping my-mapping.md --cache-dir .audit/.cache
+    python compliance_index.py --json > skill/data/compliance-index.json
+
+Output:
+    Controls per framework, or the full index with --json
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Optional
+
+
+COMPLIANCE_MAPPING = Path(__file__).resolve().parents[2] / "compliance" / "compliance-mapping.md"
+BUNDLED_INDEX = Path(__file__).resolve().parents[1] / "data" / "compliance-index.json"
+INDEX_CACHE_FILE = "compliance-index.json"
+
+# Bump whenever compile_mapping output changes so cached indexes are rebuilt
+INDEX_VERSION = 1
+
+# Section heading prefix -> framework name, in report order
+FRAMEWORK_HEADINGS = [
+    ("SOC 2", "SOC 2"),
+    ("PCI-DSS", "PCI-DSS"),
+    ("HIPAA", "HIPAA"),
+    ("GDPR", "GDPR"),
+    ("ISO 27001", "ISO 27001"),
+]
+
+# Framework prefixes used in the "Automated Compliance Tagging" table
+TAG_PREFIXES = {
+    "SOC2": "SOC 2",
+    "PCI": "PCI-DSS",
+    "HIPAA": "HIPAA",
+    "GDPR": "GDPR",
+    "ISO": "ISO 27001",
+}
+
+AUTO_TAG_HEADING = "Automated Compliance Tagging"
+
+# Compiled indexes already loaded in this process, keyed by mapping path
+_loaded = {}
+
+
+def _cells(line: str) -> list:
+    """Split a markdown table row into stripped cells."""
+    return [cell.strip() for cell in line.strip().strip("|").split("|")]
+
+
+def _control_id(framework: str, value: str) -> str:
+    """Normalize a control reference ("**CC6.1**", "Art.32(1)(a)") to its catalog ID."""
+    value = value.strip("* ")
+    if framework == "GDPR":
+        value = re.sub(r'^Art(?:icle)?\.?\s*', '', value)
+    return value
+
+
+def compile_mapping(text: str) -> dict:
+    """Compile the mapping markdown into a control lookup index.
+
+    Returns ``{"frameworks": {name: {control: description}}, "phases":
+    {phase: [[framework, control], ...]}, "owasp": {"A03": [...]}}``.
+    Controls listed for "All Phases" are catalogued but not tied to a phase.
+    """
+    frameworks = {name: {} for _, name in FRAMEWORK_HEADINGS}
+    phases = {}
+    owasp = {}
+    section = None
+
+    def add(bucket: dict, key: str, framework: str, control: str) -> None:
+        entries = bucket.setdefault(key, [])
+        if [framework, control] not in entries:
+            entries.append([framework, control])
+
+    for line in text.splitlines():
+        if line.startswith("## "):
+            heading = line[3:].strip()
+            section = next((name for prefix, name in FRAMEWORK_HEADINGS if heading.startswith(prefix)), None)
+            if heading.startswith(AUTO_TAG_HEADING):
+                section = AUTO_TAG_HEADING
+            continue
+        if not section or not line.startswith("|"):
+            continue
+
+        cells = _cells(line)
+        if section == AUTO_TAG_HEADING:
+            if len(cells) < 2:
+                continue
+            tags = [tag.strip().split(None, 1) for tag in cells[1].split(",")]
+            categories = [value for prefix, value in (t for t in tags if len(t) == 2) if prefix == "OWASP"]
+            for tag in tags:
+                if len(tag) != 2 or tag[0] not in TAG_PREFIXES:
+                    continue
+                framework = TAG_PREFIXES[tag[0]]
+                control = _control_id(framework, tag[1])
+                if control in frameworks[framework]:
+                    for category in categories:
+                        add(owasp, category, framework, control)
+        elif cells[0].startswith("**") and len(cells) >= 3:
+            control = _control_id(section, cells[0])
+            catalog = frameworks[section]
+            # GDPR lists several requirements under one article paragraph
+            catalog[control] = f"{catalog[control]} / {cells[1]}" if control in catalog else cells[1]
+            if "All" not in cells[2]:
+                for phase in re.findall(r'\d+', cells[2]):
+                    add(phases, phase, section, control)
+
+    return {"frameworks": frameworks, "phases": phases, "owasp": owasp}
+
+
+def _read_cache(cache_file: Path, source: list) -> Optional[dict]:
+    """Return the cached index if it was compiled from ``source``."""
+    try:
+        with open(cache_file, encoding="utf-8") as fh:
+            data = json.load(fh)
+    except (OSError, ValueError):
+        return None
+    return data.get("index") if data.get("source") == source else None
+
+
+def _write_cache(cache_file: Path, source: list, index: dict) -> None:
+    """Atomically write the compiled index; a read-only cache dir is not an error."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump({"source": source, "index": index}, fh)
+        os.replace(tmp, cache_file)
+    except OSError:
+        pass
+
+
+def _load_bundled_index() -> Optional[dict]:
+    """Load the index shipped with the skill; warn once on stderr if it is missing too."""
+    key = str(BUNDLED_INDEX)
+    if key in _loaded:
+        return _loaded[key][1]
+    try:
+        with open(BUNDLED_INDEX, encoding="utf-8") as fh:
+            index = json.load(fh)
+    except (OSError, ValueError):
+        index = None
+        print(f"Warning: Compliance mapping not found: {COMPLIANCE_MAPPING}; "
+              f"control coverage is left out of reports", file=sys.stderr)
+    _loaded[key] = (None, index)
+    return index
+
+
+def load_compliance_index(mapping: Optional[Path] = None,
+                          cache_dir: Optional[Path] = None) -> Optional[dict]:
+    """Load the compiled index for ``mapping`` (default: COMPLIANCE_MAPPING).
+
+    The index is compiled at most once per process per mapping version, and
+    with ``cache_dir`` it is also reused across runs until the markdown's
+    size or mtime changes. Returns None if ``mapping`` is missing; if the
+    default mapping is missing, returns the bundled index instead.
+    """
+    try:
+        st = (mapping or COMPLIANCE_MAPPING).stat()
+    except OSError:
+        return None if mapping else _load_bundled_index()
+    mapping = mapping or COMPLIANCE_MAPPING
+    source = [str(mapping.resolve()), st.st_size, st.st_mtime_ns, INDEX_VERSION]
+
+    loaded = _loaded.get(source[0])
+    if loaded and loaded[0] == source:
+        return loaded[1]
+
+    cache_file = cache_dir / INDEX_CACHE_FILE if cache_dir else None
+    index = _read_cache(cache_file, source) if cache_file else None
+    if index is None:
+        index = compile_mapping(mapping.read_text(encoding="utf-8"))
+        if cache_file:
+            _write_cache(cache_file, source, index)
+    _loaded[source[0]] = (source, index)
+    return index
+
+
+def lookup_controls(index: dict, phase: Optional[int], owasp: str) -> list:
+    """Return the [framework, control] pairs for a phase number and OWASP code (e.g. "A03")."""
+    controls = list(index["phases"].get(str(phase), ())) if phase is not None else []
+    for entry in index["owasp"].get(owasp, ()):
+        if entry not in controls:
+            controls.append(entry)
+    return controls
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Compile the compliance mapping into a control lookup index.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s                                Controls per framework
+  %(prog)s --json                         Full compiled index
+  %(prog)s --cache-dir .audit/.cache      Reuse / refresh a cached index
+        """
+    )
+
+    parser.add_argument(
+        "--mapping",
+        type=Path,
+        help="Compliance mapping markdown (default: compliance/compliance-mapping.md)"
+    )
+
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="Directory for the compiled index cache"
+    )
+
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the compiled index as JSON"
+    )
+
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    index = load_compliance_index(args.mapping, args.cache_dir)
+    if index is None:
+        print(f"Error: Compliance mapping not found: {args.mapping or COMPLIANCE_MAPPING}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.json:
+        print(json.dumps(index, indent=2))
+        return
+
+    for framework, controls in index["frameworks"].items():
+        print(f"{framework}: {len(controls)} controls")
+    print(f"Phases mapped: {len(index['phases'])}, OWASP categories mapped: {len(index['owasp'])}")
+
+
+if __name__ == "__main__":
+    main()
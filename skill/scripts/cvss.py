@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+CVSS Scoring Script
+
+Parses CVSS vector strings and computes base and environmental scores in
+batches. CVSS v3.0/v3.1 vectors are scored with the specification formulas,
+using NumPy arrays over the metric weights when NumPy is installed and a
+pure-Python loop otherwise. CVSS v4.0 vectors are recognised but not scored
+(v4 scores come from a macro-vector lookup table rather than a formula), so
+findings using v4 should also record the numeric score; reports and
+validate_finding.py name the v4 findings that do not.
+
+Usage:
+    python cvss.py VECTOR [VECTOR ...]
+
+Examples:
+    python cvss.py "CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:H"
+    python cvss.py "CVSS:3.1/AV:N/AC:L/PR:L/UI:N/S:C/C:L/I:L/A:N/CR:H/MAV:A"
+
+Output:
+    JSON list with the version, base and environmental score of each vector
+"""
+
+import json
+import math
+import re
+import sys
+from typing import Optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when NumPy is absent
+    np = None
+
+
+VECTOR_PATTERN = re.compile(r'CVSS:(3\.[01]|4\.0)/[A-Za-z]+:[A-Za-z](?:/[A-Za-z]+:[A-Za-z])*')
+
+BASE_METRICS = ["AV", "AC", "PR", "UI", "S", "C", "I", "A"]
+
+WEIGHTS = {
+    "AV": {"N": 0.85, "A": 0.62, "L": 0.55, "P": 0.2},
+    "AC": {"L": 0.77, "H": 0.44},
+    "PR": {"N": 0.85, "L": 0.62, "H": 0.27},
+    "UI": {"N": 0.85, "R": 0.62},
+    "CIA": {"H": 0.56, "L": 0.22, "N": 0.0},
+    "E": {"X": 1.0, "H": 1.0, "F": 0.97, "P": 0.94, "U": 0.91},
+    "RL": {"X": 1.0, "U": 1.0, "W": 0.97, "T": 0.96, "O": 0.95},
+    "RC": {"X": 1.0, "C": 1.0, "R": 0.96, "U": 0.92},
+    "REQ": {"X": 1.0, "H": 1.5, "M": 1.0, "L": 0.5},
+}
+
+# Privileges Required weighs more when the scope changes
+PR_SCOPE_CHANGED = {"N": 0.85, "L": 0.68, "H": 0.5}
+
+# Qualitative rating bands, highest first
+SEVERITY_BANDS = [("critical", 9.0), ("high", 7.0), ("medium", 4.0), ("low", 0.1), ("none", 0.0)]
+
+# Field order of the per-vector weight rows fed to the scoring formulas
+WEIGHT_FIELDS = [
+    "AV", "AC", "PR", "UI", "C", "I", "A", "S",
+    "MAV", "MAC", "MPR", "MUI", "MC", "MI", "MA", "MS",
+    "E", "RL", "RC", "CR", "IR", "AR", "V31",
+]
+
+
+def parse_vector(vector: str) -> Optional[dict]:
+    """Parse a CVSS vector into {"version": ..., metric: value}, or None if invalid."""
+    match = VECTOR_PATTERN.search(vector or "")
+    if not match:
+        return None
+    parts = match.group(0).split("/")
+    metrics = {"version": parts[0].split(":")[1]}
+    for part in parts[1:]:
+        key, value = part.split(":")
+        metrics[key.upper()] = value.upper()
+    if metrics["version"].startswith("3") and not all(
+        metrics.get(m) in (("U", "C") if m == "S" else WEIGHTS["CIA"] if m in "CIA" else WEIGHTS[m])
+        for m in BASE_METRICS
+    ):
+        return None
+    return metrics
+
+
+def severity_rating(score: Optional[float]) -> str:
+    """Map a CVSS score to its qualitative rating."""
+    if score is None:
+        return ""
+    for rating, floor in SEVERITY_BANDS:
+        if score >= floor:
+            return rating
+    return "none"
+
+
+def _weights(m: dict) -> list:
+    """Translate parsed v3 metrics into the numeric row used by the formulas."""
+    def modified(metric: str) -> str:
+        value = m.get("M" + metric, "X")
+        return m[metric] if value == "X" else value
+
+    scope = m["S"]
+    mscope = modified("S")
+    pr = PR_SCOPE_CHANGED if scope == "C" else WEIGHTS["PR"]
+    mpr = PR_SCOPE_CHANGED if mscope == "C" else WEIGHTS["PR"]
+    return [
+        WEIGHTS["AV"][m["AV"]], WEIGHTS["AC"][m["AC"]], pr[m["PR"]], WEIGHTS["UI"][m["UI"]],
+        WEIGHTS["CIA"][m["C"]], WEIGHTS["CIA"][m["I"]], WEIGHTS["CIA"][m["A"]], scope == "C",
+        WEIGHTS["AV"].get(modified("AV"), 0.0), WEIGHTS["AC"].get(modified("AC"), 0.0),
+        mpr.get(modified("PR"), 0.0), WEIGHTS["UI"].get(modified("UI"), 0.0),
+        WEIGHTS["CIA"].get(modified("C"), 0.0), WEIGHTS["CIA"].get(modified("I"), 0.0),
+        WEIGHTS["CIA"].get(modified("A"), 0.0), mscope == "C",
+        WEIGHTS["E"].get(m.get("E", "X"), 1.0), WEIGHTS["RL"].get(m.get("RL", "X"), 1.0),
+        WEIGHTS["RC"].get(m.get("RC", "X"), 1.0),
+        WEIGHTS["REQ"].get(m.get("CR", "X"), 1.0), WEIGHTS["REQ"].get(m.get("IR", "X"), 1.0),
+        WEIGHTS["REQ"].get(m.get("AR", "X"), 1.0),
+        m["version"] == "3.1",
+    ]
+
+
+class _ScalarOps:
+    """Formula primitives for single floats."""
+
+    @staticmethod
+    def where(cond, a, b):
+        return a if cond else b
+
+    minimum = staticmethod(min)
+
+    @staticmethod
+    def roundup(x: float) -> float:
+        # CVSS v3.1 Appendix A Roundup, which avoids floating-point artefacts
+        int_input = round(x * 100000)
+        if int_input % 10000 == 0:
+            return int_input / 100000.0
+        return (math.floor(int_input / 10000) + 1) / 10.0
+
+
+class _ArrayOps:
+    """Formula primitives for NumPy arrays."""
+
+    @staticmethod
+    def where(cond, a, b):
+        return np.where(cond, a, b)
+
+    @staticmethod
+    def minimum(a, b):
+        return np.minimum(a, b)
+
+    @staticmethod
+    def roundup(x):
+        int_input = np.round(x * 100000)
+        return np.where(int_input % 10000 == 0, int_input / 100000.0,
+                        (np.floor(int_input / 10000) + 1) / 10.0)
+
+
+def _scores(w: dict, ops) -> tuple:
+    """Compute (base, environmental) scores from weight scalars or arrays."""
+    iss = 1 - (1 - w["C"]) * (1 - w["I"]) * (1 - w["A"])
+    impact = ops.where(w["S"], 7.52 * (iss - 0.029) - 3.25 * (iss - 0.02) ** 15, 6.42 * iss)
+    exploitability = 8.22 * w["AV"] * w["AC"] * w["PR"] * w["UI"]
+    base = ops.where(
+        impact <= 0, 0.0,
+        ops.roundup(ops.where(w["S"], ops.minimum(1.08 * (impact + exploitability), 10.0),
+                              ops.minimum(impact + exploitability, 10.0))),
+    )
+
+    miss = ops.minimum(
+        1 - (1 - w["CR"] * w["MC"]) * (1 - w["IR"] * w["MI"]) * (1 - w["AR"] * w["MA"]), 0.915
+    )
+    changed_impact = ops.where(
+        w["V31"],
+        7.52 * (miss - 0.029) - 3.25 * (miss * 0.9731 - 0.02) ** 13,
+        7.52 * (miss - 0.029) - 3.25 * (miss - 0.02) ** 15,
+    )
+    mimpact = ops.where(w["MS"], changed_impact, 6.42 * miss)
+    mexploitability = 8.22 * w["MAV"] * w["MAC"] * w["MPR"] * w["MUI"]
+    temporal = w["E"] * w["RL"] * w["RC"]
+    environmental = ops.where(
+        mimpact <= 0, 0.0,
+        ops.roundup(ops.where(
+            w["MS"],
+            ops.roundup(ops.minimum(1.08 * (mimpact + mexploitability), 10.0)) * temporal,
+            ops.roundup(ops.minimum(mimpact + mexploitability, 10.0)) * temporal,
+        )),
+    )
+    return base, environmental
+
+
+def score_vectors(vectors: list) -> list:
+    """Score a batch of vector strings.
+
+    Returns one dict per input with ``version``, ``base`` and
+    ``environmental`` (floats, or None when the vector is missing, invalid
+    or CVSS v4.0). Each distinct string is parsed and scored once, since
+    scanner imports repeat the same few vectors many times.
+    """
+    unique = list(dict.fromkeys(vectors))
+    results = []
+    rows = []
+    row_index = []
+    for i, vector in enumerate(unique):
+        metrics = parse_vector(vector)
+        results.append({
+            "version": metrics["version"] if metrics else None,
+            "base": None,
+            "environmental": None,
+        })
+        if metrics and metrics["version"].startswith("3"):
+            rows.append(_weights(metrics))
+            row_index.append(i)
+
+    if rows:
+        _score_rows(rows, row_index, results)
+    by_vector = dict(zip(unique, results))
+    return [dict(by_vector[vector]) for vector in vectors]
+
+
+def _score_rows(rows: list, row_index: list, results: list) -> None:
+    """Fill in base and environmental scores for the v3 weight rows."""
+    if np is not None:
+        matrix = np.array(rows, dtype=float)
+        columns = {name: matrix[:, j] for j, name in enumerate(WEIGHT_FIELDS)}
+        for name in ("S", "MS", "V31"):
+            columns[name] = columns[name].astype(bool)
+        base, environmental = _scores(columns, _ArrayOps)
+        pairs = zip(base.tolist(), environmental.tolist())
+    else:
+        pairs = (_scores(dict(zip(WEIGHT_FIELDS, row)), _ScalarOps) for row in rows)
+
+    for i, (b, e) in zip(row_index, pairs):
+        results[i]["base"] = round(float(b), 1)
+        results[i]["environmental"] = round(float(e), 1)
+
+
+def percentile(values: list, q: float) -> float:
+    """Linear-interpolated percentile of sorted ``values`` (matches NumPy's default)."""
+    if not values:
+        return 0.0
+    k = (len(values) - 1) * q / 100.0
+    lo = math.floor(k)
+    hi = min(lo + 1, len(values) - 1)
+    return values[lo] + (values[hi] - values[lo]) * (k - lo)
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python cvss.py VECTOR [VECTOR ...]", file=sys.stderr)
+        sys.exit(1)
+
+    results = score_vectors(sys.argv[1:])
+    for vector, result in zip(sys.argv[1:], results):
+        result["vector"] = vector
+        result["severity"] = severity_rating(result["environmental"])
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
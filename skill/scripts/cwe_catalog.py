@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+CWE Catalog Script
+
+Looks up CWE IDs in the bundled offline catalog (skill/data/cwe-catalog.txt):
+whether an ID exists, its name, whether it is a category rather than a
+weakness, and its OWASP Top 10 2021 category. The catalog is compiled on
+first use into a sorted array of IDs with parallel kind and category bytes,
+so a lookup is one binary search; compiling it takes well under a
+millisecond, which is cheaper than reading back any on-disk cache.
+
+If the catalog file is missing, validation and import fall back to the
+built-in OWASP Top 10 2021 mapping (without CWE names) and say so on stderr.
+
+Usage:
+    python cwe_catalog.py [options] [CWE ...]
+
+Options:
+    --owasp CODE       List the catalogued CWEs of an OWASP 2021 category (e.g. A03)
+    --catalog FILE     CWE catalog file (default: skill/data/cwe-catalog.txt)
+    --json             Print results as JSON
+
+Examples:
+    python cwe_catalog.py CWE-89 79
+    python cwe_catalog.py --owasp A01
+    python cwe_catalog.py --json CWE-16
+
+Output:
+    One line per CWE with its OWASP 2021 category and name; exits 1 if any
+    CWE ID does not exist
+"""
+
+import argparse
+import json
+import re
+import sys
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import Optional
+
+
+CWE_CATALOG = Path(__file__).resolve().parents[1] / "data" / "cwe-catalog.txt"
+
+OWASP_2021 = {
+    "A01": "Broken Access Control",
+    "A02": "Cryptographic Failures",
+    "A03": "Injection",
+    "A04": "Insecure Design",
+    "A05": "Security Misconfiguration",
+    "A06": "Vulnerable and Outdated Components",
+    "A07": "Identification and Authentication Failures",
+    "A08": "Software and Data Integrity Failures",
+    "A09": "Security Logging and Monitoring Failures",
+    "A10": "Server-Side Request Forgery",
+}
+
+CWE_REFERENCE = re.compile(r'CWE[-\s]*(\d+)', re.IGNORECASE)
+MAX_ID_PATTERN = re.compile(r'#\s*max-id:\s*(\d+)')
+
+# OWASP Top 10 2021 mapping used when the catalog file is missing
+FALLBACK_OWASP = {
+    "A01": (22, 23, 35, 59, 200, 201, 219, 264, 275, 276, 284, 285, 352, 359, 377, 402, 425,
+            441, 497, 538, 540, 548, 552, 566, 601, 639, 651, 668, 706, 862, 863, 913, 922, 1275),
+    "A02": (259, 261, 296, 310, 319, 321, 322, 323, 324, 325, 326, 327, 328, 329, 330, 331, 335,
+            336, 337, 338, 340, 347, 523, 720, 757, 759, 760, 780, 818, 916),
+    "A03": (20, 74, 75, 77, 78, 79, 80, 83, 87, 88, 89, 90, 91, 93, 94, 95, 96, 97, 98, 99, 113,
+            116, 138, 184, 470, 471, 564, 610, 643, 644, 652, 917),
+    "A04": (73, 183, 209, 213, 235, 256, 257, 266, 269, 280, 311, 312, 313, 316, 419, 430, 434,
+            444, 451, 472, 501, 522, 525, 539, 579, 598, 602, 642, 646, 650, 653, 656, 657, 799,
+            807, 840, 841, 927, 1021, 1173),
+    "A05": (2, 11, 13, 15, 16, 260, 315, 520, 526, 537, 541, 547, 611, 614, 756, 776, 942, 1004,
+            1032, 1174),
+    "A06": (937, 1035, 1104),
+    "A07": (255, 287, 288, 290, 294, 295, 297, 300, 302, 304, 306, 307, 346, 384, 521, 613, 620,
+            640, 798, 940, 1216),
+    "A08": (345, 353, 426, 494, 502, 565, 784, 829, 830, 915),
+    "A09": (117, 223, 532, 778),
+    "A10": (918,),
+}
+FALLBACK_CATEGORIES = (2, 16, 255, 264, 275, 310, 720, 840, 937, 1032, 1035, 1216)
+FALLBACK_MAX_ID = 1430
+
+# Compiled catalogs already loaded in this process, keyed by catalog path
+_loaded = {}
+
+
+class CweCatalog:
+    """Compiled CWE catalog: sorted IDs with their kind, OWASP 2021 category and name."""
+
+    __slots__ = ("ids", "kinds", "categories", "names", "max_id")
+
+    def __init__(self, entries: list, max_id: int = 0):
+        entries = sorted(entries)
+        self.ids = array("H", (cwe for cwe, _, _, _ in entries))
+        self.kinds = bytes(ord(kind) for _, kind, _, _ in entries)
+        # 0 = not mapped, n = A0n
+        self.categories = bytes(int(owasp[1:]) if owasp else 0 for _, _, owasp, _ in entries)
+        self.names = tuple(name for _, _, _, name in entries)
+        self.max_id = max(max_id, self.ids[-1] if self.ids else 0)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, cwe: int) -> bool:
+        return self._index(cwe) >= 0
+
+    def _index(self, cwe: int) -> int:
+        i = bisect_left(self.ids, cwe)
+        return i if i < len(self.ids) and self.ids[i] == cwe else -1
+
+    def exists(self, cwe: int) -> bool:
+        """Return whether ``cwe`` is catalogued or at least within the assigned ID range."""
+        return 1 <= cwe <= self.max_id
+
+    def name(self, cwe: int) -> Optional[str]:
+        i = self._index(cwe)
+        return self.names[i] if i >= 0 else None
+
+    def is_category(self, cwe: int) -> bool:
+        i = self._index(cwe)
+        return i >= 0 and self.kinds[i] == ord("C")
+
+    def owasp(self, cwe: int) -> Optional[str]:
+        """Return the OWASP Top 10 2021 code (e.g. "A03") ``cwe`` is mapped to, if any."""
+        i = self._index(cwe)
+        return f"A{self.categories[i]:02d}" if i >= 0 and self.categories[i] else None
+
+    def by_owasp(self, code: str) -> list:
+        """Return the catalogued CWE IDs mapped to an OWASP 2021 code, in ID order."""
+        number = int(code[1:])
+        return [cwe for cwe, category in zip(self.ids, self.categories) if category == number]
+
+
+def compile_catalog(text: str) -> CweCatalog:
+    """Compile catalog text (see skill/data/cwe-catalog.txt) into a CweCatalog.
+
+    Lines that do not parse as ``id kind owasp name`` are skipped.
+    """
+    entries = []
+    max_id = 0
+    for line in text.splitlines():
+        if line.startswith("#"):
+            match = MAX_ID_PATTERN.match(line)
+            if match:
+                max_id = int(match.group(1))
+            continue
+        parts = line.split(None, 3)
+        if len(parts) != 4 or not parts[0].isdigit() or parts[1] not in ("W", "C"):
+            continue
+        owasp = parts[2] if parts[2] in OWASP_2021 else ""
+        entries.append((int(parts[0]), parts[1], owasp, parts[3].strip()))
+    return CweCatalog(entries, max_id)
+
+
+def fallback_catalog() -> CweCatalog:
+    """Build a catalog from the built-in OWASP 2021 mapping; it has no CWE names."""
+    return CweCatalog([
+        (cwe, "C" if cwe in FALLBACK_CATEGORIES else "W", code, "")
+        for code, cwes in FALLBACK_OWASP.items()
+        for cwe in cwes
+    ], FALLBACK_MAX_ID)
+
+
+def load_catalog(catalog: Optional[Path] = None, fallback: bool = False) -> Optional[CweCatalog]:
+    """Load the compiled catalog (default: CWE_CATALOG).
+
+    The catalog is compiled at most once per process until the file's size
+    or mtime changes. If the catalog file is missing, return None, or with
+    ``fallback`` warn once on stderr and return fallback_catalog().
+    """
+    catalog = catalog or CWE_CATALOG
+    key = str(catalog)
+    try:
+        st = catalog.stat()
+    except OSError:
+        if not fallback:
+            return None
+        loaded = _loaded.get(key)
+        if loaded and loaded[0] is None:
+            return loaded[1]
+        print(f"Warning: CWE catalog not found: {catalog}; "
+              f"using the built-in OWASP 2021 mapping without CWE names", file=sys.stderr)
+        compiled = fallback_catalog()
+        _loaded[key] = (None, compiled)
+        return compiled
+    source = (st.st_size, st.st_mtime_ns)
+
+    loaded = _loaded.get(key)
+    if loaded and loaded[0] == source:
+        return loaded[1]
+    compiled = compile_catalog(catalog.read_text(encoding="utf-8"))
+    _loaded[key] = (source, compiled)
+    return compiled
+
+
+def cwe_ids(value: str) -> list:
+    """Return the CWE numbers referenced in a string ("CWE-79, CWE-80" -> [79, 80])."""
+    return [int(match) for match in CWE_REFERENCE.findall(value or "")]
+
+
+def describe(catalog: CweCatalog, cwe: int) -> dict:
+    """Return what the catalog knows about ``cwe`` as a JSON-ready dict."""
+    owasp = catalog.owasp(cwe)
+    return {
+        "cwe": f"CWE-{cwe}",
+        "exists": catalog.exists(cwe),
+        "name": catalog.name(cwe),
+        "category": catalog.is_category(cwe),
+        "owasp": f"{owasp}:2021 - {OWASP_2021[owasp]}" if owasp else None,
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Look up CWE IDs in the offline CWE catalog.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s CWE-89 79                 Names and OWASP categories
+  %(prog)s --owasp A01               CWEs of an OWASP 2021 category
+  %(prog)s --json CWE-16             Lookup result as JSON
+        """
+    )
+
+    parser.add_argument(
+        "cwes",
+        nargs="*",
+        metavar="CWE",
+        help="CWE IDs to look up (CWE-89 or 89)"
+    )
+
+    parser.add_argument(
+        "--owasp",
+        metavar="CODE",
+        help="List the catalogued CWEs of an OWASP 2021 category (e.g. A03)"
+    )
+
+    parser.add_argument(
+        "--catalog",
+        type=Path,
+        default=CWE_CATALOG,
+        help="CWE catalog file (default: skill/data/cwe-catalog.txt)"
+    )
+
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print results as JSON"
+    )
+
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    catalog = load_catalog(args.catalog)
+    if catalog is None:
+        print(f"Error: CWE catalog not found: {args.catalog}", file=sys.stderr)
+        sys.exit(1)
+
+    cwes = [int(cwe) for value in args.cwes for cwe in re.findall(r'\d+', value)]
+    if args.owasp:
+        code = args.owasp[:3].upper()
+        if code not in OWASP_2021:
+            print(f"Error: Unknown OWASP 2021 category: {args.owasp}", file=sys.stderr)
+            sys.exit(1)
+        cwes += catalog.by_owasp(code)
+    if not cwes:
+        print(f"{len(catalog)} CWEs catalogued, IDs up to CWE-{catalog.max_id}")
+        return
+
+    results = [describe(catalog, cwe) for cwe in cwes]
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for result in results:
+            if not result["exists"]:
+                print(f"{result['cwe']}\tnot a CWE ID")
+                continue
+            kind = " (category)" if result["category"] else ""
+            print(f"{result['cwe']}\t{(result['owasp'] or '-')[:8]}\t{result['name'] or '(not catalogued)'}{kind}")
+    sys.exit(0 if all(result["exists"] for result in results) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Near-duplicate finding detection.
+
+Groups texts that say the same thing in different words, as happens when
+several agents or scanner imports report the same issue. Each text is
+reduced to shingles, the bigrams of its words cut to their first
+STEM_LENGTH letters (a crude stemmer: "allowing" and "allows" agree) with
+stop words dropped, and
+summarised as a one-permutation MinHash signature: every shingle is hashed
+once and only the smallest hash landing in each of SIGNATURE_SIZE bins is
+kept, with empty bins filled from the next filled one. Signatures are cut
+into BANDS bands for locality-sensitive hashing; texts sharing a band and
+a blocking key (e.g. the CWE) become candidates, and candidates whose
+signatures agree on at least ``threshold`` of their bins are merged with
+union-find. Each text is compared with at most one candidate per band, so
+the work grows linearly with the number of texts rather than pairwise.
+Signatures are independent of each other, so callers may compute them on
+a worker pool with text_signature and cluster them with cluster_signatures.
+
+Not a standalone script: used by generate_report.py --dedupe.
+"""
+
+import re
+import zlib
+from array import array
+from operator import eq
+from typing import Iterable, Optional, Sequence
+
+
+SIGNATURE_SIZE = 64
+BANDS = 16
+ROWS = SIGNATURE_SIZE // BANDS
+
+# Share of signature bins two texts must agree on to be clustered; with 16
+# bands of 4 rows, pairs this similar become candidates ~89% of the time
+SIMILARITY_THRESHOLD = 0.6
+
+# Only the opening of a text is shingled; it carries the substance of a finding
+TEXT_LIMIT = 2000
+
+STEM_LENGTH = 5
+WORD_PATTERN = re.compile(r'[a-z0-9]+')
+STOP_WORDS = frozenset(
+    "a an and are as at be been by can could for from has have in into is it its may of on or "
+    "that the their there this to was were when which while with".split()
+)
+
+# Bin hashes keep 26 bits; filled-in bins add multiples of this so they never equal a real hash
+BIN_BITS = 6
+VALUE_RANGE = 1 << (32 - BIN_BITS)
+
+
+def shingles(text: str) -> set:
+    """Return the stemmed word bigrams of ``text`` (single words when it has fewer than two)."""
+    words = [w[:STEM_LENGTH] for w in WORD_PATTERN.findall(text.lower(), 0, TEXT_LIMIT)
+             if w not in STOP_WORDS]
+    if len(words) < 2:
+        return set(words)
+    return {f"{a} {b}" for a, b in zip(words, words[1:])}
+
+
+def signature(shingle_set: Iterable[str]) -> Optional[array]:
+    """Return the one-permutation MinHash signature of a shingle set, or None if it is empty."""
+    bins = [VALUE_RANGE] * SIGNATURE_SIZE
+    for shingle in shingle_set:
+        # CRC-32 is fast but linear; a multiplicative mix spreads its bits across bins
+        h = (zlib.crc32(shingle.encode("utf-8")) * 0x9E3779B1) & 0xFFFFFFFF
+        index = h >> (32 - BIN_BITS)
+        value = h & (VALUE_RANGE - 1)
+        if value < bins[index]:
+            bins[index] = value
+    filled = [i for i, value in enumerate(bins) if value < VALUE_RANGE]
+    if not filled:
+        return None
+    if len(filled) < SIGNATURE_SIZE:
+        # Densify: an empty bin takes the next filled bin (wrapping), offset by the distance
+        nearest = filled[0] + SIGNATURE_SIZE
+        for i in range(SIGNATURE_SIZE - 1, -1, -1):
+            if bins[i] < VALUE_RANGE:
+                nearest = i
+            else:
+                source = nearest % SIGNATURE_SIZE
+                bins[i] = bins[source] + (nearest - i) * VALUE_RANGE
+    return array("L", bins)
+
+
+def text_signature(text: str) -> Optional[array]:
+    """Return the signature of ``text``, or None if it has no words."""
+    return signature(shingles(text))
+
+
+def similarity(a: Sequence[int], b: Sequence[int]) -> float:
+    """Estimate the Jaccard similarity of two texts from their signatures."""
+    return sum(map(eq, a, b)) / SIGNATURE_SIZE
+
+
+def _find(parent: list, i: int) -> int:
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def cluster(texts: Iterable[str], keys: Optional[Sequence] = None,
+            threshold: float = SIMILARITY_THRESHOLD) -> list:
+    """Cluster near-duplicate texts; return each text's cluster as the index of its first member.
+
+    Texts are only clustered with texts of the same ``keys`` entry when
+    keys are given. Texts with no words are never clustered.
+    """
+    return cluster_signatures([text_signature(text) for text in texts], keys, threshold)
+
+
+def cluster_signatures(signatures: Sequence[Optional[array]], keys: Optional[Sequence] = None,
+                       threshold: float = SIMILARITY_THRESHOLD) -> list:
+    """Cluster texts by their text_signature results; see cluster."""
+    parent = list(range(len(signatures)))
+    buckets = {}
+    for i, sig in enumerate(signatures):
+        if sig is None:
+            continue
+        key = keys[i] if keys is not None else None
+        checked = set()
+        for band in range(BANDS):
+            bucket = (band, key, sig[band * ROWS:(band + 1) * ROWS].tobytes())
+            head = buckets.setdefault(bucket, i)
+            if head == i or head in checked:
+                continue
+            checked.add(head)
+            a, b = _find(parent, head), _find(parent, i)
+            if a != b and similarity(sig, signatures[head]) >= threshold:
+                parent[max(a, b)] = min(a, b)
+    return [_find(parent, i) for i in range(len(parent))]
@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+"""
+Findings Index Script
+
+Maintains a SQLite index of parsed findings in .audit/findings.db, with
+indexed severity/phase/status/OWASP/CWE columns and an FTS5 full-text table
+over title, description, impact and recommendation. The index is updated
+incrementally: only new or changed finding files are reparsed.
+
+Usage:
+    python findings_index.py build /path/to/.audit [options]
+    python findings_index.py query /path/to/.audit [filters]
+
+Query filters:
+    --severity LEVEL   Severity to match (repeatable)
+    --phase N          Phase number
+    --status STATUS    Finding status (e.g. open, resolved)
+    --owasp CODE       OWASP Top 10 category (e.g. A03 or A03:2021)
+    --cwe CWE          CWE identifier (e.g. CWE-89 or 89)
+    --text QUERY       Full-text query (FTS5 syntax)
+    --limit N          Maximum number of results
+    --json             Print results as JSON
+
+Examples:
+    python findings_index.py build /path/to/.audit --jobs 0
+    python findings_index.py query /path/to/.audit --severity high --phase 3 --status open --cwe CWE-89
+    python findings_index.py query /path/to/.audit --text "token AND expiry" --json
+
+Output:
+    Matching findings, one per line or as a JSON array
+"""
+
+import argparse
+import json
+import re
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Optional
+
+from generate_report import (
+    FINDING_FIELDS,
+    PARSER_VERSION,
+    SEVERITY_ORDER,
+    Finding,
+    list_finding_files,
+    normalize_cwe,
+    normalize_owasp,
+    parse_finding_files,
+)
+
+
+INDEX_FILE = "findings.db"
+SCHEMA_VERSION = "3"
+
+TEXT_FIELDS = ["title", "description", "impact", "recommendation"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS findings (
+    rowid INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    size INTEGER,
+    mtime_ns INTEGER,
+    parser_version INTEGER,
+    id TEXT,
+    title TEXT,
+    severity TEXT,
+    severity_rank INTEGER,
+    phase TEXT,
+    phase_num INTEGER,
+    status TEXT,
+    owasp TEXT,
+    owasp_code TEXT,
+    cwe TEXT,
+    cwe_id TEXT,
+    description TEXT,
+    impact TEXT,
+    recommendation TEXT,
+    location TEXT,
+    cvss TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_findings_severity ON findings (severity);
+CREATE INDEX IF NOT EXISTS idx_findings_phase ON findings (phase_num);
+CREATE INDEX IF NOT EXISTS idx_findings_status ON findings (status);
+CREATE INDEX IF NOT EXISTS idx_findings_owasp ON findings (owasp_code);
+CREATE INDEX IF NOT EXISTS idx_findings_cwe ON findings (cwe_id);
+CREATE INDEX IF NOT EXISTS idx_findings_order ON findings (severity_rank, path);
+"""
+
+# External-content FTS5 table kept in sync with `findings` by triggers
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS findings_fts USING fts5(
+    title, description, impact, recommendation,
+    content='findings', content_rowid='rowid'
+);
+CREATE TRIGGER IF NOT EXISTS findings_ai AFTER INSERT ON findings BEGIN
+    INSERT INTO findings_fts (rowid, title, description, impact, recommendation)
+    VALUES (new.rowid, new.title, new.description, new.impact, new.recommendation);
+END;
+CREATE TRIGGER IF NOT EXISTS findings_ad AFTER DELETE ON findings BEGIN
+    INSERT INTO findings_fts (findings_fts, rowid, title, description, impact, recommendation)
+    VALUES ('delete', old.rowid, old.title, old.description, old.impact, old.recommendation);
+END;
+CREATE TRIGGER IF NOT EXISTS findings_au AFTER UPDATE ON findings BEGIN
+    INSERT INTO findings_fts (findings_fts, rowid, title, description, impact, recommendation)
+    VALUES ('delete', old.rowid, old.title, old.description, old.impact, old.recommendation);
+    INSERT INTO findings_fts (rowid, title, description, impact, recommendation)
+    VALUES (new.rowid, new.title, new.description, new.impact, new.recommendation);
+END;
+"""
+
+UPSERT = """
+INSERT INTO findings (
+    path, size, mtime_ns, parser_version, id, title, severity, severity_rank,
+    phase, phase_num, status, owasp, owasp_code, cwe, cwe_id,
+    description, impact, recommendation, location, cvss
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (path) DO UPDATE SET
+    size = excluded.size, mtime_ns = excluded.mtime_ns,
+    parser_version = excluded.parser_version, id = excluded.id,
+    title = excluded.title, severity = excluded.severity,
+    severity_rank = excluded.severity_rank, phase = excluded.phase,
+    phase_num = excluded.phase_num, status = excluded.status,
+    owasp = excluded.owasp, owasp_code = excluded.owasp_code,
+    cwe = excluded.cwe, cwe_id = excluded.cwe_id,
+    description = excluded.description, impact = excluded.impact,
+    recommendation = excluded.recommendation, location = excluded.location,
+    cvss = excluded.cvss
+"""
+
+DROP_SCHEMA = """
+DROP TRIGGER IF EXISTS findings_ai;
+DROP TRIGGER IF EXISTS findings_ad;
+DROP TRIGGER IF EXISTS findings_au;
+DROP TABLE IF EXISTS findings_fts;
+DROP TABLE IF EXISTS findings;
+DROP TABLE IF EXISTS meta;
+"""
+
+
+def parse_phase_number(value: str) -> Optional[int]:
+    """Extract the phase number from a phase label, or None."""
+    match = re.search(r'\d+', value or "")
+    return int(match.group()) if match else None
+
+
+def connect(audit_dir: Path) -> sqlite3.Connection:
+    """Open (creating if needed) the findings index of an audit directory."""
+    conn = sqlite3.connect(str(audit_dir / INDEX_FILE))
+    conn.executescript(SCHEMA)
+    version = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+    if version and version[0] != SCHEMA_VERSION:
+        # Index built by an older layout: drop it and reindex from scratch
+        conn.executescript(DROP_SCHEMA)
+        conn.executescript(SCHEMA)
+    row = conn.execute("SELECT value FROM meta WHERE key = 'fts'").fetchone()
+    if row is None:
+        try:
+            conn.executescript(FTS_SCHEMA)
+            fts = "1"
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5: text queries fall back to LIKE
+            fts = "0"
+        with conn:
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('fts', ?)", (fts,))
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('schema_version', ?)", (SCHEMA_VERSION,))
+    return conn
+
+
+def has_fts(conn: sqlite3.Connection) -> bool:
+    """Return True if the index has an FTS5 table."""
+    row = conn.execute("SELECT value FROM meta WHERE key = 'fts'").fetchone()
+    return bool(row and row[0] == "1")
+
+
+def _finding_row(path: str, size: int, mtime_ns: int, finding: Finding) -> tuple:
+    """Flatten a parsed finding into an UPSERT parameter tuple."""
+    finding = finding.to_dict()  # reads the body sections once
+    return (
+        path, size, mtime_ns, PARSER_VERSION,
+        finding["id"], finding["title"],
+        finding["severity"], SEVERITY_ORDER.get(finding["severity"], 5),
+        finding["phase"], parse_phase_number(finding["phase"]),
+        finding["status"],
+        finding["owasp"], normalize_owasp(finding["owasp"]),
+        finding["cwe"], normalize_cwe(finding["cwe"]),
+        finding["description"], finding["impact"], finding["recommendation"],
+        finding["location"], finding["cvss"],
+    )
+
+
+def update_index(audit_dir: Path, jobs: Optional[int] = None, rebuild: bool = False) -> dict:
+    """Bring the index in line with the findings directory.
+
+    Returns counts of added, updated and removed findings plus the total.
+    """
+    files = list_finding_files(audit_dir)
+    conn = connect(audit_dir)
+    try:
+        if rebuild:
+            with conn:
+                conn.execute("DELETE FROM findings")
+
+        indexed = {
+            row[0]: row[1:]
+            for row in conn.execute("SELECT path, size, mtime_ns, parser_version FROM findings")
+        }
+
+        stale = []
+        for f in files:
+            st = f.stat()
+            if indexed.get(f.name) != (st.st_size, st.st_mtime_ns, PARSER_VERSION):
+                stale.append((f, st))
+
+        parsed = parse_finding_files([f for f, _ in stale], jobs)
+        present = {f.name for f in files}
+        removed = [p for p in indexed if p not in present]
+        # Unreadable or empty files are dropped from the index
+        removed += [f.name for (f, _), finding in zip(stale, parsed) if not finding and f.name in indexed]
+
+        with conn:
+            conn.executemany(UPSERT, [
+                _finding_row(f.name, st.st_size, st.st_mtime_ns, finding)
+                for (f, st), finding in zip(stale, parsed) if finding
+            ])
+            conn.executemany("DELETE FROM findings WHERE path = ?", [(p,) for p in removed])
+
+        total = conn.execute("SELECT COUNT(*) FROM findings").fetchone()[0]
+    finally:
+        conn.close()
+
+    added = sum(1 for (f, _), finding in zip(stale, parsed) if finding and f.name not in indexed)
+    updated = sum(1 for (f, _), finding in zip(stale, parsed) if finding and f.name in indexed)
+    return {"added": added, "updated": updated, "removed": len(removed), "total": total}
+
+
+def query_index(
+    audit_dir: Path,
+    severity: Optional[list] = None,
+    phase: Optional[int] = None,
+    status: Optional[str] = None,
+    owasp: Optional[str] = None,
+    cwe: Optional[str] = None,
+    text: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> list:
+    """Return findings matching every given filter, most severe first."""
+    conn = connect(audit_dir)
+    try:
+        clauses = []
+        params = []
+
+        if severity:
+            levels = {s.lower() for s in severity}
+            if levels & {"info", "informational"}:
+                levels |= {"info", "informational"}
+            clauses.append(f"severity IN ({', '.join('?' * len(levels))})")
+            params.extend(sorted(levels))
+        if phase is not None:
+            clauses.append("phase_num = ?")
+            params.append(phase)
+        if status:
+            clauses.append("status = ?")
+            params.append(status.lower())
+        if owasp:
+            clauses.append("owasp_code = ?")
+            params.append(normalize_owasp(owasp))
+        if cwe:
+            clauses.append("cwe_id = ?")
+            params.append(normalize_cwe(cwe))
+        if text:
+            if has_fts(conn):
+                clauses.append("rowid IN (SELECT rowid FROM findings_fts WHERE findings_fts MATCH ?)")
+                params.append(text)
+            else:
+                clauses.append("(" + " OR ".join(f"{f} LIKE ?" for f in TEXT_FIELDS) + ")")
+                params.extend([f"%{text}%"] * len(TEXT_FIELDS))
+
+        sql = (
+            "SELECT path, id, title, severity, phase, status, owasp, cwe, "
+            "description, impact, recommendation, location, cvss FROM findings"
+        )
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY severity_rank, path"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        return [dict(zip(FINDING_FIELDS, row)) for row in conn.execute(sql, params)]
+    finally:
+        conn.close()
+
+
+def format_results(findings: list) -> str:
+    """Format query results as one line per finding, phases shown as "Phase N"."""
+    lines = []
+    for f in findings:
+        number = parse_phase_number(f["phase"])
+        phase = f"Phase {number}" if number is not None else f["phase"]
+        lines.append(f"{f['id']}\t{f['severity']}\t{phase}\t{f['status']}\t{f['title']}")
+    lines.append(f"{len(findings)} finding(s)")
+    return "\n".join(lines)
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Build and query the SQLite index of audit findings.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s build /path/to/.audit                          Update the index
+  %(prog)s query /path/to/.audit --severity high --phase 3
+  %(prog)s query /path/to/.audit --cwe 89 --status open --json
+  %(prog)s query /path/to/.audit --text "jwt NOT refresh"
+        """
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build = subparsers.add_parser("build", help="Create or incrementally update the index")
+    build.add_argument("audit_dir", type=Path, help="Path to the .audit directory")
+    build.add_argument("--jobs", "-j", type=int, default=None, metavar="N",
+                       help="Parse changed findings on N worker processes (0 = one per CPU)")
+    build.add_argument("--rebuild", action="store_true",
+                       help="Drop all indexed findings and reindex from scratch")
+
+    query = subparsers.add_parser("query", help="Query indexed findings")
+    query.add_argument("audit_dir", type=Path, help="Path to the .audit directory")
+    query.add_argument("--severity", "-s", action="append", help="Severity level (repeatable)")
+    query.add_argument("--phase", "-p", type=int, help="Phase number")
+    query.add_argument("--status", help="Finding status (e.g. open)")
+    query.add_argument("--owasp", help="OWASP Top 10 category (e.g. A03)")
+    query.add_argument("--cwe", help="CWE identifier (e.g. CWE-89)")
+    query.add_argument("--text", "-t", help="Full-text query over title, description, impact and recommendation")
+    query.add_argument("--limit", "-n", type=int, help="Maximum number of results")
+    query.add_argument("--json", action="store_true", help="Print results as JSON")
+    query.add_argument("--no-update", action="store_true",
+                       help="Query the index as-is without syncing changed findings first")
+
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    audit_dir = args.audit_dir.resolve()
+
+    if not audit_dir.exists():
+        print(f"Error: Audit directory does not exist: {audit_dir}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.command == "build":
+        stats = update_index(audit_dir, args.jobs, args.rebuild)
+        print(f"Indexed: {audit_dir / INDEX_FILE} "
+              f"({stats['total']} findings; {stats['added']} added, "
+              f"{stats['updated']} updated, {stats['removed']} removed)")
+        return
+
+    if not args.no_update:
+        update_index(audit_dir)
+
+    try:
+        findings = query_index(
+            audit_dir,
+            severity=args.severity,
+            phase=args.phase,
+            status=args.status,
+            owasp=args.owasp,
+            cwe=args.cwe,
+            text=args.text,
+            limit=args.limit,
+        )
+    except sqlite3.OperationalError as e:
+        print(f"Error: Invalid query: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.json:
+        print(json.dumps(findings, indent=2, ensure_ascii=False))
+    else:
+        print(format_results(findings))
+
+
+if __name__ == "__main__":
+    main()
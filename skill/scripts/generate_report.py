@@ -9,32 +9,87 @@ Usage:
     python generate_report.py /path/to/.audit [options]
 
 Options:
-    --format FORMAT    Output format: markdown (default), json, csv, all
+    --format FORMAT    Output format: markdown (default), json, csv, jsonl, html,
+                       columnar, sarif, all (all = markdown, json and csv)
     --output FILE      Output file path (default: auto-generated in .audit dir)
     --stdout           Print to stdout instead of file
     --summary-only     Generate executive summary only (faster)
+    --jobs N           Parse findings on N workers (0 = one per CPU)
+    --stream           Constant-memory CSV / JSONL / SARIF / summary output (add --sorted to sort CSV)
+    --diff BASELINE    Delta report against a previous final-report.json or .audit dir
+    --no-cache         Ignore the parsed-findings cache in .audit/.cache/
+    --template FILE    Render the markdown report through a template
+    --dedupe           List near-duplicate finding clusters in the markdown / JSON report
+    --collapse-duplicates  Also count only each cluster's representative
+    --compress CODEC   Also write a gzip (.gz) or zstd (.zst) copy of the JSON / JSONL output
+    --profile          Print per-stage time, bytes and peak memory to stderr
+    --profile-json F   Also write the profile trace as JSON to F
 
 Examples:
     python generate_report.py /path/to/.audit
     python generate_report.py /path/to/.audit --format json
     python generate_report.py /path/to/.audit --format csv --output findings.csv
     python generate_report.py /path/to/.audit --format all
+    python generate_report.py /path/to/.audit --format all --jobs 0
+    python generate_report.py /path/to/.audit --format csv --stream --sorted
+    python generate_report.py /path/to/.audit --format jsonl --stream
+    python generate_report.py /path/to/.audit --format html
+    python generate_report.py /path/to/.audit --format columnar
+    python generate_report.py /path/to/.audit --format sarif --stream
+    python generate_report.py /path/to/.audit --template my-report.md.tmpl
+    python generate_report.py /path/to/.audit --format all --collapse-duplicates
+    python generate_report.py /path/to/.audit --diff old/final-report.json --format all
+    python generate_report.py /path/to/.audit --format all --profile-json profile.json
+    python generate_report.py /path/to/.audit --format all --compress gzip
 
 Output:
-    Writes report files to the .audit directory
+    Writes report files to the .audit directory (--format html also writes
+    its finding data under report-data/). Each file is written to a
+    temporary name and renamed into place, and --format all writes them
+    concurrently.
 """
 
 import argparse
 import csv
+import gzip
+import hashlib
+import heapq
 import io
 import json
+import mmap
 import os
 import re
+import shutil
+import sqlite3
 import sys
+import tempfile
+import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext, suppress
 from datetime import datetime
+from functools import partial
+from itertools import chain, islice
 from pathlib import Path
 from collections import defaultdict
-from typing import Optional
+from typing import BinaryIO, Optional, TextIO
+
+import columnar
+import dedupe
+from compliance_index import load_compliance_index, lookup_controls
+from profiling import Profiler
+from templating import TemplateError, load_template
+from cvss import (
+    SEVERITY_BANDS as CVSS_SEVERITY_BANDS,
+    VECTOR_PATTERN,
+    percentile,
+    score_vectors,
+    severity_rating,
+)
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - exercised when zstandard is absent
+    zstandard = None
 
 
 SEVERITY_ORDER = {
@@ -55,6 +110,120 @@ SEVERITY_EMOJI = {
     "informational": "⚪",
 }
 
+FINDING_FIELDS = (
+    "file", "id", "title", "severity", "phase", "status",
+    "owasp", "cwe", "description", "impact", "recommendation", "location", "cvss",
+)
+
+# Body sections, read from the finding file only when a renderer asks for them
+BODY_FIELDS = ("description", "impact", "recommendation")
+HEADER_FIELDS = tuple(f for f in FINDING_FIELDS if f not in BODY_FIELDS)
+
+DESCRIPTION_PATTERN = re.compile(r'##\s*Description\s*\n(.*?)(?=\n##|\Z)', re.DOTALL | re.IGNORECASE)
+
+# Affected file, from "**Location:** `f:1`", "- **File(s):** `f:1`" or a Location/File table row
+LOCATION_PATTERNS = [
+    re.compile(r'\*\*(?:Location|Files?|File\(s\)|Affected Files?)\s*:?\*\*\s*:?[ \t]*`?([^`\s|,][^`\n|,]*)', re.IGNORECASE),
+    re.compile(r'\|\s*\*?\*?(?:Location|Files?|File\(s\)|Affected Files?)\*?\*?\s*\|\s*`?([^`\s|][^`|\n]*)', re.IGNORECASE),
+]
+
+# Remediation roadmap tiers, in display order, and the severities that feed them
+REMEDIATION_TIERS = ["immediate", "short_term", "medium_term", "backlog"]
+REMEDIATION_TIER_BY_SEVERITY = {
+    "critical": "immediate",
+    "high": "short_term",
+    "medium": "medium_term",
+    "low": "backlog",
+    "info": "backlog",
+    "informational": "backlog",
+}
+
+# Below this many finding files, worker start-up costs more than it saves
+PARALLEL_THRESHOLD = 64
+
+# Finding files at least this large are memory-mapped when their body is read
+MMAP_THRESHOLD = 1 << 20
+
+# Upper bound on how much of a finding header-only parsing will read
+HEADER_READ_LIMIT = 16 * 1024
+
+# Number of critical/high findings listed under "Key Concerns"
+KEY_CONCERNS_LIMIT = 3
+
+# Rows held in memory per run when --stream --sorted sorts CSV output on disk
+SORT_RUN_SIZE = 10000
+
+# Bump whenever parse_finding output changes so cached entries are reparsed
+PARSER_VERSION = 4
+CACHE_DIR = ".cache"
+CACHE_FILE = "findings.sqlite"
+
+OUTPUT_FILES = {
+    "markdown": "final-report.md",
+    "json": "final-report.json",
+    "csv": "findings.csv",
+    "jsonl": "findings.jsonl",
+    "html": "final-report.html",
+    "sarif": "findings.sarif",
+}
+
+# Formats written by --format all
+ALL_FORMATS = ["markdown", "json", "csv"]
+
+DELTA_OUTPUT_FILES = {
+    "markdown": "delta-report.md",
+    "json": "delta-report.json",
+}
+
+RESOLVED_STATUSES = {"resolved", "fixed"}
+
+# Functions timed by --profile, by stage; nested calls count toward the outermost stage
+PROFILE_STAGES = {
+    "context": ["load_audit_context"],
+    "discover": ["list_finding_files"],
+    "read": ["read_file", "read_finding_file", "read_finding_header"],
+    "extract": ["_header_fields", "extract_field", "extract_location"],
+    "body": ["body_spans", "load_body"],
+    "cvss": ["summarize_cvss", "score_findings"],
+    "compliance": ["control_coverage"],
+    "dedupe": ["cluster_duplicates"],
+}
+
+# Renderers write through a large buffer instead of building whole strings
+WRITE_BUFFER_SIZE = 1 << 20
+
+# SARIF results are held in memory up to this many characters, then spooled to disk
+SARIF_SPOOL_SIZE = 16 << 20
+
+# Default layout for --template, reproducing the built-in markdown report
+REPORT_TEMPLATE = Path(__file__).resolve().parents[1] / "templates" / "final-report.md.tmpl"
+
+# --format html: shell page template, data directory beside it, findings per shard
+HTML_TEMPLATE = Path(__file__).resolve().parents[1] / "templates" / "report.html"
+HTML_DATA_DIR = "report-data"
+HTML_SHARD_SIZE = 500
+HTML_COLUMNS = (
+    "id", "title", "severity", "phase", "status", "owasp", "cwe", "location", "cvss",
+    "description", "impact", "recommendation", "file",
+)
+
+# --compress codecs and the suffix added to the compressed JSON report
+COMPRESSION_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+SARIF_LEVELS = {
+    "critical": "error",
+    "high": "error",
+    "medium": "warning",
+    "low": "note",
+    "info": "note",
+    "informational": "note",
+}
+ACCEPTED_STATUSES = {"accepted risk", "accepted-risk"}
+
+# "path", "path:12" or "path:12-20"; only the first of several comma-separated files is used
+SARIF_LOCATION_PATTERN = re.compile(r'^\s*([^,]+?)(?::(\d+)(?:-(\d+))?)?\s*(?:,|$)')
+
 
 def read_file(path: Path) -> str:
     """Read file content."""
@@ -64,8 +233,28 @@ def read_file(path: Path) -> str:
         return ""
 
 
-def extract_field(content: str, field: str) -> str:
-    """Extract a field value from markdown content."""
+def read_finding_file(path: Path) -> tuple:
+    """Read a finding without newline translation, with the stat of what was read.
+
+    Returns ``(content, stat)``, or ``("", None)`` if the file cannot be
+    read. Offsets into ``content`` map directly onto the bytes on disk.
+    """
+    try:
+        with open(path, "rb") as fh:
+            data = fh.read()
+            st = os.fstat(fh.fileno())
+        return data.decode("utf-8"), st
+    except Exception:
+        return "", None
+
+
+def _universal_newlines(content: str) -> str:
+    """Translate line endings the way text-mode reads (read_file) do."""
+    return content.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _field_match(content: str, field: str):
+    """Return the regex match holding a field value, or None."""
     patterns = [
         rf'\|\s*\*?\*?{field}\*?\*?\s*\|\s*([^|]+)\s*\|',
         rf'(?:##\s*{field}|^\*\*{field}\*?\*?:?)\s*[:\-]?\s*(.+?)(?:\n|$)',
@@ -75,18 +264,234 @@ def extract_field(content: str, field: str) -> str:
     for pattern in patterns:
         match = re.search(pattern, content, re.IGNORECASE | re.MULTILINE)
         if match:
-            return match.group(1).strip()
+            return match
 
-    return ""
+    return None
 
 
-def parse_finding(path: Path) -> dict:
-    """Parse a finding file into a structured dict."""
-    content = read_file(path)
-    if not content:
-        return None
+def extract_field(content: str, field: str) -> str:
+    """Extract a field value from markdown content."""
+    match = _field_match(content, field)
+    return match.group(1).strip() if match else ""
+
+
+def _stripped_span(match) -> tuple:
+    """Character span of a match's first group with surrounding whitespace removed."""
+    if not match:
+        return (0, 0)
+    text = match.group(1)
+    stripped = text.strip()
+    if not stripped:
+        return (0, 0)
+    start = match.start(1) + len(text) - len(text.lstrip())
+    return (start, start + len(stripped))
+
+
+def body_spans(content: str) -> tuple:
+    """Return the character spans of the body sections, one (start, end) per BODY_FIELDS."""
+    return (
+        _stripped_span(DESCRIPTION_PATTERN.search(content)),
+        _stripped_span(_field_match(content, "impact")),
+        _stripped_span(_field_match(content, "recommendation")),
+    )
+
+
+def extract_body(content: str) -> tuple:
+    """Extract the body sections of a finding as text, in BODY_FIELDS order."""
+    return tuple(content[start:end] for start, end in body_spans(content))
+
+
+class BodyRef:
+    """Where a finding's body sections live: byte spans into its file.
 
-    finding = {
+    ``size`` and ``mtime_ns`` identify the file version the spans were
+    taken from; load_body reparses the file if it has changed since.
+    """
+
+    __slots__ = ("path", "size", "mtime_ns", "spans")
+
+    def __init__(self, path: str, size: int, mtime_ns: int, spans: tuple):
+        self.path = path
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.spans = spans
+
+    @classmethod
+    def from_content(cls, path: Path, st, content: str) -> "BodyRef":
+        """Locate the body sections of ``content``, the text of ``path`` as of ``st``."""
+        spans = body_spans(content)
+        if not content.isascii():
+            # Character offsets to byte offsets
+            spans = tuple((len(content[:start].encode("utf-8")), len(content[:end].encode("utf-8")))
+                          for start, end in spans)
+        return cls(str(path), st.st_size, st.st_mtime_ns, spans)
+
+
+# Positional reads save a seek per body read; Windows has no os.pread
+HAS_PREAD = hasattr(os, "pread")
+
+# Body sections already read in the current cached_bodies() block, keyed by BodyRef
+_body_cache = None
+
+
+@contextmanager
+def cached_bodies():
+    """Read each finding's body sections at most once until the block exits.
+
+    A report reads the description, impact and recommendation of a finding
+    in different sections and writers; inside this block they share one
+    read per file. Blocks nest, with the outermost one owning the cache.
+    """
+    global _body_cache
+    if _body_cache is not None:
+        yield
+        return
+    _body_cache = {}
+    try:
+        yield
+    finally:
+        _body_cache = None
+
+
+def load_body(ref: BodyRef) -> tuple:
+    """Read the body sections ``ref`` points at, in BODY_FIELDS order.
+
+    Only the byte range covering the sections is read; files of at least
+    MMAP_THRESHOLD bytes are memory-mapped instead. A file that changed
+    since it was parsed is reparsed, and an unreadable one yields empty text.
+    """
+    try:
+        # Raw descriptor reads: one open, fstat and read per call, with no buffering layer
+        fd = os.open(ref.path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    except OSError:
+        return ("", "", "")
+    try:
+        st = os.fstat(fd)
+        if (st.st_size, st.st_mtime_ns) != (ref.size, ref.mtime_ns):
+            with open(fd, "rb", closefd=False) as fh:
+                return extract_body(_universal_newlines(fh.read().decode("utf-8")))
+        used = [span for span in ref.spans if span[1] > span[0]]
+        if not used:
+            return ("", "", "")
+        if st.st_size >= MMAP_THRESHOLD:
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                return tuple(mm[start:end].decode("utf-8") for start, end in ref.spans)
+        low = min(used)[0]
+        length = max([end for _, end in used]) - low
+        if HAS_PREAD:
+            data = os.pread(fd, length, low)
+        else:
+            os.lseek(fd, low, os.SEEK_SET)
+            data = os.read(fd, length)
+        return tuple([data[start - low:end - low].decode("utf-8") if end > start else ""
+                      for start, end in ref.spans])
+    except (OSError, ValueError):
+        return ("", "", "")
+    finally:
+        os.close(fd)
+
+
+class Finding:
+    """A parsed finding.
+
+    Uses __slots__ instead of a per-instance dict, and interns the low-
+    cardinality severity, status and phase values so large audits share one
+    string object per distinct value. Supports read-only mapping access
+    (``finding["id"]``, ``finding.get("cwe")``) so it can be used wherever a
+    finding dict is expected; ``to_dict`` is only called when serialising.
+
+    The body sections (description, impact, recommendation) are either held
+    as text or, for parsed files, as a BodyRef that is read on each access
+    and not kept, except inside a cached_bodies() block; use ``body()`` or
+    ``to_dict()`` to read all three at once.
+    """
+
+    __slots__ = HEADER_FIELDS + ("_body",)
+
+    def __init__(self, file: str, id: str, title: str, severity: str, phase: str, status: str,
+                 owasp: str = "", cwe: str = "", description: str = "", impact: str = "",
+                 recommendation: str = "", location: str = "", cvss: str = "",
+                 body: Optional[BodyRef] = None):
+        self.file = file
+        self.id = id
+        self.title = title
+        self.severity = sys.intern(severity)
+        self.phase = sys.intern(phase)
+        self.status = sys.intern(status)
+        self.owasp = owasp
+        self.cwe = cwe
+        self.location = location
+        self.cvss = cvss
+        self._body = body or (description, impact, recommendation)
+
+    def body(self) -> tuple:
+        """Return the body sections in BODY_FIELDS order, reading them if needed."""
+        body = self._body
+        if not isinstance(body, BodyRef):
+            return body
+        cache = _body_cache
+        if cache is None:
+            return load_body(body)
+        sections = cache.get(body)
+        if sections is None:
+            sections = cache[body] = load_body(body)
+        return sections
+
+    description = property(lambda self: self.body()[0], doc="Full Description section.")
+    impact = property(lambda self: self.body()[1], doc="Impact field or section.")
+    recommendation = property(lambda self: self.body()[2], doc="Recommendation field or section.")
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Finding":
+        """Build a Finding from a dict with FINDING_FIELDS keys."""
+        return cls(**{field: data.get(field, "") for field in FINDING_FIELDS})
+
+    def to_dict(self) -> dict:
+        """Return the finding as a plain dict (for JSON and the cache)."""
+        body = dict(zip(BODY_FIELDS, self.body()))
+        return {field: body[field] if field in body else getattr(self, field) for field in FINDING_FIELDS}
+
+    def cache_record(self) -> dict:
+        """Return the finding for FindingsCache: body spans instead of text when file-backed."""
+        record = {field: getattr(self, field) for field in HEADER_FIELDS}
+        if isinstance(self._body, BodyRef):
+            record["spans"] = self._body.spans
+        else:
+            record.update(zip(BODY_FIELDS, self._body))
+        return record
+
+    @classmethod
+    def from_cache_record(cls, data: dict, path: Path, st) -> "Finding":
+        """Rebuild a cache_record for ``path``, whose current stat is ``st``."""
+        finding = cls.from_dict(data)
+        if "spans" in data:
+            finding._body = BodyRef(str(path), st.st_size, st.st_mtime_ns,
+                                    tuple(tuple(span) for span in data["spans"]))
+        return finding
+
+    def __getitem__(self, key: str) -> str:
+        if key not in FINDING_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default=None):
+        return getattr(self, key) if key in FINDING_FIELDS else default
+
+    def keys(self) -> tuple:
+        return FINDING_FIELDS
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Finding):
+            return self.to_dict() == other.to_dict()
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"Finding(id={self.id!r}, severity={self.severity!r}, file={self.file!r})"
+
+
+def _header_fields(path: Path, content: str) -> dict:
+    """Extract the metadata fields shared by full and header-only parsing."""
+    return {
         "file": path.name,
         "id": extract_field(content, "id") or path.stem,
         "title": extract_field(content, "title") or "Untitled Finding",
@@ -95,34 +500,223 @@ def parse_finding(path: Path) -> dict:
         "status": extract_field(content, "status").lower() or "open",
         "owasp": extract_field(content, "owasp") or "",
         "cwe": extract_field(content, "cwe") or "",
-        "description": "",
-        "impact": extract_field(content, "impact") or "",
-        "recommendation": extract_field(content, "recommendation") or "",
+        "cvss": extract_cvss(content),
     }
 
-    # Try to extract description section
-    desc_match = re.search(r'##\s*Description\s*\n(.*?)(?=\n##|\Z)', content, re.DOTALL | re.IGNORECASE)
-    if desc_match:
-        finding["description"] = desc_match.group(1).strip()[:500]  # Limit length
 
-    return finding
+def extract_cvss(content: str) -> str:
+    """Extract the CVSS score and/or vector of a finding, e.g. ``"9.8 (CVSS:3.1/...)"``."""
+    value = extract_field(content, "cvss score") or extract_field(content, "cvss vector")
+    match = VECTOR_PATTERN.search(content)
+    if match and match.group(0) not in value:
+        value = f"{value} ({match.group(0)})" if value else match.group(0)
+    return value
+
 
+def parse_finding(path: Path) -> Optional[Finding]:
+    """Parse a finding file into a Finding record.
+
+    The body sections are recorded as a BodyRef rather than read into
+    memory. Files with CR line endings, whose text offsets do not map onto
+    the bytes on disk, keep their body as text instead.
+    """
+    content, st = read_finding_file(path)
+    if not content:
+        return None
+
+    if "\r" in content:
+        content = _universal_newlines(content)
+        description, impact, recommendation = extract_body(content)
+        body = None
+    else:
+        description = impact = recommendation = ""
+        body = BodyRef.from_content(path, st, content)
+
+    return Finding(
+        **_header_fields(path, content),
+        description=description,
+        impact=impact,
+        recommendation=recommendation,
+        location=extract_location(content),
+        body=body,
+    )
+
+
+def extract_location(content: str) -> str:
+    """Extract the affected file (``path:line``) of a finding, if documented."""
+    for pattern in LOCATION_PATTERNS:
+        match = pattern.search(content)
+        if match:
+            return match.group(1).strip()
+    return ""
 
-def load_findings(audit_dir: Path) -> list:
-    """Load all findings from the findings directory."""
+
+def read_finding_header(path: Path) -> str:
+    """Read a finding only up to the first ``##`` section after its metadata table.
+
+    Reads are capped at HEADER_READ_LIMIT characters, so files without a
+    table cost no more than a bounded prefix.
+    """
+    lines = []
+    size = 0
+    seen_table = False
+    try:
+        with open(path, encoding='utf-8') as fh:
+            for line in fh:
+                if seen_table and line.startswith("##"):
+                    break
+                if line.lstrip().startswith("|"):
+                    seen_table = True
+                lines.append(line)
+                size += len(line)
+                if size >= HEADER_READ_LIMIT:
+                    break
+    except Exception:
+        return ""
+    return "".join(lines)
+
+
+def parse_finding_header(path: Path) -> Optional[Finding]:
+    """Parse only the metadata header of a finding; body fields are left empty."""
+    content = read_finding_header(path)
+    if not content:
+        return None
+    return Finding(**_header_fields(path, content))
+
+
+def _resolve_jobs(jobs: Optional[int]) -> int:
+    """Translate a --jobs value into a worker count (0 means one per CPU)."""
+    if jobs is None:
+        return 1
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def list_finding_files(audit_dir: Path) -> list:
+    """Return the finding files of an audit directory in filename order."""
     findings_dir = audit_dir / "findings"
     if not findings_dir.exists():
         return []
+    return sorted(f for f in findings_dir.glob("*.md") if not f.name.startswith("."))
+
+
+def parse_finding_files(files: list, jobs: Optional[int] = None, pool: str = "process",
+                        parser=None) -> list:
+    """Parse finding files, in input order, serially or on a worker pool.
+
+    ``parser`` defaults to parse_finding; pass parse_finding_header to read
+    metadata only.
+    """
+    parser = parser or parse_finding
+    workers = min(_resolve_jobs(jobs), len(files))
+    if workers <= 1 or len(files) < PARALLEL_THRESHOLD:
+        return [parser(f) for f in files]
+
+    executor_cls = ThreadPoolExecutor if pool == "thread" else ProcessPoolExecutor
+    chunksize = max(1, len(files) // (workers * 4))
+    with executor_cls(max_workers=workers) as executor:
+        # Executor.map yields results in submission order, keeping output stable
+        return list(executor.map(parser, files, chunksize=chunksize))
+
+
+class FindingsCache:
+    """Parsed-finding cache stored in ``.audit/.cache/findings.sqlite``.
+
+    Entries are keyed by file name and are only reused when the file's size,
+    mtime and the PARSER_VERSION they were produced with all still match.
+    Body sections are stored as byte spans, not text (see Finding.cache_record).
+    """
+
+    def __init__(self, audit_dir: Path):
+        self.path = audit_dir / CACHE_DIR / CACHE_FILE
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS findings ("
+            "path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, "
+            "parser_version INTEGER, data TEXT)"
+        )
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def entries(self) -> dict:
+        """Return {path: (size, mtime_ns, parser_version, data)} for every row."""
+        rows = self.conn.execute("SELECT path, size, mtime_ns, parser_version, data FROM findings")
+        return {row[0]: row[1:] for row in rows}
+
+    def sync(self, updated: list, removed: list) -> None:
+        """Store (path, size, mtime_ns, finding) tuples and drop removed paths."""
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO findings VALUES (?, ?, ?, ?, ?)",
+                [(p, size, mtime, PARSER_VERSION,
+                  json.dumps(finding.cache_record() if finding else None, ensure_ascii=False))
+                 for p, size, mtime, finding in updated],
+            )
+            self.conn.executemany("DELETE FROM findings WHERE path = ?", [(p,) for p in removed])
+
+
+def _load_with_cache(audit_dir: Path, files: list, jobs: Optional[int], pool: str) -> list:
+    """Parse only new or changed files, reusing cached results for the rest."""
+    stats = [f.stat() for f in files]
+    with FindingsCache(audit_dir) as cache:
+        cached = cache.entries()
+
+        results = [None] * len(files)
+        stale = []
+        for i, (f, st) in enumerate(zip(files, stats)):
+            entry = cached.get(f.name)
+            if entry and entry[:3] == (st.st_size, st.st_mtime_ns, PARSER_VERSION):
+                data = json.loads(entry[3])
+                results[i] = Finding.from_cache_record(data, f, st) if data else None
+            else:
+                stale.append(i)
 
-    findings = []
-    for f in findings_dir.glob("*.md"):
-        if f.name.startswith("."):
-            continue
-        finding = parse_finding(f)
-        if finding:
-            findings.append(finding)
+        parsed = parse_finding_files([files[i] for i in stale], jobs, pool)
+        for i, finding in zip(stale, parsed):
+            results[i] = finding
+
+        present = {f.name for f in files}
+        cache.sync(
+            [(files[i].name, stats[i].st_size, stats[i].st_mtime_ns, results[i]) for i in stale],
+            [p for p in cached if p not in present],
+        )
+
+    return results
+
+
+def load_findings(audit_dir: Path, jobs: Optional[int] = None, pool: str = "process",
+                  cache: bool = False) -> list:
+    """Load all findings from the findings directory.
 
-    # Sort by severity
+    Files are parsed in filename order so the result is deterministic; pass
+    ``jobs`` to parse on a process (or ``pool="thread"``) pool. Directories
+    smaller than PARALLEL_THRESHOLD are always parsed serially. With
+    ``cache=True`` unchanged files are served from FindingsCache.
+    """
+    files = list_finding_files(audit_dir)
+    if not files:
+        return []
+
+    parsed = None
+    if cache:
+        try:
+            parsed = _load_with_cache(audit_dir, files, jobs, pool)
+        except (sqlite3.Error, OSError, ValueError) as e:
+            print(f"Warning: findings cache unavailable ({e}), parsing all files", file=sys.stderr)
+    if parsed is None:
+        parsed = parse_finding_files(files, jobs, pool)
+    findings = [f for f in parsed if f]
+
+    # Sort by severity (stable, so filename order is kept within a severity)
     findings.sort(key=lambda x: SEVERITY_ORDER.get(x["severity"], 5))
 
     return findings
@@ -144,6 +738,114 @@ def load_audit_context(audit_dir: Path) -> dict:
     }
 
 
+def phase_key(phase: str) -> str:
+    """Normalise a phase label to 'Phase N' by its number, or return it as-is."""
+    phase_match = re.search(r'(\d+)', phase)
+    if phase_match:
+        return f"Phase {int(phase_match.group(1))}"
+    return phase
+
+
+def normalize_cwe(value: str) -> str:
+    """Normalize 'CWE-89: SQL Injection', 'cwe 89' or '89' to 'CWE-89'."""
+    match = re.search(r'(?:CWE[-\s]*)?(\d+)', value or "", re.IGNORECASE)
+    return f"CWE-{int(match.group(1))}" if match else ""
+
+
+def normalize_owasp(value: str) -> str:
+    """Normalize 'A03:2021 - Injection' or 'a3' to 'A03'."""
+    match = re.search(r'A(10|0?[1-9])(?!\d)', value or "", re.IGNORECASE)
+    return f"A{int(match.group(1)):02d}" if match else ""
+
+
+def _phase_sort_key(key: str) -> int:
+    """Order 'Phase N' keys numerically, with unnumbered phases last."""
+    phase_match = re.search(r'\d+', key)
+    return int(phase_match.group()) if phase_match else 99
+
+
+class FindingGroups:
+    """Severity, phase, status, OWASP, CWE and remediation buckets for a list of findings.
+
+    All buckets are built together in a single pass so renderers never rescan
+    the full findings list. Buckets hold indexes into ``findings`` (in input
+    order) rather than the findings themselves; use ``select`` and ``ids`` to
+    resolve them.
+    """
+
+    def __init__(self, findings: list):
+        self.findings = findings
+        self.by_severity = defaultdict(list)
+        self.by_phase = defaultdict(list)
+        self.by_status = defaultdict(list)
+        self.by_owasp = defaultdict(list)
+        self.by_cwe = defaultdict(list)
+        self.remediation = {tier: [] for tier in REMEDIATION_TIERS}
+        self._controls = None
+
+        phase_keys = {}
+        for i, f in enumerate(findings):
+            self.by_severity[f["severity"]].append(i)
+            phase = f["phase"]
+            if phase not in phase_keys:
+                phase_keys[phase] = phase_key(phase)
+            self.by_phase[phase_keys[phase]].append(i)
+            self.by_status[f["status"]].append(i)
+            if f["owasp"]:
+                self.by_owasp[f["owasp"]].append(i)
+            if f["cwe"]:
+                self.by_cwe[f["cwe"]].append(i)
+            if f["status"] == "open":
+                tier = REMEDIATION_TIER_BY_SEVERITY.get(f["severity"])
+                if tier:
+                    self.remediation[tier].append(i)
+
+    def select(self, indexes: list) -> list:
+        """Resolve a bucket of indexes to findings."""
+        return [self.findings[i] for i in indexes]
+
+    def ids(self, indexes: list) -> list:
+        """Resolve a bucket of indexes to finding IDs."""
+        return [self.findings[i]["id"] for i in indexes]
+
+    def severity_counts(self) -> dict:
+        """Count findings by severity."""
+        return {k: len(v) for k, v in self.by_severity.items()}
+
+    def phase_counts(self) -> dict:
+        """Count findings by phase."""
+        return {k: len(v) for k, v in self.by_phase.items()}
+
+    def status_counts(self) -> dict:
+        """Count findings by status."""
+        return {k: len(v) for k, v in self.by_status.items()}
+
+    def phases(self) -> list:
+        """Return phase keys in numeric order."""
+        return sorted(self.by_phase, key=_phase_sort_key)
+
+    def controls(self) -> dict:
+        """Bucket findings by compliance control: ``(framework, control) -> indexes``.
+
+        Built on first use from the compiled compliance index, resolving each
+        distinct (phase, OWASP) pair once; empty if the mapping is unavailable.
+        """
+        if self._controls is None:
+            self._controls = defaultdict(list)
+            index = load_compliance_index()
+            if index:
+                resolved = {}
+                for i, f in enumerate(self.findings):
+                    key = (f["phase"], f["owasp"])
+                    if key not in resolved:
+                        phase_match = re.search(r'\d+', f["phase"])
+                        resolved[key] = [tuple(c) for c in lookup_controls(
+                            index, int(phase_match.group()) if phase_match else None, normalize_owasp(f["owasp"]))]
+                    for control in resolved[key]:
+                        self._controls[control].append(i)
+        return self._controls
+
+
 def count_by_severity(findings: list) -> dict:
     """Count findings by severity."""
     counts = defaultdict(int)
@@ -156,12 +858,7 @@ def count_by_phase(findings: list) -> dict:
     """Count findings by phase."""
     counts = defaultdict(int)
     for f in findings:
-        # Extract phase number
-        phase_match = re.search(r'(\d+)', f["phase"])
-        if phase_match:
-            counts[f"Phase {phase_match.group(1)}"] += 1
-        else:
-            counts[f["phase"]] += 1
+        counts[phase_key(f["phase"])] += 1
     return dict(counts)
 
 
@@ -173,22 +870,117 @@ def count_by_status(findings: list) -> dict:
     return dict(counts)
 
 
-def generate_executive_summary(findings: list, context: dict) -> str:
-    """Generate executive summary section."""
-    by_severity = count_by_severity(findings)
-
+def assess_risk_level(by_severity: dict) -> str:
+    """Derive the overall risk level from severity counts."""
     critical_count = by_severity.get("critical", 0)
     high_count = by_severity.get("high", 0)
 
-    risk_level = "Low"
     if critical_count > 0:
-        risk_level = "Critical"
-    elif high_count > 2:
-        risk_level = "High"
-    elif high_count > 0:
-        risk_level = "Medium"
+        return "Critical"
+    if high_count > 2:
+        return "High"
+    if high_count > 0:
+        return "Medium"
+    return "Low"
+
+
+def _explicit_cvss(value: str) -> Optional[float]:
+    """Return a numeric CVSS score written in the finding, if any."""
+    match = re.match(r'\s*(\d{1,2}(?:\.\d)?)\b', value)
+    if match and 0.0 <= float(match.group(1)) <= 10.0:
+        return float(match.group(1))
+    return None
+
+
+def score_findings(findings: list) -> list:
+    """Score every finding's CVSS data in one batch.
+
+    Returns a list aligned with ``findings`` holding None for findings
+    without usable CVSS data, or a dict with ``version``, ``base``,
+    ``environmental`` and the effective ``score`` (environmental score of a
+    v3 vector, otherwise the numeric score written in the finding). A CVSS
+    v4.0 vector without a numeric score is kept with a ``score`` of None,
+    as cvss.py does not score v4.
+    """
+    raw = [f.get("cvss") or "" for f in findings]
+    scored = score_vectors(raw)
+    results = []
+    for value, result in zip(raw, scored):
+        score = result["environmental"]
+        if score is None and value:
+            score = _explicit_cvss(value)
+        if score is None and result["version"] != "4.0":
+            results.append(None)
+        else:
+            result["score"] = score
+            results.append(result)
+    return results
+
+
+def unscored_v4(findings: list, scores: Optional[list] = None) -> list:
+    """Return the IDs of findings whose only CVSS data is an unscored v4.0 vector."""
+    if scores is None:
+        findings = [f for f in findings if "CVSS:4.0/" in f["cvss"]]
+        scores = score_findings(findings)
+    return [f["id"] for f, s in zip(findings, scores) if s and s["score"] is None]
+
+
+def summarize_cvss(findings: list, scores: Optional[list] = None) -> Optional[dict]:
+    """Summarize the CVSS score distribution, or None when there is no CVSS data.
+
+    ``weighted_risk`` is the sum of effective scores over open findings, so
+    one 9.8 outweighs several low-scored highs. Findings with an unscored
+    CVSS v4.0 vector are counted as unscored and listed in ``unscored_v4``;
+    with no scored findings at all, the statistics are None.
+    """
+    scores = scores if scores is not None else score_findings(findings)
+    values = sorted(s["score"] for s in scores if s and s["score"] is not None)
+    v4 = unscored_v4(findings, scores)
+    if not values and not v4:
+        return None
+
+    distribution = {rating: 0 for rating, _ in CVSS_SEVERITY_BANDS}
+    for value in values:
+        distribution[severity_rating(value)] += 1
+    open_scores = [s["score"] for f, s in zip(findings, scores)
+                   if s and s["score"] is not None and f["status"] == "open"]
+    return {
+        "scored": len(values),
+        "unscored": len(findings) - len(values),
+        "unscored_v4": v4,
+        "mean": round(sum(values) / len(values), 1) if values else None,
+        "median": round(percentile(values, 50), 1) if values else None,
+        "p90": round(percentile(values, 90), 1) if values else None,
+        "max": values[-1] if values else None,
+        "distribution": distribution,
+        "open_scored": len(open_scores),
+        "weighted_risk": round(sum(open_scores), 1),
+    }
+
+
+def _render(writer, *args) -> str:
+    """Run a write_* renderer into a string buffer and return the text."""
+    out = io.StringIO()
+    writer(out, *args)
+    return out.getvalue()
+
+
+def write_executive_summary(out: TextIO, findings: list, context: dict,
+                            groups: Optional[FindingGroups] = None) -> None:
+    """Write the executive summary section."""
+    groups = groups or FindingGroups(findings)
+    key_concerns = groups.select(islice(chain(groups.by_severity.get("critical", []),
+                                              groups.by_severity.get("high", [])), KEY_CONCERNS_LIMIT))
+    _write_summary(out, context, len(findings), groups.severity_counts(), key_concerns,
+                   summarize_cvss(findings))
+
 
-    summary = f"""## Executive Summary
+def _write_summary(out: TextIO, context: dict, total: int, by_severity: dict, key_concerns: list,
+                   cvss: Optional[dict] = None) -> None:
+    """Write the executive summary from precomputed counts, key concerns and CVSS stats."""
+    risk_level = assess_risk_level(by_severity)
+
+    out.write(f"""## Executive Summary
 
 ### Overview
 
@@ -196,7 +988,7 @@ def generate_executive_summary(findings: list, context: dict) -> str:
 |--------|-------|
 | **Project** | {context.get('project_name', 'Unknown')} |
 | **Audit Date** | {context.get('audit_started', datetime.now().strftime('%Y-%m-%d'))} |
-| **Total Findings** | {len(findings)} |
+| **Total Findings** | {total} |
 | **Overall Risk Level** | {risk_level} |
 
 ### Findings by Severity
@@ -209,156 +1001,319 @@ def generate_executive_summary(findings: list, context: dict) -> str:
 | 🔵 Low | {by_severity.get('low', 0)} |
 | ⚪ Informational | {by_severity.get('info', 0) + by_severity.get('informational', 0)} |
 
-### Key Concerns
+""")
 
-"""
+    if cvss:
+        write_cvss_summary(out, cvss, total)
+
+    out.write("### Key Concerns\n\n")
 
-    # Add top 3 critical/high findings
-    critical_high = [f for f in findings if f["severity"] in ["critical", "high"]][:3]
-    if critical_high:
-        for i, f in enumerate(critical_high, 1):
+    # Add top critical/high findings
+    if key_concerns:
+        for i, f in enumerate(key_concerns, 1):
             emoji = SEVERITY_EMOJI.get(f["severity"], "⚪")
-            summary += f"{i}. {emoji} **{f['id']}**: {f['title']}\n"
+            out.write(f"{i}. {emoji} **{f['id']}**: {f['title']}\n")
     else:
-        summary += "No critical or high severity findings identified.\n"
+        out.write("No critical or high severity findings identified.\n")
+
+
+def write_cvss_summary(out: TextIO, cvss: dict, total: int) -> None:
+    """Write the CVSS score statistics of the executive summary."""
+    dist = cvss["distribution"]
+    out.write("### CVSS Scores\n\n")
+    v4 = cvss.get("unscored_v4")
+    if v4:
+        out.write(f"> **Unscored CVSS v4.0:** {len(v4)} finding(s) record only a CVSS v4.0 vector, which is "
+                  f"not scored, and are not counted in the CVSS statistics: {', '.join(v4)}. "
+                  f"Record the numeric score next to the vector.\n\n")
+    if not cvss["scored"]:
+        return
+    out.write(f"""| Metric | Value |
+|--------|-------|
+| **Scored Findings** | {cvss['scored']} of {total} |
+| **Mean / Median** | {cvss['mean']} / {cvss['median']} |
+| **90th Percentile** | {cvss['p90']} |
+| **Highest** | {cvss['max']} |
+| **CVSS-Weighted Open Risk** | {cvss['weighted_risk']} ({cvss['open_scored']} open) |
 
-    return summary
+| CVSS Rating | Count |
+|-------------|-------|
+| Critical (9.0-10.0) | {dist['critical']} |
+| High (7.0-8.9) | {dist['high']} |
+| Medium (4.0-6.9) | {dist['medium']} |
+| Low (0.1-3.9) | {dist['low']} |
+| None (0.0) | {dist['none']} |
 
+""")
+
+
+def generate_executive_summary(findings: list, context: dict) -> str:
+    """Generate executive summary section."""
+    return _render(write_executive_summary, findings, context)
 
-def generate_findings_by_severity(findings: list) -> str:
-    """Generate findings organized by severity."""
-    content = "## Findings by Severity\n\n"
+
+def write_findings_by_severity(out: TextIO, findings: list,
+                               groups: Optional[FindingGroups] = None) -> None:
+    """Write findings organized by severity."""
+    groups = groups or FindingGroups(findings)
+    out.write("## Findings by Severity\n\n")
 
     for severity in ["critical", "high", "medium", "low", "info"]:
-        severity_findings = [f for f in findings if f["severity"] == severity]
+        severity_findings = groups.select(groups.by_severity.get(severity, []))
         if not severity_findings:
             continue
 
         emoji = SEVERITY_EMOJI.get(severity, "⚪")
-        content += f"### {emoji} {severity.title()} ({len(severity_findings)})\n\n"
+        out.write(f"### {emoji} {severity.title()} ({len(severity_findings)})\n\n")
 
         for f in severity_findings:
-            content += f"#### {f['id']}: {f['title']}\n\n"
-            content += f"- **Phase**: {f['phase']}\n"
-            content += f"- **Status**: {f['status'].title()}\n"
+            out.write(f"#### {f['id']}: {f['title']}\n\n")
+            out.write(f"- **Phase**: {f['phase']}\n")
+            out.write(f"- **Status**: {f['status'].title()}\n")
             if f['owasp']:
-                content += f"- **OWASP**: {f['owasp']}\n"
+                out.write(f"- **OWASP**: {f['owasp']}\n")
             if f['cwe']:
-                content += f"- **CWE**: {f['cwe']}\n"
-            if f['description']:
-                content += f"\n{f['description'][:300]}...\n" if len(f['description']) > 300 else f"\n{f['description']}\n"
-            content += "\n"
+                out.write(f"- **CWE**: {f['cwe']}\n")
+            description = f['description']
+            if description:
+                out.write(f"\n{description[:300]}...\n" if len(description) > 300 else f"\n{description}\n")
+            out.write("\n")
 
-    return content
 
+def generate_findings_by_severity(findings: list) -> str:
+    """Generate findings organized by severity."""
+    return _render(write_findings_by_severity, findings)
 
-def generate_findings_by_phase(findings: list) -> str:
-    """Generate findings organized by phase."""
-    content = "## Findings by Phase\n\n"
 
-    by_phase = count_by_phase(findings)
+def write_findings_by_phase(out: TextIO, findings: list,
+                            groups: Optional[FindingGroups] = None) -> None:
+    """Write findings organized by phase."""
+    groups = groups or FindingGroups(findings)
+    out.write("## Findings by Phase\n\n")
 
-    for phase in sorted(by_phase.keys(), key=lambda x: int(re.search(r'\d+', x).group()) if re.search(r'\d+', x) else 99):
-        phase_findings = [f for f in findings if phase.split()[-1] in f["phase"]]
-        if not phase_findings:
-            continue
+    for phase in groups.phases():
+        phase_findings = groups.select(groups.by_phase[phase])
 
-        content += f"### {phase} ({len(phase_findings)} findings)\n\n"
+        out.write(f"### {phase} ({len(phase_findings)} findings)\n\n")
 
-        content += "| ID | Title | Severity | Status |\n"
-        content += "|----|----|----|----|----|\n"
+        out.write("| ID | Title | Severity | Status |\n")
+        out.write("|----|----|----|----|\n")
 
         for f in phase_findings:
             emoji = SEVERITY_EMOJI.get(f["severity"], "⚪")
-            content += f"| {f['id']} | {f['title']} | {emoji} {f['severity'].title()} | {f['status'].title()} |\n"
+            out.write(f"| {f['id']} | {f['title']} | {emoji} {f['severity'].title()} | {f['status'].title()} |\n")
 
-        content += "\n"
+        out.write("\n")
 
-    return content
 
+def generate_findings_by_phase(findings: list) -> str:
+    """Generate findings organized by phase."""
+    return _render(write_findings_by_phase, findings)
 
-def generate_remediation_roadmap(findings: list) -> str:
-    """Generate prioritized remediation roadmap."""
-    content = "## Remediation Roadmap\n\n"
+
+def write_remediation_roadmap(out: TextIO, findings: list,
+                              groups: Optional[FindingGroups] = None) -> None:
+    """Write prioritized remediation roadmap."""
+    groups = groups or FindingGroups(findings)
+    out.write("## Remediation Roadmap\n\n")
 
     # Immediate (Critical)
-    critical = [f for f in findings if f["severity"] == "critical" and f["status"] == "open"]
+    critical = groups.select(groups.remediation["immediate"])
     if critical:
-        content += "### 🚨 Immediate (Fix Now)\n\n"
+        out.write("### 🚨 Immediate (Fix Now)\n\n")
         for f in critical:
-            content += f"- [ ] **{f['id']}**: {f['title']}\n"
-            if f['recommendation']:
-                content += f"  - {f['recommendation'][:200]}\n"
-        content += "\n"
+            out.write(f"- [ ] **{f['id']}**: {f['title']}\n")
+            recommendation = f['recommendation']
+            if recommendation:
+                out.write(f"  - {recommendation[:200]}\n")
+        out.write("\n")
 
     # Short-term (High, 1-4 weeks)
-    high = [f for f in findings if f["severity"] == "high" and f["status"] == "open"]
+    high = groups.select(groups.remediation["short_term"])
     if high:
-        content += "### ⚠️ Short-term (1-4 weeks)\n\n"
+        out.write("### ⚠️ Short-term (1-4 weeks)\n\n")
         for f in high:
-            content += f"- [ ] **{f['id']}**: {f['title']}\n"
-        content += "\n"
+            out.write(f"- [ ] **{f['id']}**: {f['title']}\n")
+        out.write("\n")
 
     # Medium-term (Medium, 1-3 months)
-    medium = [f for f in findings if f["severity"] == "medium" and f["status"] == "open"]
+    medium = groups.select(groups.remediation["medium_term"])
     if medium:
-        content += "### 📋 Medium-term (1-3 months)\n\n"
+        out.write("### 📋 Medium-term (1-3 months)\n\n")
         for f in medium:
-            content += f"- [ ] **{f['id']}**: {f['title']}\n"
-        content += "\n"
+            out.write(f"- [ ] **{f['id']}**: {f['title']}\n")
+        out.write("\n")
 
     # Backlog (Low/Info)
-    low = [f for f in findings if f["severity"] in ["low", "info", "informational"] and f["status"] == "open"]
+    low = groups.select(groups.remediation["backlog"])
     if low:
-        content += "### 📝 Backlog\n\n"
+        out.write("### 📝 Backlog\n\n")
         for f in low:
-            content += f"- [ ] **{f['id']}**: {f['title']}\n"
-        content += "\n"
+            out.write(f"- [ ] **{f['id']}**: {f['title']}\n")
+        out.write("\n")
 
-    return content
 
+def generate_remediation_roadmap(findings: list) -> str:
+    """Generate prioritized remediation roadmap."""
+    return _render(write_remediation_roadmap, findings)
 
-def generate_compliance_summary(findings: list) -> str:
-    """Generate compliance framework mapping summary."""
-    content = "## Compliance Mapping\n\n"
+
+def write_compliance_summary(out: TextIO, findings: list,
+                             groups: Optional[FindingGroups] = None) -> None:
+    """Write compliance framework mapping summary."""
+    groups = groups or FindingGroups(findings)
+    out.write("## Compliance Mapping\n\n")
 
     # OWASP Top 10
-    owasp_findings = [f for f in findings if f["owasp"]]
-    if owasp_findings:
-        content += "### OWASP Top 10\n\n"
-        owasp_map = defaultdict(list)
-        for f in owasp_findings:
-            owasp_map[f["owasp"]].append(f["id"])
-
-        content += "| OWASP Category | Findings |\n"
-        content += "|----------------|----------|\n"
+    owasp_map = {owasp: groups.ids(indexes) for owasp, indexes in groups.by_owasp.items()}
+    if owasp_map:
+        out.write("### OWASP Top 10\n\n")
+        out.write("| OWASP Category | Findings |\n")
+        out.write("|----------------|----------|\n")
         for owasp, ids in sorted(owasp_map.items()):
-            content += f"| {owasp} | {', '.join(ids)} |\n"
-        content += "\n"
+            out.write(f"| {owasp} | {', '.join(ids)} |\n")
+        out.write("\n")
 
     # CWE
-    cwe_findings = [f for f in findings if f["cwe"]]
-    if cwe_findings:
-        content += "### CWE References\n\n"
-        cwe_map = defaultdict(list)
-        for f in cwe_findings:
-            cwe_map[f["cwe"]].append(f["id"])
-
-        content += "| CWE | Findings |\n"
-        content += "|-----|----------|\n"
+    cwe_map = {cwe: groups.ids(indexes) for cwe, indexes in groups.by_cwe.items()}
+    if cwe_map:
+        out.write("### CWE References\n\n")
+        out.write("| CWE | Findings |\n")
+        out.write("|-----|----------|\n")
         for cwe, ids in sorted(cwe_map.items()):
-            content += f"| {cwe} | {', '.join(ids)} |\n"
-        content += "\n"
+            out.write(f"| {cwe} | {', '.join(ids)} |\n")
+        out.write("\n")
 
-    return content
+    write_control_coverage(out, control_coverage(groups))
 
 
-def generate_report(audit_dir: Path) -> str:
-    """Generate the complete final report in markdown format."""
-    context = load_audit_context(audit_dir)
-    findings = load_findings(audit_dir)
+def control_coverage(groups: FindingGroups) -> dict:
+    """Map every catalogued control to its findings, per framework.
+
+    Returns ``{framework: {control: {"description", "findings", "open"}}}``
+    in mapping order, or an empty dict when the compliance mapping is
+    unavailable.
+    """
+    index = load_compliance_index()
+    if not index:
+        return {}
+    by_control = groups.controls()
+    coverage = {}
+    for framework, catalog in index["frameworks"].items():
+        coverage[framework] = {}
+        for control, description in catalog.items():
+            indexes = by_control.get((framework, control), [])
+            coverage[framework][control] = {
+                "description": description,
+                "findings": groups.ids(indexes),
+                "open": sum(1 for i in indexes if groups.findings[i]["status"] not in RESOLVED_STATUSES),
+            }
+    return coverage
+
+
+def write_control_coverage(out: TextIO, coverage: dict) -> None:
+    """Write one control-coverage table per compliance framework.
+
+    Skipped when no finding maps to any control (e.g. findings without phase
+    or OWASP data), rather than printing tables of zeros.
+    """
+    if not any(c["findings"] for controls in coverage.values() for c in controls.values()):
+        return
+    out.write("### Control Coverage\n\n")
+    for framework, controls in coverage.items():
+        affected = sum(1 for c in controls.values() if c["findings"])
+        out.write(f"#### {framework}\n\n")
+        out.write(f"{affected} of {len(controls)} controls have related findings.\n\n")
+        out.write("| Control | Description | Open | Findings |\n")
+        out.write("|---------|-------------|------|----------|\n")
+        for control, entry in controls.items():
+            ids = ", ".join(entry["findings"]) or "-"
+            out.write(f"| {control} | {entry['description']} | {entry['open']} | {ids} |\n")
+        out.write("\n")
+
+
+def _representative_key(f) -> tuple:
+    """Rank cluster members: unresolved before resolved, then most severe, then by ID."""
+    return (f["status"] in RESOLVED_STATUSES, SEVERITY_ORDER.get(f["severity"], 5), f["id"], f["file"])
+
+
+def _finding_signature(f) -> Optional[object]:
+    """MinHash signature of a finding's title and description (see dedupe.py)."""
+    return dedupe.text_signature(f"{f.title}\n{f.description}")
+
+
+def cluster_duplicates(findings: list, jobs: Optional[int] = None,
+                       threshold: float = dedupe.SIMILARITY_THRESHOLD) -> list:
+    """Group near-duplicate findings (see dedupe.py) into clusters of two or more.
+
+    Findings are compared on their title and description, and only with
+    findings of the same CWE. Signatures are computed on ``jobs`` worker
+    processes, as in parse_finding_files. Each cluster is a dict with a
+    ``DUP-NNN`` ``id``, its ``representative`` finding and all ``members``
+    (representative first); clusters are ordered by representative.
+    """
+    workers = min(_resolve_jobs(jobs), len(findings))
+    if workers <= 1 or len(findings) < PARALLEL_THRESHOLD:
+        signatures = [_finding_signature(f) for f in findings]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            signatures = list(executor.map(_finding_signature, findings,
+                                           chunksize=max(1, len(findings) // (workers * 4))))
+    roots = dedupe.cluster_signatures(signatures, [normalize_cwe(f["cwe"]) for f in findings], threshold)
+    members = defaultdict(list)
+    for i, root in enumerate(roots):
+        members[root].append(findings[i])
+    groups = sorted((sorted(group, key=_representative_key) for group in members.values() if len(group) > 1),
+                    key=lambda group: _representative_key(group[0]))
+    return [{"id": f"DUP-{n:03d}", "representative": group[0], "members": group}
+            for n, group in enumerate(groups, 1)]
+
+
+def collapse_duplicates(findings: list, clusters: list) -> list:
+    """Drop every cluster member except its representative, keeping the order of ``findings``."""
+    dropped = {id(f) for cluster in clusters for f in cluster["members"][1:]}
+    return [f for f in findings if id(f) not in dropped]
+
+
+def _duplicates_json(clusters: list) -> list:
+    return [{"id": c["id"], "representative": c["representative"]["id"],
+             "members": [f["id"] for f in c["members"]]} for c in clusters]
+
+
+def write_duplicate_clusters(out: TextIO, clusters: list, collapsed: bool = False) -> None:
+    """Write the near-duplicate clusters found by cluster_duplicates."""
+    out.write("## Possible Duplicates\n\n")
+    if not clusters:
+        out.write("No near-duplicate findings found.\n")
+        return
+    total = sum(len(c["members"]) for c in clusters)
+    plural = "s" if len(clusters) > 1 else ""
+    out.write(f"{total} findings in {len(clusters)} cluster{plural} have near-identical titles and "
+              "descriptions and the same CWE.")
+    if collapsed:
+        out.write(" Only the representative of each cluster is counted in this report.")
+    out.write("\n\n| Cluster | Representative | Duplicates |\n")
+    out.write("|---------|----------------|------------|\n")
+    for c in clusters:
+        rep = c["representative"]
+        others = ", ".join(f["id"] for f in c["members"][1:])
+        out.write(f"| {c['id']} | {rep['id']}: {rep['title']} | {others} |\n")
+
+
+def generate_compliance_summary(findings: list) -> str:
+    """Generate compliance framework mapping summary."""
+    return _render(write_compliance_summary, findings)
+
+
+@cached_bodies()
+def write_markdown_report(out: TextIO, findings: list, context: dict,
+                          duplicates: Optional[list] = None, collapsed: bool = False) -> None:
+    """Write the complete final report in markdown format.
 
-    report = f"""# Security Audit Report
+    ``duplicates`` (from cluster_duplicates) adds a Possible Duplicates
+    section; ``collapsed`` notes that ``findings`` holds representatives only.
+    """
+    out.write(f"""# Security Audit Report
 
 **Project:** {context.get('project_name', 'Unknown Project')}
 **Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M')}
@@ -366,22 +1321,26 @@ def generate_report(audit_dir: Path) -> str:
 
 ---
 
-"""
-
-    report += generate_executive_summary(findings, context)
-    report += "\n---\n\n"
-    report += generate_findings_by_severity(findings)
-    report += "\n---\n\n"
-    report += generate_findings_by_phase(findings)
-    report += "\n---\n\n"
-    report += generate_remediation_roadmap(findings)
-    report += "\n---\n\n"
-    report += generate_compliance_summary(findings)
-    report += "\n---\n\n"
+""")
+
+    groups = FindingGroups(findings)
+    write_executive_summary(out, findings, context, groups)
+    for write_section in (
+        write_findings_by_severity,
+        write_findings_by_phase,
+        write_remediation_roadmap,
+        write_compliance_summary,
+    ):
+        out.write("\n---\n\n")
+        write_section(out, findings, groups)
+    out.write("\n---\n\n")
+    if duplicates is not None:
+        write_duplicate_clusters(out, duplicates, collapsed)
+        out.write("\n---\n\n")
 
     # Statistics
-    by_status = count_by_status(findings)
-    report += f"""## Statistics
+    by_status = groups.status_counts()
+    out.write(f"""## Statistics
 
 | Metric | Count |
 |--------|-------|
@@ -394,29 +1353,116 @@ def generate_report(audit_dir: Path) -> str:
 ---
 
 *Report generated by Codebase Security Audit Framework*
-"""
+""")
+
+
+def report_context(findings: list, context: dict, groups: Optional[FindingGroups] = None,
+                   duplicates: Optional[list] = None) -> dict:
+    """Build the variables available to --template report templates.
+
+    ``context`` (audit-context fields), ``generated``, ``audit_date``,
+    ``summary`` (as in the JSON report), ``cvss``, ``key_concerns``,
+    ``severities`` / ``phases`` (non-empty sections with their findings),
+    ``remediation`` (tier -> findings), ``owasp`` / ``cwe`` (sorted
+    ``(value, ids)`` pairs), ``frameworks`` (control coverage, empty when no
+    finding maps to a control), ``emoji`` (severity -> emoji),
+    ``duplicates`` (near-duplicate clusters with ``id``, ``representative``,
+    ``members`` and the other members' ``duplicate_ids``; empty unless
+    --dedupe) and ``findings``. Findings
+    expose the FINDING_FIELDS as attributes.
+    """
+    groups = groups or FindingGroups(findings)
+    coverage = control_coverage(groups)
+    frameworks = []
+    if any(c["findings"] for controls in coverage.values() for c in controls.values()):
+        frameworks = [
+            {
+                "framework": framework,
+                "affected": sum(1 for c in controls.values() if c["findings"]),
+                "controls": [{"control": control, **entry} for control, entry in controls.items()],
+            }
+            for framework, controls in coverage.items()
+        ]
+    return {
+        "context": context,
+        "generated": datetime.now().strftime('%Y-%m-%d %H:%M'),
+        "audit_date": context.get('audit_started', datetime.now().strftime('%Y-%m-%d')),
+        "summary": _report_summary(len(findings), groups.severity_counts(), groups.status_counts(),
+                                   groups.phase_counts()),
+        "cvss": summarize_cvss(findings),
+        "key_concerns": groups.select(islice(chain(groups.by_severity.get("critical", []),
+                                                   groups.by_severity.get("high", [])), KEY_CONCERNS_LIMIT)),
+        "severities": [{"severity": severity, "findings": groups.select(groups.by_severity[severity])}
+                       for severity in ["critical", "high", "medium", "low", "info"]
+                       if groups.by_severity.get(severity)],
+        "phases": [{"phase": phase, "findings": groups.select(groups.by_phase[phase])}
+                   for phase in groups.phases()],
+        "remediation": {tier: groups.select(indexes) for tier, indexes in groups.remediation.items()},
+        "owasp": sorted((owasp, groups.ids(indexes)) for owasp, indexes in groups.by_owasp.items()),
+        "cwe": sorted((cwe, groups.ids(indexes)) for cwe, indexes in groups.by_cwe.items()),
+        "frameworks": frameworks,
+        "emoji": defaultdict(lambda: "⚪", SEVERITY_EMOJI),
+        "duplicates": [{**c, "duplicate_ids": [f["id"] for f in c["members"][1:]]} for c in duplicates or ()],
+        "findings": findings,
+    }
 
-    return report
 
+@cached_bodies()
+def write_template_report(out: TextIO, findings: list, context: dict, template,
+                          duplicates: Optional[list] = None) -> None:
+    """Write the markdown report through a compiled template (see templating.py)."""
+    template.render(out, report_context(findings, context, duplicates=duplicates))
 
-def generate_json_report(audit_dir: Path) -> str:
-    """Generate the report in JSON format for programmatic consumption."""
+
+def generate_report(audit_dir: Path, jobs: Optional[int] = None, cache: bool = False) -> str:
+    """Generate the complete final report in markdown format."""
     context = load_audit_context(audit_dir)
-    findings = load_findings(audit_dir)
-    by_severity = count_by_severity(findings)
-    by_phase = count_by_phase(findings)
-    by_status = count_by_status(findings)
+    findings = load_findings(audit_dir, jobs, cache=cache)
+    return _render(write_markdown_report, findings, context)
 
-    critical_count = by_severity.get("critical", 0)
-    high_count = by_severity.get("high", 0)
 
-    risk_level = "Low"
-    if critical_count > 0:
-        risk_level = "Critical"
-    elif high_count > 2:
-        risk_level = "High"
-    elif high_count > 0:
-        risk_level = "Medium"
+def _json_default(obj):
+    """Serialise Finding records lazily, one at a time, while encoding."""
+    if isinstance(obj, Finding):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _report_summary(total: int, by_severity: dict, by_status: dict, by_phase: dict) -> dict:
+    """Build the finding-count summary shared by the JSON and JSON Lines reports."""
+    return {
+        "total_findings": total,
+        "risk_level": assess_risk_level(by_severity),
+        "by_severity": {
+            "critical": by_severity.get("critical", 0),
+            "high": by_severity.get("high", 0),
+            "medium": by_severity.get("medium", 0),
+            "low": by_severity.get("low", 0),
+            "informational": by_severity.get("info", 0) + by_severity.get("informational", 0)
+        },
+        "by_status": {
+            "open": by_status.get("open", 0),
+            "in_progress": by_status.get("in progress", 0) + by_status.get("in-progress", 0),
+            "resolved": by_status.get("resolved", 0) + by_status.get("fixed", 0),
+            "accepted_risk": by_status.get("accepted risk", 0) + by_status.get("accepted-risk", 0)
+        },
+        "by_phase": by_phase,
+    }
+
+
+def write_json_report(out: TextIO, findings: list, context: dict,
+                      duplicates: Optional[list] = None, collapsed: bool = False) -> None:
+    """Write the report in JSON format for programmatic consumption.
+
+    The document is encoded chunk by chunk with JSONEncoder.iterencode, so the
+    serialised report is never held in memory as a single string. With
+    ``duplicates`` (from cluster_duplicates) it gains a ``duplicates`` object
+    listing each cluster's ID, representative and member IDs.
+    """
+    groups = FindingGroups(findings)
+    by_severity = groups.severity_counts()
+    by_status = groups.status_counts()
+    scores = score_findings(findings)
 
     report_data = {
         "metadata": {
@@ -428,37 +1474,152 @@ def generate_json_report(audit_dir: Path) -> str:
             "framework_version": "1.0"
         },
         "summary": {
-            "total_findings": len(findings),
-            "risk_level": risk_level,
-            "by_severity": {
-                "critical": by_severity.get("critical", 0),
-                "high": by_severity.get("high", 0),
-                "medium": by_severity.get("medium", 0),
-                "low": by_severity.get("low", 0),
-                "informational": by_severity.get("info", 0) + by_severity.get("informational", 0)
-            },
-            "by_status": {
-                "open": by_status.get("open", 0),
-                "in_progress": by_status.get("in progress", 0) + by_status.get("in-progress", 0),
-                "resolved": by_status.get("resolved", 0) + by_status.get("fixed", 0),
-                "accepted_risk": by_status.get("accepted risk", 0) + by_status.get("accepted-risk", 0)
-            },
-            "by_phase": dict(by_phase)
+            **_report_summary(len(findings), by_severity, by_status, groups.phase_counts()),
+            "cvss": summarize_cvss(findings, scores)
         },
         "findings": findings,
-        "remediation": {
-            "immediate": [f for f in findings if f["severity"] == "critical" and f["status"] == "open"],
-            "short_term": [f for f in findings if f["severity"] == "high" and f["status"] == "open"],
-            "medium_term": [f for f in findings if f["severity"] == "medium" and f["status"] == "open"],
-            "backlog": [f for f in findings if f["severity"] in ["low", "info", "informational"] and f["status"] == "open"]
-        },
+        # Aligned with "findings"; null where a finding has no usable CVSS data
+        "cvss_scores": scores,
+        # Indexes into "findings" rather than repeated finding objects
+        "remediation": groups.remediation,
         "compliance": {
-            "owasp": _group_by_field(findings, "owasp"),
-            "cwe": _group_by_field(findings, "cwe")
+            "owasp": {owasp: groups.ids(indexes) for owasp, indexes in groups.by_owasp.items()},
+            "cwe": {cwe: groups.ids(indexes) for cwe, indexes in groups.by_cwe.items()},
+            "frameworks": control_coverage(groups)
         }
     }
+    if duplicates is not None:
+        report_data["duplicates"] = {"collapsed": collapsed, "clusters": _duplicates_json(duplicates)}
+
+    encoder = json.JSONEncoder(indent=2, ensure_ascii=False, default=_json_default)
+    for chunk in encoder.iterencode(report_data):
+        out.write(chunk)
+
 
-    return json.dumps(report_data, indent=2, ensure_ascii=False)
+def generate_json_report(audit_dir: Path, jobs: Optional[int] = None, cache: bool = False) -> str:
+    """Generate the report in JSON format for programmatic consumption."""
+    context = load_audit_context(audit_dir)
+    findings = load_findings(audit_dir, jobs, cache=cache)
+    return _render(write_json_report, findings, context)
+
+
+def write_jsonl_report(out: TextIO, findings) -> None:
+    """Write findings as JSON Lines: one compact finding per line, then a summary record.
+
+    Every line is a complete JSON object whose ``record`` key is "finding" or
+    "summary". ``findings`` may be any iterable, so with --stream lines are
+    written while findings are parsed and only the summary counts are kept.
+    """
+    encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    by_severity = defaultdict(int)
+    by_status = defaultdict(int)
+    by_phase = defaultdict(int)
+    phase_keys = {}
+    total = 0
+    for f in findings:
+        out.write(encode({"record": "finding", **f.to_dict()}))
+        out.write("\n")
+        total += 1
+        by_severity[f.severity] += 1
+        by_status[f.status] += 1
+        if f.phase not in phase_keys:
+            phase_keys[f.phase] = phase_key(f.phase)
+        by_phase[phase_keys[f.phase]] += 1
+    summary = _report_summary(total, by_severity, by_status, dict(by_phase))
+    out.write(encode({"record": "summary", "generated_at": datetime.now().isoformat(), **summary}))
+    out.write("\n")
+
+
+def sarif_rule_id(f) -> str:
+    """SARIF rule of a finding: its normalised CWE, else the finding's own ID."""
+    return normalize_cwe(f["cwe"]) or f["id"].strip() or f["file"]
+
+
+def sarif_rule(rules: dict, f) -> int:
+    """Return the index of a finding's SARIF rule, adding the rule to ``rules`` if it is new.
+
+    ``rules`` maps rule ID to ``(index, rule)`` in first-seen order; each
+    rule's tags are collected in a set until the caller sorts them. Only
+    metadata fields are read.
+    """
+    rule_id = sarif_rule_id(f)
+    entry = rules.get(rule_id)
+    if entry is None:
+        rule = {"id": rule_id, "name": rule_id}
+        cwe = normalize_cwe(f["cwe"])
+        if cwe:
+            rule["helpUri"] = f"https://cwe.mitre.org/data/definitions/{cwe[4:]}.html"
+            tags = {"security", f"external/cwe/{cwe.lower()}"}
+        else:
+            rule["shortDescription"] = {"text": f["title"]}
+            tags = {"security"}
+        rule["properties"] = {"tags": tags}
+        entry = rules[rule_id] = (len(rules), rule)
+    owasp = normalize_owasp(f["owasp"])
+    if owasp:
+        year = re.search(r':(20\d\d)', f["owasp"])
+        entry[1]["properties"]["tags"].add(f"owasp/{owasp}:{year.group(1)}" if year else f"owasp/{owasp}")
+    return entry[0]
+
+
+def _sarif_result(f, rule_index: int) -> dict:
+    """Convert a finding into a SARIF result referencing its rule."""
+    f = f.to_dict() if isinstance(f, Finding) else f  # reads the body sections once
+    rule_id = sarif_rule_id(f)
+    message = f["title"] + (f"\n\n{f['description']}" if f["description"] else "")
+    result = {"ruleId": rule_id, "ruleIndex": rule_index}
+    result["level"] = SARIF_LEVELS.get(f["severity"], "warning")
+    result["message"] = {"text": message}
+
+    match = SARIF_LOCATION_PATTERN.match(f["location"])
+    if match:
+        path, start, end = match.groups()
+        physical = {"artifactLocation": {"uri": path.strip().replace("\\", "/"), "uriBaseId": "%SRCROOT%"}}
+        if start:
+            physical["region"] = {"startLine": int(start), **({"endLine": int(end)} if end else {})}
+        result["locations"] = [{"physicalLocation": physical}]
+
+    status = f["status"]
+    if status in RESOLVED_STATUSES:
+        result["kind"] = "pass"
+        result["level"] = "none"
+    elif status in ACCEPTED_STATUSES:
+        result["suppressions"] = [{"kind": "external", "status": "accepted"}]
+    result["partialFingerprints"] = {"auditFinding/v1": finding_fingerprint(f)}
+    result["properties"] = {field: f[field] for field in ("id", "severity", "phase", "status", "owasp", "cvss")
+                            if f[field]}
+    return result
+
+
+def write_sarif_report(out: TextIO, findings) -> None:
+    """Write findings as a SARIF 2.1.0 log for code-scanning tools.
+
+    Each finding becomes one result whose rule is its CWE (or its ID when
+    it has none); rules are written once in the tool's driver and results
+    refer to them by index. Findings are read in a single pass, so with
+    --stream they may be a generator: results are encoded one at a time
+    into a spool (memory, then a temporary file past SARIF_SPOOL_SIZE)
+    while their rules are collected, and copied out after the driver,
+    which readers expect before the results.
+    """
+    encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    rules = {}
+    with tempfile.SpooledTemporaryFile(SARIF_SPOOL_SIZE, "w+", encoding="utf-8", newline="") as spool:
+        for n, f in enumerate(findings):
+            spool.write(",\n" if n else "\n")
+            spool.write(encode(_sarif_result(f, sarif_rule(rules, f))))
+        for _, rule in rules.values():
+            rule["properties"]["tags"] = sorted(rule["properties"]["tags"])
+        driver = {
+            "name": "Codebase Security Audit Framework",
+            "version": "1.0",
+            "rules": [rule for _, rule in rules.values()],
+        }
+        out.write(f'{{"$schema":{encode(SARIF_SCHEMA)},"version":"2.1.0","runs":[{{'
+                  f'"tool":{{"driver":{encode(driver)}}},"results":[')
+        spool.seek(0)
+        shutil.copyfileobj(spool, out, WRITE_BUFFER_SIZE)
+    out.write("\n]}]}\n")
 
 
 def _group_by_field(findings: list, field: str) -> dict:
@@ -470,52 +1631,535 @@ def _group_by_field(findings: list, field: str) -> dict:
     return dict(grouped)
 
 
-def generate_csv_report(audit_dir: Path) -> str:
+CSV_HEADER = [
+    "ID",
+    "Title",
+    "Severity",
+    "Phase",
+    "Status",
+    "OWASP",
+    "CWE",
+    "Description",
+    "Impact",
+    "Recommendation",
+    "File"
+]
+
+
+def _csv_row(f) -> list:
+    """Flatten a finding into a CSV row matching CSV_HEADER."""
+    if isinstance(f, Finding):
+        f = f.to_dict()  # reads the body sections once
+    return [
+        f.get("id", ""),
+        f.get("title", ""),
+        f.get("severity", ""),
+        f.get("phase", ""),
+        f.get("status", ""),
+        f.get("owasp", ""),
+        f.get("cwe", ""),
+        f.get("description", "")[:500],  # Truncate long descriptions
+        f.get("impact", ""),
+        f.get("recommendation", ""),
+        f.get("file", "")
+    ]
+
+
+def write_csv_report(out: TextIO, findings: list) -> None:
+    """Write the report in CSV format for spreadsheet import."""
+    writer = csv.writer(out)
+    writer.writerow(CSV_HEADER)
+    writer.writerows(_csv_row(f) for f in findings)
+
+
+def _js_literal(data) -> str:
+    """Encode data as a compact JavaScript literal."""
+    text = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    # Valid in JSON but line terminators in older JavaScript engines
+    return text.replace("\u2028", "\\u2028").replace("\u2029", "\\u2029")
+
+
+def _cwe_sort_key(value: str) -> tuple:
+    """Order CWE facet values numerically, with unrecognised values last."""
+    return (int(value[4:]) if value.startswith("CWE-") else 1 << 30, value)
+
+
+def build_filter_index(groups: FindingGroups) -> dict:
+    """Dictionary-encode the HTML report's filter columns.
+
+    Each facet (severity, phase, status, CWE) has its sorted ``values``, the
+    code of every finding (``codes``, aligned with the findings) and a count
+    per value, so the page filters by comparing integers. Built from the
+    FindingGroups buckets; findings without a CWE get the value "".
+    """
+    cwe = defaultdict(list)
+    for value, indexes in groups.by_cwe.items():
+        cwe[normalize_cwe(value) or value].extend(indexes)
+    facets = {
+        "severity": (groups.by_severity, lambda v: (SEVERITY_ORDER.get(v, 5), v)),
+        "phase": (groups.by_phase, lambda v: (_phase_sort_key(v), v)),
+        "status": (groups.by_status, str),
+        "cwe": (cwe, _cwe_sort_key),
+    }
+    total = len(groups.findings)
+    index = {}
+    for name, (buckets, key) in facets.items():
+        values = sorted(buckets, key=key)
+        counts = [len(buckets[v]) for v in values]
+        codes = [len(values)] * total
+        for code, value in enumerate(values):
+            for i in buckets[value]:
+                codes[i] = code
+        if sum(counts) < total:
+            values.append("")
+            counts.append(total - sum(counts))
+        index[name] = {"values": values, "counts": counts, "codes": codes}
+    return index
+
+
+def write_html_shards(findings: list, shard_dir: Path) -> int:
+    """Write findings to ``shard_dir`` as HTML_SHARD_SIZE-row script shards; return the count.
+
+    Shards are scripts calling ``auditShard(n, rows)`` rather than JSON
+    files, because browsers refuse to fetch JSON from file:// pages.
+    """
+    shard_dir.mkdir(parents=True, exist_ok=True)
+    count = 0
+    for start in range(0, len(findings), HTML_SHARD_SIZE):
+        records = (f.to_dict() for f in islice(findings, start, start + HTML_SHARD_SIZE))
+        rows = [[record[c] for c in HTML_COLUMNS] for record in records]
+        with open(shard_dir / f"shard-{count:05d}.js", "w", encoding="utf-8",
+                  buffering=WRITE_BUFFER_SIZE) as out:
+            out.write(f"auditShard({count},{_js_literal(rows)});\n")
+        count += 1
+    return count
+
+
+def write_html_report(out: TextIO, findings: list, context: dict, data_dir: Path) -> None:
+    """Write the offline HTML report: a shell page plus sharded finding data.
+
+    Finding rows, the filter index and the metadata go to a new versioned
+    directory under ``data_dir``; the shell written to ``out`` is the only
+    file referencing it, so replacing the shell switches readers over at
+    once. Older versions except the newest are removed first.
+    """
+    generated_at = datetime.now()
+    version = generated_at.strftime("%Y%m%d%H%M%S%f")
+    if data_dir.is_dir():
+        previous = sorted(p for p in data_dir.iterdir() if p.is_dir())
+        for stale in previous[:-1]:
+            shutil.rmtree(stale, ignore_errors=True)
+    shard_dir = data_dir / version
+
+    groups = FindingGroups(findings)
+    shards = write_html_shards(findings, shard_dir)
+    relative = f"{data_dir.name}/{version}"
+    index = {
+        "version": version,
+        "data_dir": relative,
+        "shard_size": HTML_SHARD_SIZE,
+        "shards": shards,
+        "total": len(findings),
+        "columns": HTML_COLUMNS,
+        "metadata": {
+            "project_name": context.get("project_name", "Unknown Project"),
+            "audit_started": context.get("audit_started", ""),
+            "audit_status": context.get("audit_status", ""),
+            "generated_at": generated_at.isoformat(timespec="seconds"),
+        },
+        "summary": _report_summary(len(findings), groups.severity_counts(), groups.status_counts(),
+                                   groups.phase_counts()),
+        "facets": build_filter_index(groups),
+    }
+    with open(shard_dir / "index.js", "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as fh:
+        fh.write(f"window.AUDIT_INDEX = {_js_literal(index)};\n")
+
+    load_template(HTML_TEMPLATE).render(out, {"title": index["metadata"]["project_name"],
+                                              "data_dir": relative})
+
+
+def generate_csv_report(audit_dir: Path, jobs: Optional[int] = None, cache: bool = False) -> str:
     """Generate the report in CSV format for spreadsheet import."""
-    findings = load_findings(audit_dir)
-
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    # Header row
-    writer.writerow([
-        "ID",
-        "Title",
-        "Severity",
-        "Phase",
-        "Status",
-        "OWASP",
-        "CWE",
-        "Description",
-        "Impact",
-        "Recommendation",
-        "File"
-    ])
-
-    # Data rows
-    for f in findings:
-        writer.writerow([
-            f.get("id", ""),
-            f.get("title", ""),
-            f.get("severity", ""),
-            f.get("phase", ""),
-            f.get("status", ""),
-            f.get("owasp", ""),
-            f.get("cwe", ""),
-            f.get("description", "")[:500],  # Truncate long descriptions
-            f.get("impact", ""),
-            f.get("recommendation", ""),
-            f.get("file", "")
-        ])
-
-    return output.getvalue()
-
-
-def generate_summary_only(audit_dir: Path) -> str:
-    """Generate only the executive summary for quick review."""
+    findings = load_findings(audit_dir, jobs, cache=cache)
+    return _render(write_csv_report, findings)
+
+
+def write_columnar_report(out: BinaryIO, findings: list, backend: str) -> None:
+    """Write findings as columns for analytics: Parquet or a NumPy archive (see columnar.py)."""
+    records = (f.to_dict() for f in findings)
+    columnar.write_columns(out, columnar.build_columns(records, FINDING_FIELDS), backend)
+
+
+def iter_findings(audit_dir: Path, parser=None):
+    """Yield parsed findings one at a time, in directory order.
+
+    Unlike load_findings nothing is collected or sorted, so memory use does
+    not grow with the number of findings.
+    """
+    parser = parser or parse_finding
+    findings_dir = audit_dir / "findings"
+    if not findings_dir.exists():
+        return
+    with os.scandir(findings_dir) as entries:
+        for entry in entries:
+            if entry.name.startswith(".") or not entry.name.endswith(".md") or not entry.is_file():
+                continue
+            finding = parser(Path(entry.path))
+            if finding:
+                yield finding
+
+
+def _external_sort(rows, key, run_size: int = SORT_RUN_SIZE):
+    """Sort an iterable of string rows by ``key`` using sorted runs on disk.
+
+    Up to ``run_size`` rows are held in memory at a time; each full run is
+    written to a temporary CSV file and the runs are combined with a k-way
+    heapq.merge. Inputs that fit in one run never touch the disk.
+    """
+    run = []
+    with tempfile.TemporaryDirectory(prefix="audit-sort-") as tmp:
+        run_paths = []
+        for row in rows:
+            run.append(row)
+            if len(run) >= run_size:
+                run_paths.append(_write_sort_run(Path(tmp), len(run_paths), sorted(run, key=key)))
+                run = []
+
+        if not run_paths:
+            yield from sorted(run, key=key)
+            return
+        if run:
+            run_paths.append(_write_sort_run(Path(tmp), len(run_paths), sorted(run, key=key)))
+        del run
+
+        handles = [open(p, encoding="utf-8", newline="") for p in run_paths]
+        try:
+            yield from heapq.merge(*(csv.reader(h) for h in handles), key=key)
+        finally:
+            for h in handles:
+                h.close()
+
+
+def _write_sort_run(tmp: Path, n: int, rows: list) -> Path:
+    """Write one sorted run for _external_sort and return its path."""
+    path = tmp / f"run-{n:05d}.csv"
+    with open(path, "w", encoding="utf-8", newline="") as fh:
+        csv.writer(fh).writerows(rows)
+    return path
+
+
+def _csv_sort_key(row: list) -> tuple:
+    """Order CSV rows like load_findings: by severity, then file name."""
+    return SEVERITY_ORDER.get(row[2], 5), row[10]
+
+
+def write_csv_stream(out: TextIO, audit_dir: Path, sort: bool = False) -> None:
+    """Write the CSV report while findings are parsed, one row at a time.
+
+    Rows come out in directory order; with ``sort=True`` they are put in the
+    same severity order as write_csv_report via an external merge sort.
+    """
+    rows = (_csv_row(f) for f in iter_findings(audit_dir))
+    if sort:
+        rows = _external_sort(rows, _csv_sort_key)
+    writer = csv.writer(out)
+    writer.writerow(CSV_HEADER)
+    for row in rows:
+        writer.writerow(row)
+
+
+def write_summary_only(out: TextIO, audit_dir: Path, jobs: Optional[int] = None,
+                       stream: bool = False) -> None:
+    """Write only the executive summary, reading just each finding's header.
+
+    Severity counts are tallied as headers are parsed and the key concerns
+    come from a bounded heap, so no full finding list is built or sorted.
+    With ``stream=True`` headers are also parsed one at a time instead of
+    being collected first, keeping memory constant; CVSS statistics are
+    skipped in that mode since percentiles need every score.
+    """
     context = load_audit_context(audit_dir)
-    findings = load_findings(audit_dir)
-    return generate_executive_summary(findings, context)
+    if stream:
+        headers = iter_findings(audit_dir, parse_finding_header)
+    else:
+        headers = parse_finding_files(list_finding_files(audit_dir), jobs, parser=parse_finding_header)
+
+    by_severity = defaultdict(int)
+    total = 0
+    # Only findings carrying CVSS data are kept, and not at all when streaming
+    with_cvss = []
+
+    def tally_severe():
+        """Count every finding and pass critical/high ones on to the heap."""
+        nonlocal total
+        for f in headers:
+            if not f:
+                continue
+            total += 1
+            by_severity[f.severity] += 1
+            if f.cvss and not stream:
+                with_cvss.append(f)
+            if f.severity in ("critical", "high"):
+                yield f
+
+    # nsmallest keeps only a KEY_CONCERNS_LIMIT-sized heap while consuming the stream
+    key_concerns = heapq.nsmallest(
+        KEY_CONCERNS_LIMIT, tally_severe(), key=lambda f: (SEVERITY_ORDER[f.severity], f.file)
+    )
+    cvss = summarize_cvss(with_cvss)
+    if cvss:
+        cvss["unscored"] = total - cvss["scored"]
+    _write_summary(out, context, total, dict(by_severity), key_concerns, cvss)
+
+
+def generate_summary_only(audit_dir: Path, jobs: Optional[int] = None, stream: bool = False) -> str:
+    """Generate only the executive summary for quick review."""
+    return _render(write_summary_only, audit_dir, jobs, stream)
+
+
+DELTA_CATEGORIES = ["new", "regressed", "fixed", "unchanged"]
+
+
+def finding_fingerprint(f, include_id: bool = True) -> str:
+    """Return a stable fingerprint for matching a finding across audit snapshots.
+
+    Combines the normalised ID, CWE, affected file (without line number) and a
+    hash of the whitespace/case-normalised title. With ``include_id=False``
+    the ID is left out, to match findings whose IDs were allocated separately.
+    """
+    location = f.get("location", "").strip().replace("\\", "/")
+    location = re.sub(r'^\./', '', re.sub(r':\d+(?:-\d+)?$', '', location))
+    title = " ".join(f["title"].lower().split())
+    parts = [
+        f["id"].strip().upper() if include_id else "",
+        normalize_cwe(f["cwe"]),
+        location,
+        hashlib.sha1(title.encode("utf-8")).hexdigest()[:12],
+    ]
+    return hashlib.sha1("\x1f".join(parts).encode("utf-8")).hexdigest()[:16]
+
+
+def resolve_audit_dir(path: Path) -> Path:
+    """Accept either a .audit directory or a project root containing one."""
+    path = path.resolve()
+    if (path / "findings").is_dir() or (path / "audit-context.md").exists():
+        return path
+    if (path / ".audit").is_dir():
+        return path / ".audit"
+    return path
+
+
+def load_baseline(path: Path) -> list:
+    """Load baseline findings from a JSON report (or findings list) or an .audit directory.
+
+    A project root stands for the .audit directory inside it. Raises
+    ValueError if the baseline is not valid JSON, not a findings list or
+    report, or a directory holding no audit.
+    """
+    if path.is_dir():
+        audit_dir = resolve_audit_dir(path)
+        if not (audit_dir / "findings").is_dir():
+            raise ValueError(f"{path} is not an .audit directory or a project containing one")
+        return load_findings(audit_dir)
+    with open(path, encoding="utf-8") as fh:
+        try:
+            data = json.load(fh)
+        except ValueError as e:
+            raise ValueError(f"{path} is not valid JSON: {e}") from None
+    if isinstance(data, dict):
+        data = data.get("findings", [])
+    if not isinstance(data, list) or not all(isinstance(d, dict) for d in data):
+        raise ValueError(f"{path} is not a JSON report or list of findings")
+    return [Finding.from_dict(d) for d in data]
+
+
+def _delta_entry(current, baseline=None) -> dict:
+    """Summarise one finding (and its baseline counterpart) for the delta report."""
+    f = current if current is not None else baseline
+    entry = {
+        "fingerprint": finding_fingerprint(f),
+        "id": f["id"],
+        "title": f["title"],
+        "severity": f["severity"],
+        # Baseline findings missing from the current snapshot are reported as removed
+        "status": f["status"] if current is not None else "removed",
+    }
+    if baseline is not None:
+        entry["baseline_status"] = baseline["status"]
+        entry["baseline_severity"] = baseline["severity"]
+    return entry
+
+
+def diff_findings(baseline: list, current: list) -> dict:
+    """Classify findings as new, regressed, fixed or unchanged against a baseline.
+
+    Findings are joined on their fingerprint, then leftovers on their ID (so a
+    retitled or moved finding still matches), using hash maps in O(n).
+    Baseline findings that are gone count as fixed unless they were already
+    resolved in the baseline.
+    """
+    by_fingerprint = defaultdict(list)
+    for b in baseline:
+        by_fingerprint[finding_fingerprint(b)].append(b)
+
+    pairs = []
+    unmatched = []
+    for c in current:
+        candidates = by_fingerprint.get(finding_fingerprint(c))
+        if candidates:
+            pairs.append((c, candidates.pop()))
+        else:
+            unmatched.append(c)
+
+    by_id = defaultdict(list)
+    for candidates in by_fingerprint.values():
+        for b in candidates:
+            by_id[b["id"].strip().upper()].append(b)
+
+    delta = {category: [] for category in DELTA_CATEGORIES}
+    for c in unmatched:
+        candidates = by_id.get(c["id"].strip().upper())
+        if candidates:
+            pairs.append((c, candidates.pop()))
+        else:
+            delta["new"].append(_delta_entry(c))
+
+    for c, b in pairs:
+        was_resolved = b["status"] in RESOLVED_STATUSES
+        is_resolved = c["status"] in RESOLVED_STATUSES
+        if was_resolved and not is_resolved:
+            category = "regressed"
+        elif is_resolved and not was_resolved:
+            category = "fixed"
+        else:
+            category = "unchanged"
+        delta[category].append(_delta_entry(c, b))
+
+    for candidates in by_id.values():
+        for b in candidates:
+            if b["status"] not in RESOLVED_STATUSES:
+                delta["fixed"].append(_delta_entry(None, b))
+
+    for entries in delta.values():
+        entries.sort(key=lambda e: (SEVERITY_ORDER.get(e["severity"], 5), e["id"]))
+    return delta
+
+
+def write_delta_section(out: TextIO, delta: dict) -> None:
+    """Write the audit-to-audit delta section in markdown format."""
+    out.write("## Changes Since Baseline\n\n")
+    out.write("| Change | Count |\n")
+    out.write("|--------|-------|\n")
+    out.write(f"| 🆕 New | {len(delta['new'])} |\n")
+    out.write(f"| 🔁 Regressed | {len(delta['regressed'])} |\n")
+    out.write(f"| ✅ Fixed | {len(delta['fixed'])} |\n")
+    out.write(f"| ➖ Unchanged | {len(delta['unchanged'])} |\n\n")
+
+    for category, heading in (("new", "🆕 New"), ("regressed", "🔁 Regressed"), ("fixed", "✅ Fixed")):
+        entries = delta[category]
+        if not entries:
+            continue
+        out.write(f"### {heading} ({len(entries)})\n\n")
+        out.write("| ID | Title | Severity | Status |\n")
+        out.write("|----|----|----|----|\n")
+        for e in entries:
+            emoji = SEVERITY_EMOJI.get(e["severity"], "⚪")
+            status = e["status"].title()
+            if "baseline_status" in e:
+                status = f"{e['baseline_status'].title()} → {status}"
+            out.write(f"| {e['id']} | {e['title']} | {emoji} {e['severity'].title()} | {status} |\n")
+        out.write("\n")
+
+    changed = [e for e in delta["unchanged"] if e["severity"] != e["baseline_severity"]]
+    if changed:
+        out.write(f"### ↕️ Severity Changes ({len(changed)})\n\n")
+        out.write("| ID | Title | Severity |\n")
+        out.write("|----|----|----|\n")
+        for e in changed:
+            out.write(f"| {e['id']} | {e['title']} | {e['baseline_severity'].title()} → {e['severity'].title()} |\n")
+        out.write("\n")
+
+
+def write_delta_report(out: TextIO, delta: dict, context: dict, baseline: Path) -> None:
+    """Write the delta report in markdown format."""
+    out.write(f"""# Security Audit Delta Report
+
+**Project:** {context.get('project_name', 'Unknown Project')}
+**Baseline:** {baseline}
+**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M')}
+**Framework:** Codebase Security Audit Framework
+
+---
+
+""")
+    write_delta_section(out, delta)
+    out.write("---\n\n*Report generated by Codebase Security Audit Framework*\n")
+
+
+def write_delta_json(out: TextIO, delta: dict, context: dict, baseline: Path) -> None:
+    """Write the delta report in JSON format."""
+    data = {
+        "metadata": {
+            "project_name": context.get("project_name", "Unknown Project"),
+            "baseline": str(baseline),
+            "generated_at": datetime.now().isoformat(),
+            "framework": "Codebase Security Audit Framework",
+            "framework_version": "1.0"
+        },
+        "summary": {category: len(delta[category]) for category in DELTA_CATEGORIES},
+        **delta,
+    }
+    encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+    for chunk in encoder.iterencode(data):
+        out.write(chunk)
+
+
+def _compressor(raw: BinaryIO, compression: str, name: str) -> BinaryIO:
+    """Wrap a binary file in a stream that compresses with ``compression``."""
+    if compression == "gzip":
+        # A fixed mtime and the final file name keep archives reproducible
+        return gzip.GzipFile(filename=name, mode="wb", fileobj=raw, compresslevel=6, mtime=0)
+    return zstandard.ZstdCompressor().stream_writer(raw, closefd=False)
+
+
+def write_output(path: Path, write, newline: Optional[str] = None, binary: bool = False) -> None:
+    """Render ``write`` into a temporary file beside ``path``, then rename it into place.
+
+    Readers polling the directory, and a crash mid-write, only ever see the
+    previous file or the complete new one. ``binary`` hands ``write`` a
+    binary file.
+    """
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        if binary:
+            with open(tmp, "xb", buffering=WRITE_BUFFER_SIZE) as raw:
+                write(raw)
+                raw.flush()
+                os.fsync(raw.fileno())
+        else:
+            with open(tmp, "x", encoding="utf-8", newline=newline,
+                      buffering=WRITE_BUFFER_SIZE) as out:
+                write(out)
+                out.flush()
+                os.fsync(out.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        with suppress(OSError):
+            tmp.unlink()
+        raise
+
+
+def compress_output(source: Path, path: Path, compression: str) -> None:
+    """Compress the finished report ``source`` into ``path`` ("gzip" or "zstd").
+
+    The report is copied rather than rendered again, and ``path`` is
+    replaced atomically like write_output.
+    """
+    def copy(raw: BinaryIO) -> None:
+        with open(source, "rb") as src, _compressor(raw, compression, path.name) as stream:
+            shutil.copyfileobj(src, stream, WRITE_BUFFER_SIZE)
+
+    write_output(path, copy, binary=True)
 
 
 def parse_args() -> argparse.Namespace:
@@ -531,6 +2175,15 @@ Examples:
   %(prog)s /path/to/.audit --format all       Generate all formats
   %(prog)s /path/to/.audit --stdout           Print to stdout only
   %(prog)s /path/to/.audit --summary-only     Generate summary only
+  %(prog)s /path/to/.audit --jobs 0           Parse findings on all CPUs
+  %(prog)s /path/to/.audit -f csv --stream    Stream CSV in constant memory
+  %(prog)s /path/to/.audit -f jsonl --stream  Stream one JSON finding per line
+  %(prog)s /path/to/.audit --format html      Offline HTML report with filters
+  %(prog)s /path/to/.audit -f columnar        Parquet (pyarrow) or .npz (numpy) columns
+  %(prog)s /path/to/.audit -f sarif --stream  SARIF 2.1.0 for code-scanning tools
+  %(prog)s /path/to/.audit --diff old.json    Delta against a baseline report
+  %(prog)s /path/to/.audit --dedupe           List near-duplicate finding clusters
+  %(prog)s /path/to/.audit -f all --compress gzip   Also archive final-report.json.gz
         """
     )
 
@@ -542,9 +2195,9 @@ Examples:
 
     parser.add_argument(
         "--format", "-f",
-        choices=["markdown", "json", "csv", "all"],
+        choices=["markdown", "json", "csv", "jsonl", "html", "columnar", "sarif", "all"],
         default="markdown",
-        help="Output format (default: markdown)"
+        help="Output format (default: markdown); all = markdown, json and csv"
     )
 
     parser.add_argument(
@@ -565,7 +2218,144 @@ Examples:
         help="Generate executive summary only"
     )
 
-    return parser.parse_args()
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Parse findings on N worker processes (0 = one per CPU; "
+             f"directories under {PARALLEL_THRESHOLD} files are parsed serially)"
+    )
+
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Constant-memory mode for --format csv, jsonl, sarif and --summary-only: "
+             "parse and write findings one at a time (directory order)"
+    )
+
+    parser.add_argument(
+        "--sorted",
+        action="store_true",
+        help="With --stream, sort CSV rows by severity using an on-disk merge sort"
+    )
+
+    parser.add_argument(
+        "--diff",
+        type=Path,
+        metavar="BASELINE",
+        help="Write a delta report (new/fixed/regressed/unchanged) against a previous "
+             "final-report.json, .audit directory or project root"
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Reparse every finding instead of reusing {CACHE_DIR}/{CACHE_FILE}"
+    )
+
+    parser.add_argument(
+        "--template",
+        type=Path,
+        metavar="FILE",
+        help="Render the markdown report through a template (start from "
+             "skill/templates/final-report.md.tmpl)"
+    )
+
+    parser.add_argument(
+        "--dedupe",
+        action="store_true",
+        help="Cluster near-duplicate findings (similar title and description, same CWE) "
+             "and list the clusters in the markdown and JSON reports"
+    )
+
+    parser.add_argument(
+        "--collapse-duplicates",
+        action="store_true",
+        help="With --dedupe (implied), keep only each cluster's representative (unresolved, "
+             "most severe, lowest ID) in every output"
+    )
+
+    parser.add_argument(
+        "--compress",
+        choices=sorted(COMPRESSION_SUFFIXES),
+        help="Also write a compressed copy of the JSON or JSONL output for archival "
+             "(zstd needs the zstandard package)"
+    )
+
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print per-stage wall time, calls, bytes and peak traced memory to stderr "
+             "(tracemalloc slows the run; per-file stages run in workers with --jobs > 1 "
+             "are only counted as a whole)"
+    )
+
+    parser.add_argument(
+        "--profile-json",
+        type=Path,
+        metavar="FILE",
+        help="Write the profile trace as JSON to FILE (implies --profile)"
+    )
+
+    args = parser.parse_args()
+    if args.profile_json:
+        args.profile = True
+    if args.collapse_duplicates:
+        args.dedupe = True
+    if args.stream and not (args.summary_only or args.format in ("csv", "jsonl", "sarif")):
+        parser.error("--stream only supports --format csv, jsonl, sarif and --summary-only")
+    if args.sorted and not args.stream:
+        parser.error("--sorted requires --stream")
+    if args.diff and (args.summary_only or args.stream or args.format in ("csv", "jsonl", "html", "columnar", "sarif")):
+        parser.error("--diff supports --format markdown, json or all only")
+    if args.dedupe and (args.summary_only or args.stream or args.diff):
+        parser.error("--dedupe and --collapse-duplicates need the full report "
+                     "(not --summary-only, --stream or --diff)")
+    if args.template and (args.format != "markdown" or args.summary_only or args.diff):
+        parser.error("--template only applies to the full markdown report")
+    if args.format == "html" and args.stdout:
+        parser.error("--format html writes a page and its data directory; it cannot use --stdout")
+    if args.format == "columnar":
+        if args.stdout:
+            parser.error("--format columnar writes a binary file; it cannot use --stdout")
+        if columnar.available_backend() is None:
+            parser.error("--format columnar requires pyarrow (Parquet) or numpy (.npz): "
+                         "pip install pyarrow")
+    if args.compress and (args.stdout or args.summary_only or args.stream
+                          or args.format not in ("json", "jsonl", "all")):
+        parser.error("--compress requires --format json, jsonl or all, written to files")
+    if args.compress == "zstd" and zstandard is None:
+        parser.error("--compress zstd requires the zstandard package (pip install zstandard)")
+    return args
+
+
+def _read_size(result) -> int:
+    """Byte size of what a "read" stage function returned (text, or read_finding_file's tuple)."""
+    text = result[0] if isinstance(result, tuple) else result
+    return len(text.encode("utf-8"))
+
+
+def _start_profiler() -> Profiler:
+    """Start a Profiler with the PROFILE_STAGES of this module instrumented."""
+    profiler = Profiler()
+    profiler.start()
+    profiler.instrument(sys.modules[__name__], PROFILE_STAGES,
+                        sizes={"read": _read_size})
+    profiler.instrument(FindingsCache, {"cache": ["entries", "sync"]})
+    profiler.instrument(FindingGroups, {"aggregate": ["__init__", "controls"]})
+    return profiler
+
+
+def _finish_profiler(profiler: Profiler, trace: Optional[Path]) -> None:
+    """Stop the profiler, print its table to stderr and write the optional JSON trace."""
+    profiler.stop()
+    print(file=sys.stderr)
+    profiler.write_table(sys.stderr)
+    if trace:
+        with open(trace, "w", encoding="utf-8") as out:
+            profiler.write_json(out)
+        print(f"Profile trace: {trace}", file=sys.stderr)
 
 
 def main():
@@ -576,35 +2366,138 @@ def main():
         print(f"Error: Audit directory does not exist: {audit_dir}", file=sys.stderr)
         sys.exit(1)
 
-    outputs = []
-
-    if args.summary_only:
-        content = generate_summary_only(audit_dir)
-        outputs.append(("summary.md", content))
-    elif args.format == "all":
-        outputs.append(("final-report.md", generate_report(audit_dir)))
-        outputs.append(("final-report.json", generate_json_report(audit_dir)))
-        outputs.append(("findings.csv", generate_csv_report(audit_dir)))
-    elif args.format == "json":
-        outputs.append(("final-report.json", generate_json_report(audit_dir)))
-    elif args.format == "csv":
-        outputs.append(("findings.csv", generate_csv_report(audit_dir)))
-    else:  # markdown
-        outputs.append(("final-report.md", generate_report(audit_dir)))
-
-    for filename, content in outputs:
-        if args.stdout:
-            print(content)
-            if len(outputs) > 1:
-                print("\n" + "=" * 60 + "\n")
-        else:
-            if args.output and len(outputs) == 1:
-                output_path = args.output
-            else:
-                output_path = audit_dir / filename
+    profiler = _start_profiler() if args.profile else None
 
-            output_path.write_text(content, encoding='utf-8')
-            print(f"Generated: {output_path}")
+    def phase(name: str, size=None):
+        """Time a top-level stage when profiling."""
+        return profiler.phase(name, size) if profiler else nullcontext()
+
+    # Every writer of a non-streaming run shares one read of each finding's body
+    bodies = nullcontext() if args.summary_only or args.stream else cached_bodies()
+    try:
+        with bodies:
+            if args.summary_only:
+                outputs = [("summary.md", partial(write_summary_only, audit_dir=audit_dir, jobs=args.jobs,
+                                                  stream=args.stream))]
+            elif args.stream and args.format == "jsonl":
+                outputs = [(OUTPUT_FILES["jsonl"], partial(write_jsonl_report, findings=iter_findings(audit_dir)))]
+            elif args.stream and args.format == "sarif":
+                outputs = [(OUTPUT_FILES["sarif"], partial(write_sarif_report, findings=iter_findings(audit_dir)))]
+            elif args.stream:
+                outputs = [(OUTPUT_FILES["csv"], partial(write_csv_stream, audit_dir=audit_dir, sort=args.sorted))]
+            elif args.diff:
+                if not args.diff.exists():
+                    print(f"Error: Baseline does not exist: {args.diff}", file=sys.stderr)
+                    sys.exit(1)
+                with phase("load"):
+                    context = load_audit_context(audit_dir)
+                    findings = load_findings(audit_dir, args.jobs, cache=not args.no_cache)
+                with phase("diff"):
+                    try:
+                        baseline = load_baseline(args.diff)
+                    except (OSError, ValueError) as e:
+                        print(f"Error: Cannot read baseline: {e}", file=sys.stderr)
+                        sys.exit(1)
+                    delta = diff_findings(baseline, findings)
+                writers = {
+                    "markdown": partial(write_delta_report, delta=delta, context=context, baseline=args.diff),
+                    "json": partial(write_delta_json, delta=delta, context=context, baseline=args.diff),
+                }
+                formats = list(writers) if args.format == "all" else [args.format]
+                outputs = [(DELTA_OUTPUT_FILES[fmt], writers[fmt]) for fmt in formats]
+            else:
+                with phase("load"):
+                    context = load_audit_context(audit_dir)
+                    findings = load_findings(audit_dir, args.jobs, cache=not args.no_cache)
+                    if not args.no_cache:
+                        # Reuse the compiled compliance index across runs until the mapping changes
+                        load_compliance_index(cache_dir=audit_dir / CACHE_DIR)
+                v4 = unscored_v4(findings)
+                if v4:
+                    print(f"Warning: {len(v4)} finding(s) have a CVSS v4.0 vector but no numeric score and are "
+                          f"not counted in CVSS statistics ({', '.join(v4[:10])}"
+                          f"{', ...' if len(v4) > 10 else ''})", file=sys.stderr)
+                duplicates = cluster_duplicates(findings, args.jobs) if args.dedupe else None
+                if args.collapse_duplicates:
+                    findings = collapse_duplicates(findings, duplicates)
+                dedupe_args = {"duplicates": duplicates, "collapsed": args.collapse_duplicates}
+                writers = {
+                    "markdown": partial(write_markdown_report, findings=findings, context=context, **dedupe_args),
+                    "json": partial(write_json_report, findings=findings, context=context, **dedupe_args),
+                    "csv": partial(write_csv_report, findings=findings),
+                    "jsonl": partial(write_jsonl_report, findings=findings),
+                    "sarif": partial(write_sarif_report, findings=findings),
+                }
+                template_cache = None if args.no_cache else audit_dir / CACHE_DIR
+                if args.template:
+                    try:
+                        template = load_template(args.template, template_cache)
+                    except (OSError, TemplateError) as e:
+                        print(f"Error: Cannot load template: {e}", file=sys.stderr)
+                        sys.exit(1)
+                    writers["markdown"] = partial(write_template_report, findings=findings, context=context,
+                                                  template=template, duplicates=duplicates)
+                filenames = dict(OUTPUT_FILES)
+                if args.format == "columnar":
+                    backend = columnar.available_backend()
+                    filenames["columnar"] = columnar.OUTPUT_FILES[backend]
+                    writers["columnar"] = partial(write_columnar_report, findings=findings, backend=backend)
+                if args.format == "html":
+                    # Reuse the compiled page template across runs until it changes
+                    load_template(HTML_TEMPLATE, template_cache)
+                    output_dir = args.output.resolve().parent if args.output else audit_dir
+                    writers["html"] = partial(write_html_report, findings=findings, context=context,
+                                              data_dir=output_dir / HTML_DATA_DIR)
+                formats = ALL_FORMATS if args.format == "all" else [args.format]
+                outputs = [(filenames[fmt], writers[fmt]) for fmt in formats]
+            if profiler and not (args.summary_only or args.stream):
+                profiler.findings = len(findings)
+
+            if args.stdout:
+                for filename, write in outputs:
+                    with phase(f"write {filename}"):
+                        write(sys.stdout)
+                    print()
+                    if len(outputs) > 1:
+                        print("\n" + "=" * 60 + "\n")
+                return
+
+            targets = []
+            # (name, finished report, archive): compressed once the reports are written
+            archives = []
+            for filename, write in outputs:
+                if args.output and len(outputs) == 1:
+                    output_path = args.output
+                else:
+                    output_path = audit_dir / filename
+                # csv.writer emits its own \r\n line endings
+                newline = "" if filename.endswith(".csv") else None
+                binary = filename in columnar.OUTPUT_FILES.values()
+                targets.append((filename, output_path, partial(write_output, output_path, write, newline,
+                                                               binary=binary)))
+                if args.compress and filename.endswith((".json", ".jsonl")):
+                    suffix = COMPRESSION_SUFFIXES[args.compress]
+                    archives.append((filename + suffix, output_path,
+                                     output_path.with_name(output_path.name + suffix)))
+
+            if profiler or len(targets) == 1:
+                # Profiler stages are not thread-aware, so profiled runs write one at a time
+                for filename, output_path, render in targets:
+                    with phase(f"write {filename}", size=lambda: output_path.stat().st_size):
+                        render()
+            else:
+                with ThreadPoolExecutor(max_workers=len(targets)) as pool:
+                    futures = [pool.submit(render) for _, _, render in targets]
+                for future in futures:
+                    future.result()
+            for filename, source, archive in archives:
+                with phase(f"write {filename}", size=lambda: archive.stat().st_size):
+                    compress_output(source, archive, args.compress)
+            for output_path in [path for _, path, _ in targets] + [archive for _, _, archive in archives]:
+                print(f"Generated: {output_path}")
+    finally:
+        if profiler:
+            _finish_profiler(profiler, args.profile_json)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,700 @@
+#!/usr/bin/env python3
+"""
+Findings Import Script
+
+Writes findings into a .audit/findings/ directory from either:
+
+- a JSON Lines export written by ``generate_report.py --format jsonl``,
+  rebuilding each finding as it was exported, or
+- scanner output: SARIF 2.1.0 from any tool, or the native JSON reports of
+  Semgrep, Bandit, Gitleaks and Trivy. Each result is mapped to a CWE,
+  OWASP Top 10 2021 category and audit phase, given the next free ID for
+  that phase's prefix (e.g. API-004) and skipped if a finding with the
+  same fingerprint (CWE, affected file and title) already exists, so
+  re-importing a later scan only adds what is new.
+
+Inputs are read incrementally, a line or a scanner result at a time, so
+reports of hundreds of megabytes are never held in memory. The input type
+is detected from the content. Findings are written in the
+templates/finding-template.md layout and pass validate_finding.py.
+
+Usage:
+    python import_findings.py /path/to/.audit SOURCE [options]
+
+    SOURCE is a file (optionally gzip-compressed, ending in .gz) or - for stdin.
+
+Options:
+    --clean            Remove existing finding files before importing
+    --no-cache         Ignore the parsed-findings cache in .audit/.cache/ when
+                       matching scanner results against existing findings
+
+Examples:
+    python import_findings.py restored/.audit findings.jsonl
+    python import_findings.py restored/.audit findings.jsonl.gz --clean
+    zcat export.jsonl.gz | python import_findings.py restored/.audit -
+    python import_findings.py .audit semgrep.sarif
+    trivy image --format json app:latest | python import_findings.py .audit -
+
+Output:
+    Writes one markdown file per finding to the findings directory and
+    reports how many were imported and how many duplicates or unrecognised
+    records were skipped
+"""
+
+import argparse
+import gzip
+import io
+import json
+import re
+import sys
+from datetime import date
+from pathlib import Path
+from typing import Iterator, Optional, TextIO
+from urllib.parse import unquote
+
+from cwe_catalog import OWASP_2021, load_catalog
+from generate_report import Finding, finding_fingerprint, load_findings
+from jsonstream import JsonStream, JsonStreamError
+from validate_finding import PHASES
+
+
+# Characters allowed in generated finding file names
+UNSAFE_FILENAME = re.compile(r'[^A-Za-z0-9._-]+')
+
+# Classification table rows, in template order: (label, finding field)
+TABLE_FIELDS = [
+    ("ID", "id"),
+    ("Title", "title"),
+    ("Phase", "phase"),
+    ("Severity", "severity"),
+    ("CVSS Score", "cvss"),
+    ("CWE", "cwe"),
+    ("OWASP", "owasp"),
+    ("Status", "status"),
+]
+
+# A JSON Lines export starts with a finding or summary record
+JSONL_START = re.compile(rb'^\s*\{\s*"record"\s*:')
+
+ID_PATTERN = re.compile(r'^([A-Z]+)-(\d+)$')
+CWE_TAG = re.compile(r'CWE[-_/ ]?(\d+)', re.IGNORECASE)
+OWASP_TAG = re.compile(r'\bA(0[1-9]|10):2021\b', re.IGNORECASE)
+
+# Primary phase of each OWASP category (compliance/compliance-mapping.md)
+OWASP_PHASES = {
+    "A01": 2, "A02": 5, "A03": 3, "A04": 4, "A05": 7,
+    "A06": 0, "A07": 1, "A08": 7, "A09": 9, "A10": 3,
+}
+
+# CWEs owned by a more specific phase than their OWASP category's
+CWE_PHASES = {79: 6, 80: 6, 1021: 6, 259: 8, 321: 8, 798: 8, 209: 10, 754: 10, 755: 10}
+
+# Phase for findings with no CWE or OWASP category to go by
+DEFAULT_PHASE = 11
+
+# Scanner severities and SARIF levels -> finding severity
+SEVERITY_ALIASES = {
+    "critical": "critical",
+    "high": "high",
+    "error": "high",
+    "medium": "medium",
+    "moderate": "medium",
+    "warning": "medium",
+    "low": "low",
+    "note": "low",
+    "info": "info",
+    "informational": "info",
+    "none": "info",
+    "unknown": "info",
+}
+
+TITLE_LIMIT = 100
+
+SECRET_IMPACT = ("Anyone with read access to the repository or its history can use the credential "
+                 "until it is revoked.")
+SECRET_RECOMMENDATION = ("Revoke and rotate the credential, purge it from the repository history, "
+                         "and load it from a secret manager or the environment at runtime.")
+
+
+def read_jsonl(source: TextIO, errors: list = None) -> Iterator[Finding]:
+    """Yield findings from a JSON Lines stream, one line at a time.
+
+    Blank lines and non-finding records (the trailing summary) are skipped.
+    Malformed lines are skipped too; their line numbers are appended to
+    ``errors`` when a list is given.
+    """
+    for number, line in enumerate(source, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            record = None
+        if not isinstance(record, dict):
+            if errors is not None:
+                errors.append(number)
+            continue
+        if record.get("record", "finding") != "finding":
+            continue
+        yield Finding.from_dict({k: str(v) if v is not None else "" for k, v in record.items()})
+
+
+def _cell(value: str) -> str:
+    """Flatten a value into a single markdown table cell."""
+    return " ".join(value.replace("|", "/").split())
+
+
+def render_finding(finding) -> str:
+    """Render a finding (a Finding or a scanner record) in the finding-template.md layout.
+
+    Metadata values are flattened to one line (``|`` becomes ``/``), and
+    empty fields and sections are left out. Scanner records may also carry
+    ``summary``, ``rule``, ``snippet``, ``references`` and ``tool``.
+    """
+    title = _cell(finding["title"]) or "Untitled Finding"
+    heading = f"[{_cell(finding['id'])}] {title}" if finding["id"] else title
+    lines = [f"# {heading}", "", "## Classification", "", "| Attribute | Value |", "|-----------|-------|"]
+    for label, field in TABLE_FIELDS:
+        value = _cell(finding[field])
+        if not value:
+            continue
+        if field in ("severity", "status"):
+            value = value.title()
+        lines.append(f"| **{label}** | {value} |")
+
+    if finding.get("summary"):
+        lines += ["", "## Summary", "", finding["summary"].strip()]
+
+    details = []
+    if finding["location"]:
+        # Ahead of the description, so it wins over any location quoted there
+        details.append(f"- **File(s):** `{_cell(finding['location'])}`")
+    if finding.get("rule"):
+        details.append(f"- **Rule:** `{_cell(finding['rule'])}`")
+    if details:
+        details = ["### Affected Component(s)"] + details
+    if finding["description"].strip():
+        details += ["", "### Description", finding["description"].strip()]
+    if finding.get("snippet"):
+        details += ["", "### Evidence", "```", finding["snippet"].rstrip("\n"), "```"]
+    if details:
+        lines += ["", "## Technical Details", ""] + (details[1:] if details[0] == "" else details)
+
+    for heading, field in (("Impact", "impact"), ("Recommendation", "recommendation")):
+        text = finding[field].strip()
+        if text:
+            lines += ["", f"## {heading}", text]
+
+    if finding.get("references"):
+        lines += ["", "## References", ""] + [f"- {ref}" for ref in finding["references"]]
+    if finding.get("tool"):
+        rule = f" rule `{_cell(finding['rule'])}`" if finding.get("rule") else ""
+        lines += ["", "## Audit Notes", "", "| Date | Action | By |", "|------|--------|----|",
+                  f"| {date.today().isoformat()} | Imported from {_cell(finding['tool'])}{rule} | import_findings.py |"]
+    return "\n".join(lines) + "\n"
+
+
+def finding_filename(finding: Finding) -> str:
+    """Choose a safe file name: the recorded file name, else one derived from the ID."""
+    name = Path(finding.file).name if finding.file.endswith(".md") else f"{finding.id or 'finding'}.md"
+    name = UNSAFE_FILENAME.sub("-", name).lstrip(".-")
+    return name if name != ".md" and name else "finding.md"
+
+
+def import_findings(findings, findings_dir: Path) -> int:
+    """Write each finding to ``findings_dir`` and return the number written."""
+    findings_dir.mkdir(parents=True, exist_ok=True)
+    count = 0
+    for finding in findings:
+        path = findings_dir / finding_filename(finding)
+        path.write_text(render_finding(finding), encoding="utf-8")
+        count += 1
+    return count
+
+
+def _text(value) -> str:
+    """Plain text of a string or a SARIF message object."""
+    if isinstance(value, dict):
+        value = value.get("text") or value.get("markdown") or ""
+    return str(value).strip() if value else ""
+
+
+def _title(text: str, fallback: str) -> str:
+    """First sentence of ``text`` (at most TITLE_LIMIT characters), else ``fallback``."""
+    first = re.split(r'(?<=[.!?])\s|\n', text.strip(), maxsplit=1)[0].rstrip(".") if text else ""
+    first = first or fallback
+    return first if len(first) <= TITLE_LIMIT else first[:TITLE_LIMIT - 3].rstrip() + "..."
+
+
+def _severity(value) -> str:
+    return SEVERITY_ALIASES.get(str(value or "").strip().lower(), "medium")
+
+
+def _score_severity(score) -> Optional[str]:
+    """Severity for a numeric CVSS-style score (SARIF ``security-severity``), None if not numeric."""
+    try:
+        score = float(score)
+    except (TypeError, ValueError):
+        return None
+    if score >= 9.0:
+        return "critical"
+    if score >= 7.0:
+        return "high"
+    if score >= 4.0:
+        return "medium"
+    return "low" if score > 0 else "info"
+
+
+def _cwe(values) -> str:
+    """First CWE referenced by a string, number or list of them, as ``CWE-N``."""
+    if isinstance(values, (str, int)):
+        values = [values]
+    for value in values or ():
+        if isinstance(value, int):
+            return f"CWE-{value}"
+        match = CWE_TAG.search(str(value))
+        if match:
+            return f"CWE-{int(match.group(1))}"
+    return ""
+
+
+def _owasp(values) -> str:
+    """First OWASP Top 10 2021 category referenced by a string or list of strings."""
+    if isinstance(values, str):
+        values = [values]
+    for value in values or ():
+        match = OWASP_TAG.search(str(value))
+        if match:
+            code = f"A{match.group(1)}"
+            return f"{code}:2021 - {OWASP_2021[code]}"
+    return ""
+
+
+def scan_record(tool: str, **fields) -> dict:
+    """Build a scanner record: a finding dict plus scanner extras, with defaults filled in."""
+    record = {
+        "file": "", "id": "", "title": "", "severity": "medium", "phase": "", "status": "open",
+        "owasp": "", "cwe": "", "description": "", "impact": "", "recommendation": "",
+        "location": "", "cvss": "", "summary": "", "rule": "", "snippet": "", "references": [],
+        "tool": tool, "default_phase": None,
+    }
+    record.update(fields)
+    record["references"] = [ref for ref in dict.fromkeys(record["references"]) if ref]
+    return record
+
+
+def classify(record: dict) -> int:
+    """Fill in the OWASP category and phase of a scanner record; return the phase number.
+
+    The phase is the scanner's own (e.g. Phase 8 for secret scanners),
+    else the CWE's owning phase, else the OWASP category's primary phase,
+    else DEFAULT_PHASE.
+    """
+    match = CWE_TAG.search(record["cwe"])
+    cwe = int(match.group(1)) if match else None
+    if record["owasp"]:
+        code = record["owasp"][:3].upper()
+    else:
+        code = load_catalog(fallback=True).owasp(cwe) if cwe else None
+    if not record["owasp"] and code:
+        record["owasp"] = f"{code}:2021 - {OWASP_2021[code]}"
+    phase = record["default_phase"]
+    if phase is None:
+        phase = CWE_PHASES.get(cwe, OWASP_PHASES.get(code, DEFAULT_PHASE))
+    record["phase"] = f"Phase {phase} - {PHASES[phase][1]}"
+    return phase
+
+
+def _sarif_location(result: dict) -> tuple:
+    """Return (``path:line``, snippet) of a SARIF result's first physical location."""
+    for location in result.get("locations") or ():
+        physical = location.get("physicalLocation") or {}
+        uri = unquote((physical.get("artifactLocation") or {}).get("uri", ""))
+        if uri.startswith("file://"):
+            uri = uri[len("file://"):]
+        region = physical.get("region") or {}
+        line = region.get("startLine")
+        snippet = _text(region.get("snippet"))
+        if uri:
+            return (f"{uri}:{line}" if line else uri), snippet
+    return "", ""
+
+
+def from_sarif(result: dict, tool: str, rules: dict, rule_list: list) -> dict:
+    """Convert a SARIF result, given its run's rules by ID and by index."""
+    rule_id = result.get("ruleId") or (result.get("rule") or {}).get("id", "")
+    rule = rules.get(rule_id)
+    if rule is None and isinstance(result.get("ruleIndex"), int) and result["ruleIndex"] < len(rule_list):
+        rule = rule_list[result["ruleIndex"]]
+        rule_id = rule_id or rule.get("id", "")
+    rule = rule or {}
+    properties = {**(rule.get("properties") or {}), **(result.get("properties") or {})}
+    tags = list(properties.get("tags") or ()) + [properties.get("cwe", "")]
+
+    level = result.get("level") or (rule.get("defaultConfiguration") or {}).get("level", "warning")
+    message = _text(result.get("message"))
+    description = _text(rule.get("fullDescription")) or _text(rule.get("help")) or message
+    location, snippet = _sarif_location(result)
+    return scan_record(
+        tool,
+        title=_title(_text(rule.get("shortDescription")) or message, rule.get("name") or rule_id),
+        severity=_score_severity(properties.get("security-severity")) or _severity(level),
+        cwe=_cwe(tags),
+        owasp=_owasp(tags),
+        summary=message,
+        description=description,
+        recommendation=_text(rule.get("help")) if _text(rule.get("help")) != description else "",
+        location=location,
+        rule=rule_id,
+        snippet=snippet,
+        references=[rule.get("helpUri", "")],
+    )
+
+
+def from_semgrep(result: dict) -> dict:
+    """Convert a result from Semgrep's native JSON output."""
+    extra = result.get("extra") or {}
+    metadata = extra.get("metadata") or {}
+    message = _text(extra.get("message"))
+    line = (result.get("start") or {}).get("line")
+    path = result.get("path", "")
+    references = metadata.get("references") or []
+    return scan_record(
+        "Semgrep",
+        title=_title(message, result.get("check_id", "")),
+        severity=_severity(extra.get("severity")),
+        cwe=_cwe(metadata.get("cwe")),
+        owasp=_owasp(metadata.get("owasp")),
+        description=message,
+        recommendation=f"Suggested fix: `{extra['fix']}`" if extra.get("fix") else "",
+        location=f"{path}:{line}" if path and line else path,
+        rule=result.get("check_id", ""),
+        snippet="" if extra.get("lines") == "requires login" else extra.get("lines", ""),
+        references=[references] if isinstance(references, str) else list(references),
+    )
+
+
+def from_bandit(result: dict) -> dict:
+    """Convert a result from Bandit's JSON output."""
+    cwe = result.get("issue_cwe") or {}
+    name = result.get("test_name", "").replace("_", " ").strip()
+    path = result.get("filename", "")
+    line = result.get("line_number")
+    return scan_record(
+        "Bandit",
+        title=_title(name.capitalize(), result.get("test_id", "")),
+        severity=_severity(result.get("issue_severity")),
+        cwe=_cwe(cwe.get("id")),
+        description=_text(result.get("issue_text")),
+        location=f"{path}:{line}" if path and line else path,
+        rule=" ".join(filter(None, (result.get("test_id"), result.get("test_name")))),
+        snippet=result.get("code", ""),
+        references=[result.get("more_info", ""), cwe.get("link", "")],
+    )
+
+
+def from_gitleaks(leak: dict) -> dict:
+    """Convert a leak from Gitleaks' JSON report; the secret itself is never written."""
+    kind = leak.get("Description") or leak.get("RuleID") or "credential"
+    path = leak.get("File", "")
+    line = leak.get("StartLine")
+    commit = f" (commit {leak['Commit'][:12]})" if leak.get("Commit") else ""
+    snippet = leak.get("Match", "")
+    if leak.get("Secret"):
+        snippet = snippet.replace(leak["Secret"], "[REDACTED]")
+    return scan_record(
+        "Gitleaks",
+        title=f"Hard-coded secret: {kind}",
+        severity="high",
+        cwe="CWE-798",
+        description=f"A secret ({kind}) is committed in `{path or 'the repository'}`{commit}.",
+        impact=SECRET_IMPACT,
+        recommendation=SECRET_RECOMMENDATION,
+        location=f"{path}:{line}" if path and line else path,
+        rule=leak.get("RuleID", ""),
+        snippet=snippet,
+        default_phase=8,
+    )
+
+
+def from_trivy(target: dict, kind: str, item: dict) -> dict:
+    """Convert a Trivy vulnerability, misconfiguration or secret of a scan target."""
+    where = target.get("Target", "")
+    references = [item.get("PrimaryURL", "")] + list(item.get("References") or ())
+    if kind == "Vulnerabilities":
+        package = f"{item.get('PkgName', '')} {item.get('InstalledVersion', '')}".strip()
+        fixed = item.get("FixedVersion")
+        return scan_record(
+            "Trivy",
+            title=f"{item.get('VulnerabilityID', 'Vulnerability')} in {package}",
+            severity=_severity(item.get("Severity")),
+            cwe=_cwe(item.get("CweIDs")),
+            owasp=_owasp("A06:2021"),
+            summary=_text(item.get("Title")),
+            description=_text(item.get("Description")),
+            recommendation=f"Upgrade {item.get('PkgName')} to {fixed} or later." if fixed else "",
+            location=where,
+            rule=item.get("VulnerabilityID", ""),
+            references=references,
+            default_phase=0,
+        )
+    line = (item.get("CauseMetadata") or {}).get("StartLine") or item.get("StartLine")
+    location = f"{where}:{line}" if where and line else where
+    if kind == "Secrets":
+        return scan_record(
+            "Trivy",
+            title=f"Hard-coded secret: {item.get('Title') or item.get('RuleID', 'credential')}",
+            severity=_severity(item.get("Severity")),
+            cwe="CWE-798",
+            description=f"A secret ({item.get('Category') or 'credential'}) is committed in `{where}`.",
+            impact=SECRET_IMPACT,
+            recommendation=SECRET_RECOMMENDATION,
+            location=location,
+            rule=item.get("RuleID", ""),
+            snippet=item.get("Match", ""),
+            default_phase=8,
+        )
+    return scan_record(
+        "Trivy",
+        title=_title(_text(item.get("Title")), item.get("ID", "")),
+        severity=_severity(item.get("Severity")),
+        owasp=_owasp("A05:2021"),
+        summary=_text(item.get("Message")),
+        description=_text(item.get("Description")),
+        recommendation=_text(item.get("Resolution")),
+        location=location,
+        rule=item.get("AVDID") or item.get("ID", ""),
+        references=references,
+        default_phase=7,
+    )
+
+
+def _read_sarif_run(stream: JsonStream, errors: Optional[list]) -> Iterator[dict]:
+    """Yield records from one SARIF run.
+
+    Rule metadata comes from the run's ``tool``, which producers write
+    before ``results``; results that precede it are converted from their
+    own properties alone.
+    """
+    tool, rules, rule_list = "SARIF", {}, []
+    for key in stream.members():
+        if key == "tool":
+            component = stream.value() or {}
+            driver = component.get("driver") or {}
+            tool = driver.get("name") or tool
+            rule_list = list(driver.get("rules") or ())
+            for extension in component.get("extensions") or ():
+                rule_list += extension.get("rules") or ()
+            rules = {rule["id"]: rule for rule in rule_list if rule.get("id")}
+        elif key == "results":
+            for _ in stream.items():
+                offset = stream.offset
+                result = stream.value()
+                if isinstance(result, dict):
+                    yield from_sarif(result, tool, rules, rule_list)
+                elif errors is not None:
+                    errors.append(offset)
+
+
+def _read_trivy_target(stream: JsonStream, errors: Optional[list]) -> Iterator[dict]:
+    """Yield records from one entry of a Trivy report's ``Results``."""
+    target = {}
+    for key in stream.members():
+        if key in ("Vulnerabilities", "Misconfigurations", "Secrets"):
+            for _ in stream.items():
+                offset = stream.offset
+                item = stream.value()
+                if not isinstance(item, dict):
+                    if errors is not None:
+                        errors.append(offset)
+                elif item.get("Status", "FAIL") == "FAIL":
+                    yield from_trivy(target, key, item)
+        elif key in ("Target", "Class", "Type"):
+            target[key] = stream.value()
+
+
+def read_scan(source: TextIO, errors: list = None) -> Iterator[dict]:
+    """Yield scanner records from SARIF, Semgrep, Bandit, Gitleaks or Trivy JSON.
+
+    The format is recognised from the document's shape: a top-level array
+    is a Gitleaks report, ``runs`` is SARIF, ``Results`` is Trivy, and
+    ``results`` entries with ``check_id`` or ``test_id`` are Semgrep or
+    Bandit. Unrecognised results are skipped; their document offsets are
+    appended to ``errors`` when a list is given. Raises JsonStreamError
+    if the document is not valid JSON.
+    """
+    stream = JsonStream(source)
+    if stream.peek() == "[":
+        for _ in stream.items():
+            offset = stream.offset
+            leak = stream.value()
+            if isinstance(leak, dict):
+                yield from_gitleaks(leak)
+            elif errors is not None:
+                errors.append(offset)
+        return
+
+    for key in stream.members():
+        if key == "runs":
+            for _ in stream.items():
+                yield from _read_sarif_run(stream, errors)
+        elif key == "Results":
+            for _ in stream.items():
+                yield from _read_trivy_target(stream, errors)
+        elif key == "results":
+            for _ in stream.items():
+                offset = stream.offset
+                result = stream.value()
+                if isinstance(result, dict) and "check_id" in result:
+                    yield from_semgrep(result)
+                elif isinstance(result, dict) and "test_id" in result:
+                    yield from_bandit(result)
+                elif errors is not None:
+                    errors.append(offset)
+
+
+def existing_findings(findings_dir: Path, cache: bool = True) -> tuple:
+    """Return (ID-less fingerprints, highest ID number per prefix) of the findings on disk.
+
+    With ``cache=True`` unchanged files are served from generate_report's
+    FindingsCache, so repeated imports into a large audit stay cheap.
+    """
+    fingerprints = set()
+    numbers = {}
+    for finding in load_findings(findings_dir.parent, cache=cache):
+        fingerprints.add(finding_fingerprint(finding, include_id=False))
+        match = ID_PATTERN.match(finding.id.strip().upper())
+        if match:
+            prefix, number = match.group(1), int(match.group(2))
+            numbers[prefix] = max(numbers.get(prefix, 0), number)
+    return fingerprints, numbers
+
+
+def import_scan(records, findings_dir: Path, cache: bool = True) -> dict:
+    """Classify, deduplicate and write scanner records; return imported/duplicate counts.
+
+    Each new finding gets the next ID for its phase's prefix and is written
+    as ``<prefix>-<number>.md``. Records matching a finding already on disk,
+    or one imported earlier in the same run, are counted as duplicates.
+    """
+    fingerprints, numbers = existing_findings(findings_dir, cache)
+    findings_dir.mkdir(parents=True, exist_ok=True)
+    counts = {"imported": 0, "duplicates": 0}
+    for record in records:
+        phase = classify(record)
+        fingerprint = finding_fingerprint(record, include_id=False)
+        if fingerprint in fingerprints:
+            counts["duplicates"] += 1
+            continue
+        fingerprints.add(fingerprint)
+
+        prefix = PHASES[phase][0]
+        number = numbers.get(prefix, 0) + 1
+        while (findings_dir / f"{prefix.lower()}-{number:03d}.md").exists():
+            number += 1
+        numbers[prefix] = number
+        record["id"] = f"{prefix}-{number:03d}"
+        record["file"] = f"{prefix.lower()}-{number:03d}.md"
+        (findings_dir / record["file"]).write_text(render_finding(record), encoding="utf-8")
+        counts["imported"] += 1
+    return counts
+
+
+def open_source(source: str) -> tuple:
+    """Open a source (a path, a .gz path or - for stdin) and detect its kind.
+
+    Returns ``(text stream, kind)`` where kind is "jsonl" for a JSON Lines
+    export and "scan" for scanner output.
+    """
+    if source == "-":
+        raw = sys.stdin.buffer
+    elif source.endswith(".gz"):
+        raw = gzip.open(source, "rb")
+    else:
+        raw = open(source, "rb")
+    head = raw.peek(64).lstrip(b"\xef\xbb\xbf")
+    kind = "jsonl" if JSONL_START.match(head) else "scan"
+    return io.TextIOWrapper(raw, encoding="utf-8-sig"), kind
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Write .audit/findings/ from a JSON Lines export or scanner output.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s restored/.audit findings.jsonl           Import an export
+  %(prog)s restored/.audit export.jsonl.gz --clean  Replace existing findings
+  %(prog)s .audit semgrep.sarif                     Import SARIF scanner results
+  %(prog)s .audit -                                 Read from stdin
+        """
+    )
+
+    parser.add_argument(
+        "audit_dir",
+        type=Path,
+        help="Path to the .audit directory to import into"
+    )
+
+    parser.add_argument(
+        "source",
+        help="JSON Lines export, SARIF file or Semgrep/Bandit/Gitleaks/Trivy JSON "
+             "(optionally .gz), or - for stdin"
+    )
+
+    parser.add_argument(
+        "--clean",
+        action="store_true",
+        help="Remove existing finding files before importing"
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Parse existing findings afresh instead of using .audit/.cache/"
+    )
+
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    if args.source != "-" and not Path(args.source).exists():
+        print(f"Error: Source does not exist: {args.source}", file=sys.stderr)
+        sys.exit(1)
+
+    findings_dir = args.audit_dir / "findings"
+    if args.clean and findings_dir.is_dir():
+        for path in findings_dir.glob("*.md"):
+            path.unlink()
+
+    errors = []
+    source, kind = open_source(args.source)
+    try:
+        if kind == "jsonl":
+            count = import_findings(read_jsonl(source, errors), findings_dir)
+            print(f"Imported {count} findings into {findings_dir}")
+        else:
+            counts = import_scan(read_scan(source, errors), findings_dir, cache=not args.no_cache)
+            print(f"Imported {counts['imported']} findings into {findings_dir} "
+                  f"({counts['duplicates']} duplicates skipped)")
+    except JsonStreamError as e:
+        print(f"Error: Invalid scanner output: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        if args.source == "-":
+            source.detach()
+        else:
+            source.close()
+
+    if errors:
+        what, where = ("lines", "lines") if kind == "jsonl" else ("records", "offsets")
+        shown = ", ".join(str(n) for n in errors[:10])
+        print(f"Skipped {len(errors)} malformed {what} ({where} {shown}"
+              f"{', ...' if len(errors) > 10 else ''})", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
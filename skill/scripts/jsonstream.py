@@ -0,0 +1,199 @@
+"""
+Incremental JSON reading.
+
+A pull parser for JSON documents too large to load whole, such as scanner
+reports of hundreds of megabytes. The caller walks the document with
+``members()`` (keys of an object) and ``items()`` (elements of an array),
+and at each position either decodes the value with ``value()``, descends
+into it, or leaves it; values the caller does not consume are skipped
+without being built. Only the value being decoded and one read chunk are
+held in memory.
+
+    stream = JsonStream(fh)
+    for key in stream.members():
+        if key == "results":
+            for _ in stream.items():
+                handle(stream.value())
+
+Not a standalone script: used by import_findings.py.
+"""
+
+import json
+import re
+from typing import Iterator, TextIO
+
+
+CHUNK_SIZE = 1 << 16
+
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+# Rest of a string after its opening quote, through the closing quote
+STRING_TAIL = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+STRUCTURE = re.compile(r'["\[\]{}]')
+
+_decoder = json.JSONDecoder()
+
+
+class JsonStreamError(ValueError):
+    """The document is not valid JSON, or not shaped as the caller expected."""
+
+
+class JsonStream:
+    """Pull parser over a text stream holding one JSON document."""
+
+    def __init__(self, source: TextIO, chunk_size: int = CHUNK_SIZE):
+        self.source = source
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.base = 0  # document offset of buf[0]
+        self.eof = False
+
+    @property
+    def offset(self) -> int:
+        """Document offset of the next unread character."""
+        return self.base + self.pos
+
+    def _fill(self, size: int = 0) -> bool:
+        """Append at least ``size`` more characters to the buffer; False at end of input."""
+        if self.eof:
+            return False
+        if self.pos > len(self.buf) // 2:
+            self.base += self.pos
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+        data = self.source.read(max(size, self.chunk_size))
+        if not data:
+            self.eof = True
+            return False
+        self.buf += data
+        return True
+
+    def _error(self, message: str) -> JsonStreamError:
+        return JsonStreamError(f"{message} at offset {self.offset}")
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ("" at end of input)."""
+        while True:
+            self.pos = WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise self._error(f"expected {char!r}")
+        self.pos += 1
+
+    def value(self):
+        """Decode and return the next value."""
+        if not self.peek():
+            raise self._error("unexpected end of input")
+        size = self.chunk_size
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buf, self.pos)
+                # A number or literal ending at the buffer edge may continue past it
+                if end < len(self.buf) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError as e:
+                if self.eof:
+                    raise self._error(f"invalid JSON ({e.msg})") from None
+            self._fill(size)
+            size *= 2
+
+    def skip(self) -> None:
+        """Move past the next value without building it."""
+        char = self.peek()
+        if char == '"':
+            self.pos += 1
+            self._skip_string()
+        elif char in ("[", "{"):
+            self._skip_container()
+        else:
+            self.value()
+
+    def _skip_string(self) -> None:
+        """Move past the rest of a string whose opening quote was consumed."""
+        size = self.chunk_size
+        while True:
+            match = STRING_TAIL.match(self.buf, self.pos)
+            if match:
+                self.pos = match.end()
+                return
+            if not self._fill(size):
+                raise self._error("unterminated string")
+            size *= 2
+
+    def _skip_container(self) -> None:
+        depth = 0
+        while True:
+            match = STRUCTURE.search(self.buf, self.pos)
+            if not match:
+                self.pos = len(self.buf)
+                if not self._fill():
+                    raise self._error("unterminated array or object")
+                continue
+            self.pos = match.end()
+            char = match.group()
+            if char == '"':
+                self._skip_string()
+            elif char in "[{":
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return
+
+    def members(self) -> Iterator[str]:
+        """Iterate over the keys of the next value, which must be an object.
+
+        After each key the stream is positioned at its value; a value the
+        caller leaves unconsumed is skipped.
+        """
+        self._expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            if self.peek() != '"':
+                raise self._error("expected an object key")
+            key = self.value()
+            self._expect(":")
+            self.peek()
+            start = self.offset
+            yield key
+            if self.offset == start:
+                self.skip()
+            char = self.peek()
+            self.pos += 1
+            if char == "}":
+                return
+            if char != ",":
+                raise self._error("expected ',' or '}'")
+
+    def items(self) -> Iterator[int]:
+        """Iterate over the element indexes of the next value, which must be an array.
+
+        After each index the stream is positioned at the element; an element
+        the caller leaves unconsumed is skipped.
+        """
+        self._expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        index = 0
+        while True:
+            self.peek()
+            start = self.offset
+            yield index
+            if self.offset == start:
+                self.skip()
+            char = self.peek()
+            self.pos += 1
+            if char == "]":
+                return
+            if char != ",":
+                raise self._error("expected ',' or ']'")
+            index += 1
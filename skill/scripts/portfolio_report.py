@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""
+Portfolio Rollup Script
+
+Combines the findings of many audited projects into one portfolio report with
+per-project risk levels, cross-project OWASP/CWE heatmaps and a global
+remediation queue. Each .audit directory is loaded on a worker process and
+its parsed-findings cache is reused when present.
+
+Usage:
+    python portfolio_report.py DIR [DIR ...] [options]
+
+    Each DIR is either a .audit directory or a project root containing one.
+
+Options:
+    --format FORMAT    Output format: markdown (default), json
+    --output FILE      Output file path (default: portfolio-report.md/.json)
+    --stdout           Print to stdout instead of file
+    --jobs N           Load projects on N worker processes (0 = one per CPU; default: serial)
+    --queue-limit N    Entries in the global remediation queue (default: 100)
+    --top-cwes N       CWEs shown in the CWE heatmap (default: 20)
+
+Examples:
+    python portfolio_report.py services/*/.audit
+    python portfolio_report.py services/* --format json --jobs 0
+    python portfolio_report.py a/.audit b/.audit --stdout
+
+Output:
+    Writes portfolio-report.md or portfolio-report.json to the current directory
+"""
+
+import argparse
+import json
+import sys
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+from typing import Optional, TextIO
+
+from generate_report import (
+    CACHE_DIR,
+    CACHE_FILE,
+    SEVERITY_EMOJI,
+    SEVERITY_ORDER,
+    FindingGroups,
+    assess_risk_level,
+    load_audit_context,
+    load_findings,
+    normalize_cwe,
+    normalize_owasp,
+    resolve_audit_dir,
+    write_output,
+    _resolve_jobs,
+)
+
+
+OUTPUT_FILES = {
+    "markdown": "portfolio-report.md",
+    "json": "portfolio-report.json",
+}
+
+RISK_ORDER = {"Critical": 0, "High": 1, "Medium": 2, "Low": 3}
+
+OWASP_CATEGORIES = [f"A{n:02d}" for n in range(1, 11)]
+
+SEVERITY_COLUMNS = ["critical", "high", "medium", "low", "info"]
+
+DEFAULT_QUEUE_LIMIT = 100
+DEFAULT_TOP_CWES = 20
+
+
+def load_project(audit_dir: Path) -> dict:
+    """Load one audit directory and reduce it to a project summary.
+
+    Runs on a worker process, so only counts and the open-finding queue
+    entries travel back to the parent rather than every parsed finding.
+    """
+    context = load_audit_context(audit_dir)
+    has_cache = (audit_dir / CACHE_DIR / CACHE_FILE).exists()
+    findings = load_findings(audit_dir, cache=has_cache)
+    groups = FindingGroups(findings)
+
+    name = context.get("project_name")
+    if not name or name == "Unknown Project":
+        name = audit_dir.parent.name if audit_dir.name == ".audit" else audit_dir.name
+
+    by_severity = groups.severity_counts()
+    if "informational" in by_severity:
+        by_severity["info"] = by_severity.get("info", 0) + by_severity.pop("informational")
+
+    owasp = defaultdict(int)
+    for value, indexes in groups.by_owasp.items():
+        code = normalize_owasp(value)
+        if code:
+            owasp[code] += len(indexes)
+
+    cwe = defaultdict(lambda: defaultdict(int))
+    for value, indexes in groups.by_cwe.items():
+        cwe_id = normalize_cwe(value)
+        if cwe_id:
+            for f in groups.select(indexes):
+                cwe[cwe_id][f["severity"]] += 1
+
+    queue = [
+        {
+            "id": f["id"],
+            "title": f["title"],
+            "severity": f["severity"],
+            "cwe": normalize_cwe(f["cwe"]),
+            "file": f["file"],
+        }
+        for tier in groups.remediation.values()
+        for f in groups.select(tier)
+    ]
+
+    return {
+        "name": name,
+        "audit_dir": str(audit_dir),
+        "audit_status": context.get("audit_status", ""),
+        "total_findings": len(findings),
+        "open_findings": len(groups.by_status.get("open", [])),
+        "risk_level": assess_risk_level(by_severity),
+        "by_severity": {s: by_severity.get(s, 0) for s in SEVERITY_COLUMNS},
+        "owasp": dict(owasp),
+        "cwe": {k: dict(v) for k, v in cwe.items()},
+        "queue": queue,
+    }
+
+
+def load_portfolio(audit_dirs: list, jobs: Optional[int] = None) -> list:
+    """Load every project, on a process pool unless a single worker is requested.
+
+    ``jobs`` is read as generate_report.py --jobs reads it: None loads
+    serially, 0 (or less) uses one worker per CPU. Results keep the input
+    order.
+    """
+    workers = min(_resolve_jobs(jobs), len(audit_dirs))
+    if workers <= 1:
+        return [load_project(d) for d in audit_dirs]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(load_project, audit_dirs))
+
+
+def unique_names(projects: list) -> list:
+    """Return the projects with names shared by several audits made unique.
+
+    A shared name gains the shortest trailing part of each project's path
+    that tells them apart: ``a/api/.audit`` and ``b/api/.audit`` become
+    "api (a/api)" and "api (b/api)".
+    """
+    counts = Counter(p["name"] for p in projects)
+    groups = defaultdict(list)
+    for p in projects:
+        if counts[p["name"]] > 1:
+            audit_dir = Path(p["audit_dir"])
+            groups[p["name"]].append((audit_dir.parent if audit_dir.name == ".audit" else audit_dir).parts)
+
+    renamed = []
+    for p in projects:
+        if counts[p["name"]] > 1:
+            group = groups[p["name"]]
+            audit_dir = Path(p["audit_dir"])
+            parts = (audit_dir.parent if audit_dir.name == ".audit" else audit_dir).parts
+            depth = 1
+            while depth < len(parts) and sum(g[-depth:] == parts[-depth:] for g in group) > 1:
+                depth += 1
+            p = dict(p, name=f"{p['name']} ({'/'.join(parts[-depth:])})")
+        renamed.append(p)
+    return renamed
+
+
+def build_rollup(projects: list, queue_limit: int = DEFAULT_QUEUE_LIMIT,
+                 top_cwes: int = DEFAULT_TOP_CWES) -> dict:
+    """Combine project summaries into portfolio-wide totals, heatmaps and queue."""
+    projects = sorted(
+        unique_names(projects),
+        key=lambda p: (RISK_ORDER.get(p["risk_level"], 4),
+                       -p["by_severity"]["critical"], -p["by_severity"]["high"], p["name"]),
+    )
+
+    by_severity = {s: sum(p["by_severity"][s] for p in projects) for s in SEVERITY_COLUMNS}
+    by_risk = {level: sum(1 for p in projects if p["risk_level"] == level) for level in RISK_ORDER}
+
+    cwe_totals = defaultdict(lambda: {"projects": 0, "total": 0, **{s: 0 for s in SEVERITY_COLUMNS}})
+    for p in projects:
+        for cwe_id, counts in p["cwe"].items():
+            row = cwe_totals[cwe_id]
+            row["projects"] += 1
+            for severity, n in counts.items():
+                key = "info" if severity == "informational" else severity
+                if key in row:
+                    row[key] += n
+                row["total"] += n
+    cwe_heatmap = dict(sorted(cwe_totals.items(), key=lambda kv: (-kv[1]["total"], kv[0]))[:top_cwes])
+
+    owasp_heatmap = {p["name"]: {c: p["owasp"].get(c, 0) for c in OWASP_CATEGORIES} for p in projects}
+
+    queue = [dict(entry, project=p["name"]) for p in projects for entry in p["queue"]]
+    queue.sort(key=lambda e: SEVERITY_ORDER.get(e["severity"], 5))  # stable: riskiest projects first
+
+    return {
+        "summary": {
+            "projects": len(projects),
+            "total_findings": sum(p["total_findings"] for p in projects),
+            "open_findings": sum(p["open_findings"] for p in projects),
+            "by_severity": by_severity,
+            "by_risk_level": by_risk,
+        },
+        "projects": [{k: v for k, v in p.items() if k != "queue"} for p in projects],
+        "heatmaps": {"owasp": owasp_heatmap, "cwe": cwe_heatmap},
+        "remediation_queue": queue[:queue_limit],
+        "remediation_queue_total": len(queue),
+    }
+
+
+def _cell(n: int) -> str:
+    """Render a heatmap cell, leaving zeros visually quiet."""
+    return str(n) if n else "·"
+
+
+def write_markdown_rollup(out: TextIO, rollup: dict) -> None:
+    """Write the portfolio report in markdown format."""
+    summary = rollup["summary"]
+    by_severity = summary["by_severity"]
+
+    out.write(f"""# Security Portfolio Report
+
+**Projects:** {summary['projects']}
+**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M')}
+**Framework:** Codebase Security Audit Framework
+
+---
+
+## Portfolio Summary
+
+| Metric | Value |
+|--------|-------|
+| **Projects** | {summary['projects']} |
+| **Total Findings** | {summary['total_findings']} |
+| **Open Findings** | {summary['open_findings']} |
+| 🔴 Critical | {by_severity['critical']} |
+| 🟠 High | {by_severity['high']} |
+| 🟡 Medium | {by_severity['medium']} |
+| 🔵 Low | {by_severity['low']} |
+| ⚪ Informational | {by_severity['info']} |
+
+### Projects by Risk Level
+
+| Risk Level | Projects |
+|------------|----------|
+""")
+    for level, count in summary["by_risk_level"].items():
+        out.write(f"| {level} | {count} |\n")
+
+    out.write("\n---\n\n## Projects\n\n")
+    out.write("| Project | Risk | Total | Open | Critical | High | Medium | Low | Info |\n")
+    out.write("|---------|------|-------|------|----------|------|--------|-----|------|\n")
+    for p in rollup["projects"]:
+        s = p["by_severity"]
+        out.write(f"| {p['name']} | {p['risk_level']} | {p['total_findings']} | {p['open_findings']} | "
+                  f"{s['critical']} | {s['high']} | {s['medium']} | {s['low']} | {s['info']} |\n")
+
+    out.write("\n---\n\n## OWASP Top 10 Heatmap\n\n")
+    owasp_rows = [(name, row) for name, row in rollup["heatmaps"]["owasp"].items() if any(row.values())]
+    if owasp_rows:
+        out.write("| Project | " + " | ".join(OWASP_CATEGORIES) + " |\n")
+        out.write("|---------|" + "-----|" * len(OWASP_CATEGORIES) + "\n")
+        for name, row in owasp_rows:
+            out.write(f"| {name} | " + " | ".join(_cell(row[c]) for c in OWASP_CATEGORIES) + " |\n")
+        totals = [sum(row[c] for _, row in owasp_rows) for c in OWASP_CATEGORIES]
+        out.write("| **Total** | " + " | ".join(f"**{n}**" for n in totals) + " |\n")
+    else:
+        out.write("No OWASP-tagged findings.\n")
+
+    out.write("\n---\n\n## CWE Heatmap\n\n")
+    cwe_heatmap = rollup["heatmaps"]["cwe"]
+    if cwe_heatmap:
+        out.write("| CWE | Projects | Total | Critical | High | Medium | Low | Info |\n")
+        out.write("|-----|----------|-------|----------|------|--------|-----|------|\n")
+        for cwe_id, row in cwe_heatmap.items():
+            out.write(f"| {cwe_id} | {row['projects']} | {row['total']} | "
+                      + " | ".join(_cell(row[s]) for s in SEVERITY_COLUMNS) + " |\n")
+    else:
+        out.write("No CWE-tagged findings.\n")
+
+    queue = rollup["remediation_queue"]
+    out.write("\n---\n\n## Global Remediation Queue\n\n")
+    if queue:
+        shown = f"top {len(queue)} of " if len(queue) < rollup["remediation_queue_total"] else ""
+        out.write(f"Open findings across all projects ({shown}{rollup['remediation_queue_total']}), "
+                  "most severe first.\n\n")
+        out.write("| # | Project | ID | Severity | CWE | Title |\n")
+        out.write("|---|---------|----|----------|-----|-------|\n")
+        for i, e in enumerate(queue, 1):
+            emoji = SEVERITY_EMOJI.get(e["severity"], "⚪")
+            out.write(f"| {i} | {e['project']} | {e['id']} | {emoji} {e['severity'].title()} | "
+                      f"{e['cwe']} | {e['title']} |\n")
+    else:
+        out.write("No open findings.\n")
+
+    out.write("\n---\n\n*Report generated by Codebase Security Audit Framework*\n")
+
+
+def write_json_rollup(out: TextIO, rollup: dict) -> None:
+    """Write the portfolio report in JSON format."""
+    data = {
+        "metadata": {
+            "generated_at": datetime.now().isoformat(),
+            "framework": "Codebase Security Audit Framework",
+            "framework_version": "1.0"
+        },
+        **rollup,
+    }
+    encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+    for chunk in encoder.iterencode(data):
+        out.write(chunk)
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Generate a portfolio rollup report across many audited projects.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s services/*/.audit                  Markdown portfolio report
+  %(prog)s services/* --format json           JSON portfolio report
+  %(prog)s a/.audit b/.audit --stdout         Print to stdout only
+        """
+    )
+
+    parser.add_argument(
+        "audit_dirs",
+        type=Path,
+        nargs="+",
+        help=".audit directories (or project roots containing .audit)"
+    )
+
+    parser.add_argument(
+        "--format", "-f",
+        choices=list(OUTPUT_FILES),
+        default="markdown",
+        help="Output format (default: markdown)"
+    )
+
+    parser.add_argument(
+        "--output", "-o",
+        type=Path,
+        help="Output file path (default: portfolio-report.<ext> in the current directory)"
+    )
+
+    parser.add_argument(
+        "--stdout",
+        action="store_true",
+        help="Print to stdout instead of writing to file"
+    )
+
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Load projects on N worker processes (0 = one per CPU; default: serial)"
+    )
+
+    parser.add_argument(
+        "--queue-limit",
+        type=int,
+        default=DEFAULT_QUEUE_LIMIT,
+        metavar="N",
+        help=f"Entries in the global remediation queue (default: {DEFAULT_QUEUE_LIMIT})"
+    )
+
+    parser.add_argument(
+        "--top-cwes",
+        type=int,
+        default=DEFAULT_TOP_CWES,
+        metavar="N",
+        help=f"CWEs shown in the CWE heatmap (default: {DEFAULT_TOP_CWES})"
+    )
+
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    audit_dirs = []
+    for path in args.audit_dirs:
+        audit_dir = resolve_audit_dir(path)
+        if not audit_dir.exists():
+            print(f"Error: Audit directory does not exist: {audit_dir}", file=sys.stderr)
+            sys.exit(1)
+        audit_dirs.append(audit_dir)
+
+    projects = load_portfolio(audit_dirs, args.jobs)
+    rollup = build_rollup(projects, args.queue_limit, args.top_cwes)
+
+    writers = {
+        "markdown": partial(write_markdown_rollup, rollup=rollup),
+        "json": partial(write_json_rollup, rollup=rollup),
+    }
+    write = writers[args.format]
+
+    if args.stdout:
+        write(sys.stdout)
+        print()
+        return
+
+    output_path = args.output or Path(OUTPUT_FILES[args.format])
+    write_output(output_path, write)
+    print(f"Generated: {output_path} ({len(projects)} projects)")
+
+
+if __name__ == "__main__":
+    main()
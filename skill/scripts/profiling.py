@@ -0,0 +1,190 @@
+"""
+Stage profiler for the report scripts.
+
+Records wall time, call counts, bytes and peak traced memory per stage.
+Top-level phases are opened explicitly with ``phase()``; finer stages are
+recorded by ``instrument()``, which temporarily wraps module functions so
+unprofiled runs pay nothing. Time spent in a wrapped function that calls
+another wrapped function is attributed to the outermost one.
+
+Not a standalone script: used by generate_report.py --profile.
+"""
+
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from functools import wraps
+from typing import Optional, TextIO
+
+
+class Stage:
+    """Accumulated measurements for one stage."""
+
+    __slots__ = ("name", "parent", "seconds", "calls", "bytes", "peak_memory")
+
+    def __init__(self, name: str, parent: Optional[str] = None):
+        self.name = name
+        self.parent = parent
+        self.seconds = 0.0
+        self.calls = 0
+        self.bytes = 0
+        self.peak_memory = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "parent": self.parent,
+            "seconds": round(self.seconds, 6),
+            "calls": self.calls,
+            "bytes": self.bytes,
+            "peak_memory_bytes": self.peak_memory,
+        }
+
+
+class Profiler:
+    """Collects per-stage measurements for one run."""
+
+    def __init__(self, trace_memory: bool = True):
+        self.stages = {}
+        self.findings = None
+        # Non-empty results of sized stages, the finding count when none is set
+        self.files_read = 0
+        self.peak_memory = None
+        self.trace_memory = trace_memory
+        self._phase = None
+        self._active = False
+        self._patches = []
+        self._started = None
+        self._elapsed = 0.0
+
+    def _stage(self, name: str, parent: Optional[str]) -> Stage:
+        key = (parent, name)
+        if key not in self.stages:
+            self.stages[key] = Stage(name, parent)
+        return self.stages[key]
+
+    def start(self) -> None:
+        """Start the run clock and memory tracing."""
+        if self.trace_memory:
+            tracemalloc.start()
+        self._started = time.perf_counter()
+
+    def stop(self) -> None:
+        """Stop the run clock, undo instrumentation and stop memory tracing."""
+        self._elapsed = time.perf_counter() - self._started
+        for owner, attr, original in reversed(self._patches):
+            setattr(owner, attr, original)
+        self._patches = []
+        if self.trace_memory:
+            # Phases reset the tracemalloc peak, so fold their peaks back in
+            self.peak_memory = max([tracemalloc.get_traced_memory()[1]] +
+                                   [s.peak_memory for s in self.stages.values()])
+            tracemalloc.stop()
+
+    @contextmanager
+    def phase(self, name: str, size=None):
+        """Time a top-level phase; ``size`` is an optional callable returning bytes produced."""
+        stage = self._stage(name, None)
+        previous, self._phase = self._phase, name
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            yield stage
+        finally:
+            stage.seconds += time.perf_counter() - start
+            stage.calls += 1
+            if size:
+                stage.bytes += size()
+            if self.trace_memory:
+                stage.peak_memory = max(stage.peak_memory, tracemalloc.get_traced_memory()[1])
+            self._phase = previous
+
+    def instrument(self, owner, stages: dict, sizes: Optional[dict] = None) -> None:
+        """Wrap ``owner``'s attributes so calls are recorded under a stage name.
+
+        ``stages`` maps stage name -> attribute names; ``sizes`` optionally
+        maps stage name -> callable giving the byte size of a return value.
+        """
+        sizes = sizes or {}
+        for name, attrs in stages.items():
+            for attr in attrs:
+                original = getattr(owner, attr)
+                setattr(owner, attr, self._wrap(name, original, sizes.get(name)))
+                self._patches.append((owner, attr, original))
+
+    def _wrap(self, name: str, func, size):
+        profiler = self
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if profiler._active:
+                return func(*args, **kwargs)
+            profiler._active = True
+            start = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                profiler._active = False
+            stage = profiler._stage(name, profiler._phase)
+            stage.seconds += elapsed
+            stage.calls += 1
+            if size and result:
+                stage.bytes += size(result)
+                profiler.files_read += 1
+            return result
+
+        return wrapper
+
+    def _ordered(self) -> list:
+        """Stages with each phase followed by its nested stages, in first-seen order."""
+        ordered = []
+        for (parent, name), stage in self.stages.items():
+            if parent is None:
+                ordered.append(stage)
+                ordered.extend(s for (p, _), s in self.stages.items() if p == name)
+        ordered.extend(s for (p, _), s in self.stages.items()
+                       if p is not None and (None, p) not in self.stages)
+        return ordered
+
+    def summary(self) -> dict:
+        """Return the trace as a JSON-serialisable dict."""
+        return {
+            "generated_at": datetime.now().isoformat(),
+            "total_seconds": round(self._elapsed, 6),
+            "findings": self.findings if self.findings is not None else self.files_read,
+            "peak_memory_bytes": self.peak_memory,
+            "stages": [s.to_dict() for s in self._ordered()],
+        }
+
+    def write_table(self, out: TextIO) -> None:
+        """Write a compact per-stage table."""
+        data = self.summary()
+        out.write(f"{'Stage':<24} {'Time (s)':>9} {'%':>6} {'Calls':>8} {'Bytes':>12} {'Peak mem':>10}\n")
+        total = data["total_seconds"] or 1.0
+        for stage in data["stages"]:
+            label = ("  " + stage["name"]) if stage["parent"] else stage["name"]
+            peak = _format_bytes(stage["peak_memory_bytes"]) if stage["peak_memory_bytes"] else ""
+            size = _format_bytes(stage["bytes"]) if stage["bytes"] else ""
+            out.write(f"{label:<24} {stage['seconds']:>9.3f} {100 * stage['seconds'] / total:>5.1f}% "
+                      f"{stage['calls']:>8} {size:>12} {peak:>10}\n")
+        out.write(f"{'total':<24} {data['total_seconds']:>9.3f}\n")
+        memory = _format_bytes(data["peak_memory_bytes"]) if data["peak_memory_bytes"] else "n/a"
+        out.write(f"findings: {data['findings']}  peak traced memory: {memory}\n")
+
+    def write_json(self, out: TextIO) -> None:
+        """Write the trace as JSON."""
+        json.dump(self.summary(), out, indent=2)
+        out.write("\n")
+
+
+def _format_bytes(n: int) -> str:
+    """Format a byte count for the table."""
+    for unit in ("B", "KB", "MB"):
+        if n < 1024:
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.1f} GB"
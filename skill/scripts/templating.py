@@ -0,0 +1,369 @@
+"""
+Compiled templates for report rendering.
+
+A small template language compiled to Python functions that write straight
+to an output stream:
+
+    {{ expr }}                      output, with None rendered as ""
+    {{ expr | filter | f(arg) }}    filters, applied left to right
+    {% if expr %} {% elif expr %} {% else %} {% endif %}
+    {% for name in expr %} {% for a, b in expr %} {% endfor %}
+    {# comment #}
+
+Expressions are a safe subset of Python: names, literals, ``a.b``
+(mapping key or attribute), ``a[0]``, comparisons, ``and``/``or``/``not``
+and arithmetic; there are no function calls. Inside a loop ``loop.index``
+(from 1) and ``loop.first`` are available. A ``{% %}`` or ``{# #}`` tag
+alone on its line is removed together with that line, so block tags do not
+leave blank lines behind.
+
+Templates are compiled once and cached per process by path, modification
+time and size; use ``load_template``. Given a cache directory, it also
+keeps the compiled code on disk, like a .pyc file, so later runs skip
+compiling until the template changes.
+
+Not a standalone script: used by generate_report.py.
+"""
+
+import ast
+import hashlib
+import html
+import marshal
+import os
+import re
+from importlib.util import MAGIC_NUMBER
+from pathlib import Path
+from typing import Optional, TextIO
+
+
+# Bump whenever _Compiler output changes so cached templates are recompiled
+TEMPLATE_VERSION = 1
+
+TAG_PATTERN = re.compile(r'{{(.*?)}}|{%(.*?)%}|{#.*?#}', re.DOTALL)
+
+ALLOWED_NODES = (
+    ast.Expression, ast.Name, ast.Load, ast.Constant, ast.Attribute, ast.Subscript, ast.Slice,
+    ast.Tuple, ast.List, ast.Compare, ast.BoolOp, ast.UnaryOp, ast.BinOp, ast.IfExp,
+    ast.And, ast.Or, ast.Not, ast.USub, ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod,
+    ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE, ast.In, ast.NotIn, ast.Is, ast.IsNot,
+)
+
+
+class TemplateError(ValueError):
+    """A template could not be compiled."""
+
+
+def _truncate(value, length: int, suffix: str = "") -> str:
+    text = "" if value is None else str(value)
+    return text[:length] + suffix if len(text) > length else text
+
+
+FILTERS = {
+    "title": lambda v: str(v).title(),
+    "upper": lambda v: str(v).upper(),
+    "lower": lambda v: str(v).lower(),
+    "length": len,
+    "join": lambda v, sep="": sep.join(str(x) for x in v),
+    "default": lambda v, fallback="": v if v else fallback,
+    "truncate": _truncate,
+    "replace": lambda v, old, new: str(v).replace(old, new),
+    "escape": lambda v: html.escape("" if v is None else str(v)),
+}
+
+
+class Loop:
+    """Position of the current iteration, exposed to templates as ``loop``."""
+
+    __slots__ = ("index",)
+
+    def __init__(self, index: int):
+        self.index = index
+
+    @property
+    def first(self) -> bool:
+        return self.index == 1
+
+
+def _get(obj, name: str):
+    """Resolve ``obj.name``: a mapping key first, then an attribute; None if missing."""
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+def _text(value) -> str:
+    return "" if value is None else str(value)
+
+
+def _split_filters(expr: str) -> list:
+    """Split ``expr`` on ``|`` outside quotes and brackets."""
+    parts, depth, quote, start = [], 0, None, 0
+    for i, ch in enumerate(expr):
+        if quote:
+            if ch == quote and expr[i - 1] != "\\":
+                quote = None
+        elif ch in "'\"":
+            quote = ch
+        elif ch in "([{":
+            depth += 1
+        elif ch in ")]}":
+            depth -= 1
+        elif ch == "|" and depth == 0:
+            parts.append(expr[start:i])
+            start = i + 1
+    parts.append(expr[start:])
+    return [p.strip() for p in parts]
+
+
+class _Compiler:
+    """Translates template source into the Python source of a render function."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.lines = []
+        self.indent = 1
+        self.scopes = [{}]
+        self.context_names = set()
+        self.blocks = []
+        self.loop_depth = 0
+        self.line = 1
+        self._counted = 0
+
+    def error(self, message: str) -> TemplateError:
+        return TemplateError(f"{self.name}, line {self.line}: {message}")
+
+    def emit(self, code: str) -> None:
+        self.lines.append("    " * self.indent + code)
+
+    def resolve(self, name: str) -> str:
+        for scope in reversed(self.scopes):
+            if name in scope:
+                return scope[name]
+        self.context_names.add(name)
+        return f"c_{name}"
+
+    def expression(self, source: str) -> str:
+        """Compile an expression with optional filters to Python source."""
+        parts = _split_filters(source)
+        code = self._python(parts[0])
+        for part in parts[1:]:
+            match = re.fullmatch(r'(\w+)\s*(?:\((.*)\))?', part, re.DOTALL)
+            if not match or match.group(1) not in FILTERS:
+                raise self.error(f"unknown filter {part!r}")
+            args = ""
+            if match.group(2) and match.group(2).strip():
+                args = f", *{self._python(f'({match.group(2)},)')}"
+            code = f"_filters[{match.group(1)!r}]({code}{args})"
+        return code
+
+    def _python(self, source: str) -> str:
+        try:
+            tree = ast.parse(source.strip(), mode="eval")
+        except SyntaxError as e:
+            raise self.error(f"invalid expression {source.strip()!r}") from e
+        for node in ast.walk(tree):
+            if not isinstance(node, ALLOWED_NODES):
+                raise self.error(f"unsupported syntax in {source.strip()!r}")
+            if isinstance(node, ast.Attribute) and node.attr.startswith("_"):
+                raise self.error(f"private attribute in {source.strip()!r}")
+        return self._node(tree.body)
+
+    def _node(self, node) -> str:
+        if isinstance(node, ast.Name):
+            if node.id in ("True", "False", "None"):
+                return node.id
+            return self.resolve(node.id)
+        if isinstance(node, ast.Attribute):
+            return f"_get({self._node(node.value)}, {node.attr!r})"
+        if isinstance(node, ast.Constant):
+            return repr(node.value)
+        if isinstance(node, ast.Subscript):
+            index = node.slice
+            if isinstance(index, ast.Slice):
+                bounds = [self._node(b) if b else "None" for b in (index.lower, index.upper, index.step)]
+                return f"{self._node(node.value)}[{bounds[0]}:{bounds[1]}:{bounds[2]}]"
+            return f"{self._node(node.value)}[{self._node(index)}]"
+        if isinstance(node, (ast.Tuple, ast.List)):
+            items = "".join(f"{self._node(e)}, " for e in node.elts)
+            return f"({items})" if isinstance(node, ast.Tuple) else f"[{items}]"
+        if isinstance(node, ast.Compare):
+            ops = {ast.Eq: "==", ast.NotEq: "!=", ast.Lt: "<", ast.LtE: "<=", ast.Gt: ">",
+                   ast.GtE: ">=", ast.In: "in", ast.NotIn: "not in", ast.Is: "is", ast.IsNot: "is not"}
+            code = self._node(node.left)
+            for op, right in zip(node.ops, node.comparators):
+                code += f" {ops[type(op)]} {self._node(right)}"
+            return f"({code})"
+        if isinstance(node, ast.BoolOp):
+            op = " and " if isinstance(node.op, ast.And) else " or "
+            return "(" + op.join(self._node(v) for v in node.values) + ")"
+        if isinstance(node, ast.UnaryOp):
+            op = "not " if isinstance(node.op, ast.Not) else "-"
+            return f"({op}{self._node(node.operand)})"
+        if isinstance(node, ast.BinOp):
+            ops = {ast.Add: "+", ast.Sub: "-", ast.Mult: "*", ast.Div: "/", ast.FloorDiv: "//", ast.Mod: "%"}
+            return f"({self._node(node.left)} {ops[type(node.op)]} {self._node(node.right)})"
+        if isinstance(node, ast.IfExp):
+            return f"({self._node(node.body)} if {self._node(node.test)} else {self._node(node.orelse)})"
+        raise self.error(f"unsupported expression {ast.dump(node)}")
+
+    def tag(self, body: str) -> None:
+        """Compile one ``{% %}`` tag."""
+        words = body.split(None, 1)
+        if not words:
+            raise self.error("empty tag")
+        keyword, rest = words[0], (words[1] if len(words) > 1 else "")
+        if keyword == "if":
+            self.emit(f"if {self.expression(rest)}:")
+            self.blocks.append(["if", len(self.lines)])
+            self.indent += 1
+        elif keyword in ("elif", "else"):
+            if not self.blocks or self.blocks[-1][0] != "if":
+                raise self.error(f"{keyword} outside if")
+            self._close_body()
+            self.indent -= 1
+            self.emit(f"elif {self.expression(rest)}:" if keyword == "elif" else "else:")
+            self.blocks[-1][1] = len(self.lines)
+            self.indent += 1
+        elif keyword == "for":
+            match = re.fullmatch(r'(\w+(?:\s*,\s*\w+)*)\s+in\s+(.+)', rest.strip(), re.DOTALL)
+            if not match:
+                raise self.error(f"invalid for tag {body.strip()!r}")
+            iterable = self.expression(match.group(2))
+            self.loop_depth += 1
+            scope = {name.strip(): f"l{self.loop_depth}_{name.strip()}" for name in match.group(1).split(",")}
+            scope["loop"] = f"l{self.loop_depth}_loop"
+            self.scopes.append(scope)
+            targets = ", ".join(v for k, v in scope.items() if k != "loop")
+            self.emit(f"for _i{self.loop_depth}, ({targets},) in enumerate({iterable}, 1):"
+                      if "," in match.group(1) else
+                      f"for _i{self.loop_depth}, {targets} in enumerate({iterable}, 1):")
+            self.indent += 1
+            self.emit(f"{scope['loop']} = _Loop(_i{self.loop_depth})")
+            self.blocks.append(["for", len(self.lines)])
+        elif keyword in ("endif", "endfor"):
+            if not self.blocks or self.blocks[-1][0] != keyword[3:]:
+                raise self.error(f"unexpected {keyword}")
+            self._close_body()
+            self.blocks.pop()
+            self.indent -= 1
+            if keyword == "endfor":
+                self.scopes.pop()
+                self.loop_depth -= 1
+        else:
+            raise self.error(f"unknown tag {keyword!r}")
+
+    def _close_body(self) -> None:
+        if len(self.lines) == self.blocks[-1][1]:
+            self.emit("pass")
+
+    def compile(self, source: str) -> str:
+        pos = 0
+        for match in TAG_PATTERN.finditer(source):
+            start, end = match.start(), match.end()
+            if match.group(1) is None:
+                # Block tags and comments alone on a line take the line with them
+                line_start = source.rfind("\n", 0, start) + 1
+                line_end = source.find("\n", end)
+                line_end = len(source) if line_end == -1 else line_end
+                if (not source[line_start:start].strip() and not source[end:line_end].strip()
+                        and line_start >= pos):
+                    start, end = line_start, min(line_end + 1, len(source))
+            self.text(source[pos:start])
+            self.line += source.count("\n", self._counted, match.start())
+            self._counted = match.start()
+            if match.group(1) is not None:
+                self.emit(f"_write(_text({self.expression(match.group(1))}))")
+            elif match.group(2) is not None:
+                self.tag(match.group(2))
+            pos = end
+        self.text(source[pos:])
+        if self.blocks:
+            raise self.error(f"unclosed {self.blocks[-1][0]} block")
+        header = ["def render(_ctx, _write):"]
+        header += [f"    c_{name} = _ctx.get({name!r})" for name in sorted(self.context_names)]
+        return "\n".join(header + self.lines + ["    pass"]) + "\n"
+
+    def text(self, literal: str) -> None:
+        if literal:
+            self.emit(f"_write({literal!r})")
+
+
+class Template:
+    """A compiled template."""
+
+    def __init__(self, source: str, name: str = "<template>"):
+        self.name = name
+        self.code = _Compiler(name).compile(source)
+        self._bind(compile(self.code, name, "exec"))
+
+    @classmethod
+    def from_code(cls, code: str, bytecode, name: str) -> "Template":
+        """Rebuild a template from its generated source and that source's code object."""
+        template = cls.__new__(cls)
+        template.name = name
+        template.code = code
+        template._bind(bytecode)
+        return template
+
+    def _bind(self, bytecode) -> None:
+        namespace = {"_get": _get, "_text": _text, "_filters": FILTERS, "_Loop": Loop}
+        exec(bytecode, namespace)
+        self._bytecode = bytecode
+        self._render = namespace["render"]
+
+    def render(self, out: TextIO, context: dict) -> None:
+        """Write the template, filled in from ``context``, to ``out``."""
+        self._render(context, out.write)
+
+
+_cache = {}
+
+
+def _cache_file(cache_dir: Path, path: Path) -> Path:
+    return cache_dir / f"template-{hashlib.sha1(str(path).encode('utf-8')).hexdigest()[:16]}.bin"
+
+
+def _read_cache(cache_file: Path, source: tuple) -> Optional[Template]:
+    """Return the cached template if it was compiled from ``source``."""
+    try:
+        with open(cache_file, "rb") as fh:
+            cached, code, bytecode = marshal.load(fh)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    return Template.from_code(code, bytecode, source[0]) if cached == source else None
+
+
+def _write_cache(cache_file: Path, source: tuple, template: Template) -> None:
+    """Atomically write the compiled template; a read-only cache dir is not an error."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(".tmp")
+        with open(tmp, "wb") as fh:
+            marshal.dump((source, template.code, template._bytecode), fh)
+        os.replace(tmp, cache_file)
+    except OSError:
+        pass
+
+
+def load_template(path: Path, cache_dir: Optional[Path] = None) -> Template:
+    """Load and compile a template file, reusing the compiled form until the file changes.
+
+    The compiled template is reused within the process and, with
+    ``cache_dir``, across runs; the on-disk copy is tied to this Python
+    version's bytecode format.
+    """
+    path = Path(path).resolve()
+    st = path.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _cache.get(path)
+    if cached and cached[0] == key:
+        return cached[1]
+    source = (str(path), st.st_size, st.st_mtime_ns, TEMPLATE_VERSION, MAGIC_NUMBER)
+    cache_file = _cache_file(cache_dir, path) if cache_dir else None
+    template = _read_cache(cache_file, source) if cache_file else None
+    if template is None:
+        template = Template(path.read_text(encoding="utf-8"), str(path))
+        if cache_file:
+            _write_cache(cache_file, source, template)
+    _cache[path] = (key, template)
+    return template
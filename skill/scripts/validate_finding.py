@@ -3,10 +3,21 @@
 Finding Validation Script
 
 Validates security finding documents to ensure they have all required fields
-and proper formatting.
+and proper formatting. CWE references are checked against the offline CWE
+catalog (skill/data/cwe-catalog.txt): unknown IDs, CWE categories and CWEs
+that contradict the finding's OWASP Top 10 2021 category are reported as
+warnings, and the CWE name is resolved into the result fields.
+
+Given an audit directory instead, checks the findings against each other
+and against audit-context.md: duplicate IDs, ID prefixes that do not match
+the finding's phase, findings listed or counted in audit-context.md that
+are not on disk, and references to finding IDs that do not exist. Every
+file is read once into ID, phase and severity indexes, so the check grows
+linearly with the number of findings.
 
 Usage:
     python validate_finding.py /path/to/finding.md
+    python validate_finding.py /path/to/.audit
 
 Output:
     JSON object with validation result (pass/fail) and any errors
@@ -15,8 +26,12 @@ Output:
 import json
 import re
 import sys
+from collections import Counter, defaultdict
 from pathlib import Path
 
+from cvss import VECTOR_PATTERN
+from cwe_catalog import OWASP_2021, cwe_ids, load_catalog
+
 
 VALID_SEVERITIES = ["critical", "high", "medium", "low", "info", "informational"]
 VALID_STATUSES = ["open", "in progress", "in-progress", "resolved", "fixed", "accepted risk", "accepted-risk", "wont fix", "wont-fix"]
@@ -36,9 +51,32 @@ RECOMMENDED_FIELDS = [
     "recommendation",
 ]
 
+# Finding ID prefix and name of each finding-producing phase (see skill/phases/)
+PHASES = {
+    0: ("RECON", "Reconnaissance"),
+    1: ("AUTH", "Authentication"),
+    2: ("AUTHZ", "Authorization"),
+    3: ("API", "API Security"),
+    4: ("LOGIC", "Business Logic"),
+    5: ("DATA", "Data Layer"),
+    6: ("FE", "Frontend"),
+    7: ("INFRA", "Infrastructure"),
+    8: ("SECRET", "Secrets Management"),
+    9: ("LOG", "Logging & Monitoring"),
+    10: ("ERR", "Error Handling"),
+    11: ("CROSS", "Cross-Cutting"),
+}
+
 OWASP_PATTERN = r'A0[1-9]|A10'
 CWE_PATTERN = r'CWE-\d+'
 
+# Phase number owning each finding ID prefix
+PREFIX_PHASES = {prefix: number for number, (prefix, _) in PHASES.items()}
+
+# Anything shaped like a finding ID; only prefixes in use count as references
+ID_REFERENCE = re.compile(r'\b([A-Z][A-Z0-9]*)-(\d+)\b')
+TOTALS_PATTERN = re.compile(r'\b(Critical|High|Medium|Low|Info)\w*:\s*(\d+)', re.IGNORECASE)
+
 
 def read_file(path: Path) -> str:
     """Read file content."""
@@ -107,6 +145,19 @@ def validate_owasp(owasp: str) -> tuple:
     return True, None
 
 
+def validate_cvss(score: str, content: str) -> tuple:
+    """Validate that a CVSS v4.0 vector comes with a numeric score, since v4 vectors are not scored."""
+    vector = VECTOR_PATTERN.search(content)
+    if not vector or not vector.group().startswith("CVSS:4.0/"):
+        return True, None
+
+    if re.match(r'\s*\d{1,2}(?:\.\d)?\b', score or ""):
+        return True, None
+
+    return False, (f"CVSS v4.0 vector without a numeric score. v4 vectors are not scored, so the finding "
+                   f"is left out of CVSS statistics; record the score too (e.g., 9.3 ({vector.group()[:9]}...))")
+
+
 def validate_cwe(cwe: str) -> tuple:
     """Validate CWE reference format."""
     if not cwe:
@@ -115,9 +166,48 @@ def validate_cwe(cwe: str) -> tuple:
     if not re.search(CWE_PATTERN, cwe):
         return False, f"Invalid CWE reference '{cwe}'. Should be format CWE-XXX (e.g., CWE-89)"
 
+    catalog = load_catalog(fallback=True)
+    for number in cwe_ids(cwe):
+        if not catalog.exists(number):
+            return False, f"Unknown CWE 'CWE-{number}'. CWE IDs go up to CWE-{catalog.max_id}"
+        if catalog.is_category(number):
+            name = f" ({catalog.name(number)})" if catalog.name(number) else ""
+            return False, (f"CWE-{number}{name} is a CWE category, not a weakness. "
+                           f"Reference a specific weakness instead")
+
     return True, None
 
 
+def validate_cwe_owasp(cwe: str, owasp: str) -> tuple:
+    """Validate that the CWE belongs to the OWASP Top 10 2021 category given.
+
+    Passes when any referenced CWE maps to the category, when none of them
+    is mapped in the catalog, or when the OWASP reference is to another
+    edition of the Top 10.
+    """
+    owasp_match = re.search(OWASP_PATTERN, owasp or "")
+    if not cwe or not owasp_match or re.search(r':20(?!21)\d\d', owasp):
+        return True, None
+
+    catalog = load_catalog(fallback=True)
+    mapped = {number: catalog.owasp(number) for number in cwe_ids(cwe)}
+    expected = [(number, code) for number, code in mapped.items() if code]
+    if not expected or any(code == owasp_match.group() for _, code in expected):
+        return True, None
+
+    number, code = expected[0]
+    return False, (f"CWE-{number} belongs to OWASP {code}:2021 ({OWASP_2021[code]}), "
+                   f"not {owasp_match.group()}")
+
+
+def resolve_cwe_name(cwe: str) -> str:
+    """Return the catalog name of the first CWE referenced, or an empty string."""
+    catalog = load_catalog(fallback=True)
+    for number in cwe_ids(cwe):
+        return catalog.name(number) or ""
+    return ""
+
+
 def validate_phase(phase: str) -> tuple:
     """Validate phase reference."""
     if not phase:
@@ -176,6 +266,16 @@ def validate_finding(content: str) -> dict:
     if not valid:
         warnings.append(error)
 
+    # Validate the CWE fits the OWASP category
+    valid, error = validate_cwe_owasp(cwe, owasp)
+    if not valid:
+        warnings.append(error)
+
+    # Validate a CVSS v4.0 vector has its score
+    valid, error = validate_cvss(extract_field(content, "cvss score"), content)
+    if not valid:
+        warnings.append(error)
+
     # Validate phase
     phase = extract_field(content, "phase")
     valid, error = validate_phase(phase)
@@ -200,18 +300,150 @@ def validate_finding(content: str) -> dict:
             "phase": extract_field(content, "phase"),
             "owasp": extract_field(content, "owasp"),
             "cwe": extract_field(content, "cwe"),
+            "cwe_name": resolve_cwe_name(cwe),
             "id": extract_field(content, "id"),
         }
     }
 
 
+def _table_rows(content: str, first_header: str) -> tuple:
+    """Return the header cells and body rows of the first table whose first header is ``first_header``."""
+    lines = iter(content.splitlines())
+    for line in lines:
+        if not line.startswith("|"):
+            continue
+        header = [cell.strip() for cell in line.strip().strip("|").split("|")]
+        if header[0].lower() != first_header.lower():
+            continue
+        rows = []
+        for row in lines:
+            if not row.startswith("|"):
+                break
+            cells = [cell.strip() for cell in row.strip().strip("|").split("|")]
+            if not set("".join(cells)) <= set("-: "):
+                rows.append(cells)
+        return header, rows
+    return [], []
+
+
+def _phase_number(phase: str):
+    match = re.search(r'\d+', phase)
+    return int(match.group()) if match else None
+
+
+def check_context(content: str, ids: dict, phase_counts: Counter, severity_counts: Counter) -> tuple:
+    """Check audit-context.md against the finding indexes built by check_audit.
+
+    Returns ``(errors, warnings)``: IDs in the Findings Summary table with
+    no finding file are errors; Phase Status finding counts and the
+    severity totals line that disagree with disk, and findings missing from
+    a maintained Findings Summary, are warnings.
+    """
+    errors = []
+    warnings = []
+
+    header, rows = _table_rows(content, "ID")
+    listed = {row[0].strip("[]` ").upper() for row in rows if row and row[0].strip("[]` ")}
+    for finding_id in sorted(listed - ids.keys()):
+        errors.append(f"audit-context.md lists {finding_id}, but no finding file has that ID")
+    if listed:
+        for finding_id in sorted(ids.keys() - listed):
+            warnings.append(f"{finding_id} is missing from the audit-context.md Findings Summary")
+
+    header, rows = _table_rows(content, "Phase")
+    column = next((i for i, cell in enumerate(header) if cell.lower() == "findings"), None)
+    for row in rows if column is not None else ():
+        number = _phase_number(row[0])
+        if number is None or column >= len(row) or not row[column].isdigit():
+            continue
+        if int(row[column]) != phase_counts[number]:
+            warnings.append(f"audit-context.md counts {row[column]} findings for Phase {number}, "
+                            f"{phase_counts[number]} on disk")
+
+    for line in content.splitlines():
+        if "totals" in line.lower():
+            for severity, count in TOTALS_PATTERN.findall(line):
+                severity = severity.lower()
+                if int(count) != severity_counts[severity]:
+                    warnings.append(f"audit-context.md totals {count} {severity} findings, "
+                                    f"{severity_counts[severity]} on disk")
+            break
+
+    return errors, warnings
+
+
+def check_audit(audit_dir: Path) -> dict:
+    """Check the findings of an audit directory against each other and audit-context.md.
+
+    Each finding file is read once to index its ID, phase, severity and the
+    finding IDs it mentions; the conflicts are then found by lookups in
+    those indexes rather than by comparing findings pairwise.
+    """
+    errors = []
+    warnings = []
+
+    ids = defaultdict(list)
+    phase_counts = Counter()
+    severity_counts = Counter()
+    mentions = []
+    for path in sorted((audit_dir / "findings").glob("*.md")):
+        content = read_file(path)
+        finding_id = (extract_field(content, "id") or path.stem).strip("[]` ").upper()
+        ids[finding_id].append(path.name)
+
+        phase = _phase_number(extract_field(content, "phase"))
+        phase_counts[phase] += 1
+        severity = extract_field(content, "severity").lower()
+        severity_counts["info" if severity == "informational" else severity] += 1
+
+        prefix = finding_id.split("-", 1)[0]
+        if prefix in PREFIX_PHASES and phase in PHASES and PREFIX_PHASES[prefix] != phase:
+            warnings.append(f"{path.name}: ID {finding_id} has the Phase {PREFIX_PHASES[prefix]} prefix "
+                            f"{prefix}, but is filed under Phase {phase} ({PHASES[phase][0]}-###)")
+
+        for reference in {match.group() for match in ID_REFERENCE.finditer(content)}:
+            if reference != finding_id:
+                mentions.append((path.name, reference))
+
+    for finding_id, files in ids.items():
+        if len(files) > 1:
+            errors.append(f"Duplicate ID {finding_id} in {', '.join(files)}")
+
+    prefixes = PREFIX_PHASES.keys() | {finding_id.split("-", 1)[0] for finding_id in ids}
+    for name, reference in sorted(mentions):
+        if reference not in ids and reference.split("-", 1)[0] in prefixes:
+            warnings.append(f"{name}: references {reference}, which no finding has")
+
+    context_file = audit_dir / "audit-context.md"
+    if context_file.exists():
+        context_errors, context_warnings = check_context(
+            read_file(context_file), ids, phase_counts, severity_counts)
+        errors += context_errors
+        warnings += context_warnings
+
+    return {
+        "valid": len(errors) == 0,
+        "errors": errors,
+        "warnings": warnings,
+        "findings": sum(len(files) for files in ids.values()),
+    }
+
+
 def main():
     if len(sys.argv) < 2:
-        print("Usage: python validate_finding.py /path/to/finding.md", file=sys.stderr)
+        print("Usage: python validate_finding.py /path/to/finding.md | /path/to/.audit", file=sys.stderr)
         sys.exit(1)
 
     finding_path = Path(sys.argv[1]).resolve()
 
+    if finding_path.is_dir():
+        audit_dir = finding_path.parent if finding_path.name == "findings" else finding_path
+        if not (audit_dir / "findings").is_dir() and (audit_dir / ".audit").is_dir():
+            audit_dir = audit_dir / ".audit"
+        result = check_audit(audit_dir)
+        print(json.dumps(result, indent=2))
+        sys.exit(0 if result["valid"] else 1)
+
     if not finding_path.exists():
         result = {
             "valid": False,
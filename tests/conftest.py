@@ -144,7 +144,7 @@ def sample_finding_content():
 | **Severity** | High |
 | **Phase** | 3 |
 | **Status** | Open |
-| **OWASP** | A01:2021 |
+| **OWASP** | A03:2021 |
 | **CWE** | CWE-79 |
 
 ## Description
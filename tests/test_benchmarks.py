@@ -0,0 +1,66 @@
+"""
+Tests for benchmarks/bench_report.py
+
+Tests that synthetic corpora parse identically across field layouts and that
+baseline comparison flags only real regressions.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add benchmarks and scripts directories to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "benchmarks"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "skill" / "scripts"))
+
+from bench_report import LAYOUTS, compare, generate_corpus, render_finding
+from generate_report import load_findings, parse_finding
+
+
+class TestCorpus:
+    """Tests for synthetic corpus generation."""
+
+    def test_layouts_parse_identically(self, temp_dir):
+        """Test every field layout yields the same parsed finding."""
+        parsed = []
+        for layout in LAYOUTS:
+            path = temp_dir / f"{layout}.md"
+            path.write_text(render_finding(7, layout, random.Random(1)))
+            finding = parse_finding(path).to_dict()
+            finding.pop("file")
+            parsed.append(finding)
+        assert parsed[0] == parsed[1] == parsed[2]
+        assert parsed[0]["id"] == "BENCH-000007"
+        assert parsed[0]["description"] and parsed[0]["location"]
+
+    def test_generate_corpus(self, temp_dir):
+        """Test corpora are deterministic and fully loadable."""
+        audit_dir = generate_corpus(temp_dir / "a", 30)
+        findings = load_findings(audit_dir)
+        assert len(findings) == 30
+        again = generate_corpus(temp_dir / "b", 30)
+        assert [f.to_dict() for f in load_findings(again)] == [f.to_dict() for f in findings]
+
+
+class TestCompare:
+    """Tests for baseline comparison."""
+
+    BASELINE = {"sizes": {"1000": {"load_findings": 1.0, "render_csv": 0.01,
+                                   "peak_rss_mb": 50.0, "findings_per_second": 1000}}}
+
+    def test_within_tolerance(self):
+        """Test small slowdowns pass."""
+        results = {"1000": {"load_findings": 1.2, "peak_rss_mb": 55.0, "findings_per_second": 800}}
+        assert compare(results, self.BASELINE, 0.3) == []
+
+    def test_regression_reported(self):
+        """Test slowdowns and memory growth past tolerance are reported."""
+        results = {"1000": {"load_findings": 1.5, "peak_rss_mb": 80.0}}
+        regressions = compare(results, self.BASELINE, 0.3)
+        assert len(regressions) == 2
+        assert regressions[0].startswith("1000 findings: load_findings 1.5")
+
+    def test_noise_and_unknown_sizes_ignored(self):
+        """Test sub-threshold timings and sizes missing from the baseline are skipped."""
+        results = {"1000": {"render_csv": 0.04}, "10000": {"load_findings": 99.0}}
+        assert compare(results, self.BASELINE, 0.3) == []
@@ -0,0 +1,88 @@
+"""
+Tests for columnar.py
+
+Tests pivoting findings into dictionary-encoded and text columns, and the
+Parquet and NumPy archive writers when their libraries are installed.
+"""
+
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "skill" / "scripts"))
+
+import columnar
+from columnar import build_columns
+from generate_report import FINDING_FIELDS, load_findings, write_columnar_report
+
+
+RECORDS = [
+    {"id": "A-1", "severity": "high", "cwe": "CWE-79", "description": "x" * 900},
+    {"id": "A-2", "severity": "low", "cwe": ""},
+    {"id": "A-3", "severity": "high", "cwe": "CWE-79"},
+]
+
+
+class TestBuildColumns:
+    """Tests for pivoting records into columns."""
+
+    def test_dictionary_and_text_columns(self):
+        """Test categorical columns are dictionary-encoded and text kept whole."""
+        columns = build_columns(RECORDS, ("id", "severity", "cwe", "description"))
+        assert columns["severity"] == (["high", "low"], [0, 1, 0])
+        assert columns["cwe"] == (["CWE-79", ""], [0, 1, 0])
+        assert columns["id"] == ["A-1", "A-2", "A-3"]
+        assert columns["description"] == ["x" * 900, "", ""]
+
+
+class TestWriters:
+    """Tests for the optional Parquet and NumPy writers."""
+
+    def test_npz_round_trip(self):
+        """Test the NumPy archive decodes back to the original columns."""
+        pytest.importorskip("numpy")
+        columns = build_columns(RECORDS, ("id", "severity", "description"))
+        out = io.BytesIO()
+        columnar.write_npz(out, columns)
+        out.seek(0)
+        decoded = columnar.read_npz(out)
+        assert decoded == {"id": ["A-1", "A-2", "A-3"], "severity": ["high", "low", "high"],
+                           "description": ["x" * 900, "", ""]}
+
+    def test_parquet_dictionary_types(self):
+        """Test Parquet output keeps categorical columns dictionary-typed."""
+        pa = pytest.importorskip("pyarrow")
+        pq = pytest.importorskip("pyarrow.parquet")
+        columns = build_columns(RECORDS, ("id", "severity"))
+        out = io.BytesIO()
+        columnar.write_parquet(out, columns)
+        out.seek(0)
+        table = pq.read_table(out)
+        assert pa.types.is_dictionary(table.schema.field("severity").type)
+        assert table.column("severity").to_pylist() == ["high", "low", "high"]
+
+    def test_report_keeps_full_descriptions(self, sample_audit_dir):
+        """Test the export holds descriptions in full, not cut at 500 characters."""
+        pytest.importorskip("numpy")
+        long_text = "Long description. " * 60
+        path = sample_audit_dir / "findings" / "VULN-002.md"
+        path.write_text(path.read_text().replace("Password policy allows weak passwords.", long_text.strip()))
+        findings = load_findings(sample_audit_dir)
+        out = io.BytesIO()
+        write_columnar_report(out, findings, "npz")
+        out.seek(0)
+        decoded = columnar.read_npz(out)
+        assert list(decoded) == list(FINDING_FIELDS)
+        assert long_text.strip() in decoded["description"]
+
+    def test_missing_libraries_rejected(self, sample_audit_dir, monkeypatch):
+        """Test --format columnar fails cleanly when neither library is installed."""
+        import generate_report
+        monkeypatch.setattr(columnar, "pa", None)
+        monkeypatch.setattr(columnar, "np", None)
+        monkeypatch.setattr(sys, "argv", ["generate_report.py", str(sample_audit_dir), "--format", "columnar"])
+        with pytest.raises(SystemExit):
+            generate_report.parse_args()
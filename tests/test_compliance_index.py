@@ -0,0 +1,143 @@
+"""
+Tests for compliance_index.py
+
+Tests compiling the compliance mapping markdown into a control lookup index,
+caching the compiled index, and per-finding control lookups.
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "skill" / "scripts"))
+
+import compliance_index
+from compliance_index import (
+    BUNDLED_INDEX,
+    COMPLIANCE_MAPPING,
+    INDEX_CACHE_FILE,
+    compile_mapping,
+    load_compliance_index,
+    lookup_controls,
+)
+
+
+MAPPING = """# Compliance Mapping
+
+## SOC 2 Trust Service Criteria Mapping
+
+| Criteria | Description | Audit Phases | Key Checks |
+|----------|-------------|--------------|------------|
+| **CC6.1** | Logical Access | Phases 1, 2 | Authentication |
+| **CC7.1** | Detection Monitoring | Phase 9 | Logging |
+
+## GDPR (General Data Protection Regulation) Mapping
+
+| Requirement | Description | Audit Phases | Key Checks |
+|-------------|-------------|--------------|------------|
+| **32(1)(a)** | Encryption | Phase 5 | Encryption |
+| **32(1)(b)** | Confidentiality | Phases 1, 2 | Access control |
+| **32(1)(b)** | Integrity | Phase 5 | Checksums |
+| **32(1)(d)** | Testing | All Phases | Audits |
+
+## Automated Compliance Tagging
+
+| Finding Type | Auto-Tags |
+|--------------|-----------|
+| Sensitive Data Exposure | OWASP A02, GDPR Art.32(1)(a), PCI 3.4 |
+| Logging Failures | OWASP A09, SOC2 CC7.1 |
+"""
+
+
+@pytest.fixture
+def mapping_file(temp_dir):
+    path = temp_dir / "compliance-mapping.md"
+    path.write_text(MAPPING)
+    return path
+
+
+class TestCompileMapping:
+    """Tests for compiling the mapping markdown."""
+
+    def test_framework_catalogs(self):
+        """Test controls and descriptions are catalogued per framework."""
+        index = compile_mapping(MAPPING)
+        assert index["frameworks"]["SOC 2"] == {"CC6.1": "Logical Access", "CC7.1": "Detection Monitoring"}
+        assert index["frameworks"]["GDPR"]["32(1)(b)"] == "Confidentiality / Integrity"
+        assert index["frameworks"]["PCI-DSS"] == {}
+
+    def test_phase_lookup(self):
+        """Test phases map to every control listing them, but not 'All Phases' controls."""
+        index = compile_mapping(MAPPING)
+        assert index["phases"]["1"] == [["SOC 2", "CC6.1"], ["GDPR", "32(1)(b)"]]
+        assert ["GDPR", "32(1)(d)"] not in sum(index["phases"].values(), [])
+
+    def test_owasp_auto_tags(self):
+        """Test auto-tags map OWASP categories to catalogued controls only."""
+        index = compile_mapping(MAPPING)
+        assert index["owasp"]["A02"] == [["GDPR", "32(1)(a)"]]
+        assert index["owasp"]["A09"] == [["SOC 2", "CC7.1"]]
+
+    def test_repository_mapping(self):
+        """Test the shipped mapping covers all five frameworks."""
+        index = compile_mapping(COMPLIANCE_MAPPING.read_text(encoding="utf-8"))
+        assert list(index["frameworks"]) == ["SOC 2", "PCI-DSS", "HIPAA", "GDPR", "ISO 27001"]
+        assert all(index["frameworks"].values())
+        assert ["PCI-DSS", "6.5"] in index["owasp"]["A03"]
+
+
+class TestLoadComplianceIndex:
+    """Tests for loading and caching the compiled index."""
+
+    def test_missing_mapping(self, temp_dir):
+        """Test a missing mapping file yields no index."""
+        assert load_compliance_index(temp_dir / "missing.md") is None
+
+    def test_bundled_index_current(self):
+        """Test the index shipped in skill/data/ matches the repository mapping."""
+        assert json.loads(BUNDLED_INDEX.read_text(encoding="utf-8")) == load_compliance_index()
+
+    def test_bundled_index_without_mapping(self, temp_dir, monkeypatch):
+        """Test an installed skill without compliance/ falls back to the bundled index."""
+        monkeypatch.setattr(compliance_index, "COMPLIANCE_MAPPING", temp_dir / "missing.md")
+        index = load_compliance_index()
+        assert ["PCI-DSS", "6.5"] in index["owasp"]["A03"]
+
+    def test_warns_without_any_index(self, temp_dir, monkeypatch, capsys):
+        """Test a warning is printed once when neither the mapping nor the bundled index exists."""
+        monkeypatch.setattr(compliance_index, "COMPLIANCE_MAPPING", temp_dir / "missing.md")
+        monkeypatch.setattr(compliance_index, "BUNDLED_INDEX", temp_dir / "missing.json")
+        assert load_compliance_index() is None and load_compliance_index() is None
+        assert capsys.readouterr().err.count("Compliance mapping not found") == 1
+
+    def test_cache_written_and_reused(self, mapping_file, temp_dir):
+        """Test the compiled index is cached and read back."""
+        cache_dir = temp_dir / ".cache"
+        index = load_compliance_index(mapping_file, cache_dir)
+        cached = json.loads((cache_dir / INDEX_CACHE_FILE).read_text())
+        assert cached["index"] == index
+
+    def test_rebuilt_when_mapping_changes(self, mapping_file, temp_dir):
+        """Test edits to the mapping invalidate in-process and on-disk caches."""
+        cache_dir = temp_dir / ".cache"
+        load_compliance_index(mapping_file, cache_dir)
+        mapping_file.write_text(MAPPING.replace("Logical Access", "Access Controls"))
+        st = mapping_file.stat()
+        os.utime(mapping_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        index = load_compliance_index(mapping_file, cache_dir)
+        assert index["frameworks"]["SOC 2"]["CC6.1"] == "Access Controls"
+
+
+class TestLookupControls:
+    """Tests for per-finding control lookups."""
+
+    def test_phase_and_owasp_combined(self):
+        """Test phase and OWASP controls are merged without duplicates."""
+        index = compile_mapping(MAPPING)
+        assert lookup_controls(index, 5, "A02") == [["GDPR", "32(1)(a)"], ["GDPR", "32(1)(b)"]]
+        assert lookup_controls(index, None, "A09") == [["SOC 2", "CC7.1"]]
+        assert lookup_controls(index, 12, "") == []
@@ -0,0 +1,112 @@
+"""
+Tests for cvss.py
+
+Tests CVSS vector parsing, v3.0/v3.1 base and environmental scoring against
+reference scores, batch scoring and percentile helpers.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "skill" / "scripts"))
+
+import cvss
+from cvss import parse_vector, percentile, score_vectors, severity_rating
+
+
+class TestParseVector:
+    """Tests for vector parsing."""
+
+    def test_parse_v31(self):
+        """Test metrics are split into a dict."""
+        metrics = parse_vector("CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:H")
+        assert metrics["version"] == "3.1"
+        assert metrics["AV"] == "N"
+        assert metrics["A"] == "H"
+
+    def test_vector_inside_text(self):
+        """Test the vector is found inside surrounding text."""
+        metrics = parse_vector("9.8 (CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:H)")
+        assert metrics["version"] == "3.1"
+
+    def test_invalid(self):
+        """Test missing metrics and non-vectors are rejected."""
+        assert parse_vector("CVSS:3.1/AV:N/AC:L") is None
+        assert parse_vector("CVSS:3.1/AV:X/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:H") is None
+        assert parse_vector("#.#") is None
+        assert parse_vector("") is None
+
+    def test_v4_recognised(self):
+        """Test CVSS v4.0 vectors parse with their version."""
+        metrics = parse_vector("CVSS:4.0/AV:N/AC:L/AT:N/PR:N/UI:N/VC:H/VI:H/VA:H/SC:N/SI:N/SA:N")
+        assert metrics["version"] == "4.0"
+
+
+class TestScoreVectors:
+    """Tests for batch scoring against specification reference scores."""
+
+    @pytest.mark.parametrize("vector,base", [
+        ("CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:H", 9.8),
+        ("CVSS:3.1/AV:N/AC:L/PR:N/UI:R/S:C/C:L/I:L/A:N", 6.1),
+        ("CVSS:3.1/AV:N/AC:L/PR:L/UI:N/S:C/C:L/I:L/A:N", 6.4),
+        ("CVSS:3.1/AV:L/AC:L/PR:L/UI:N/S:U/C:H/I:N/A:N", 5.5),
+        ("CVSS:3.0/AV:N/AC:L/PR:N/UI:N/S:C/C:H/I:H/A:H", 10.0),
+        ("CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:N/I:N/A:N", 0.0),
+    ])
+    def test_base_scores(self, vector, base):
+        """Test base scores match the reference calculator."""
+        result = score_vectors([vector])[0]
+        assert result["base"] == base
+        assert result["environmental"] == base
+
+    def test_environmental_score(self):
+        """Test temporal, requirement and modified metrics lower the environmental score."""
+        vector = "CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:H/E:P/RL:O/RC:C/CR:L/IR:L/AR:L/MAV:L"
+        result = score_vectors([vector])[0]
+        assert result["base"] == 9.8
+        assert result["environmental"] == 5.9
+
+    def test_unscored_inputs(self):
+        """Test v4.0 and invalid vectors keep their place without scores."""
+        results = score_vectors(["CVSS:4.0/AV:N/AC:L/AT:N/PR:N/UI:N/VC:H/VI:H/VA:H/SC:N/SI:N/SA:N", "", "7.5"])
+        assert [r["version"] for r in results] == ["4.0", None, None]
+        assert all(r["base"] is None for r in results)
+
+    def test_repeated_vectors_scored_independently(self):
+        """Test duplicate inputs each get their own result dict."""
+        vector = "CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:H"
+        results = score_vectors([vector, vector])
+        results[0]["base"] = None
+        assert results[1]["base"] == 9.8
+
+    def test_pure_python_fallback(self, monkeypatch):
+        """Test scoring without NumPy gives the same results."""
+        vectors = [
+            "CVSS:3.1/AV:N/AC:L/PR:L/UI:N/S:C/C:L/I:L/A:N",
+            "CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:H/E:P/RL:O/RC:C/CR:L/IR:L/AR:L/MAV:L",
+        ]
+        expected = score_vectors(vectors)
+        monkeypatch.setattr(cvss, "np", None)
+        assert score_vectors(vectors) == expected
+
+
+class TestHelpers:
+    """Tests for rating and percentile helpers."""
+
+    def test_severity_rating(self):
+        """Test qualitative rating bands."""
+        assert severity_rating(9.0) == "critical"
+        assert severity_rating(8.9) == "high"
+        assert severity_rating(4.0) == "medium"
+        assert severity_rating(0.1) == "low"
+        assert severity_rating(0.0) == "none"
+        assert severity_rating(None) == ""
+
+    def test_percentile(self):
+        """Test linear-interpolated percentiles."""
+        assert percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.5
+        assert percentile([5.0], 90) == 5.0
+        assert percentile([], 50) == 0.0
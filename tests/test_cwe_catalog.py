@@ -0,0 +1,117 @@
+"""
+Tests for cwe_catalog.py
+
+Tests compiling the offline CWE catalog and looking up IDs, names, categories
+and OWASP Top 10 2021 mappings.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "skill" / "scripts"))
+
+import cwe_catalog
+from cwe_catalog import CWE_CATALOG, OWASP_2021, compile_catalog, cwe_ids, fallback_catalog, load_catalog
+from import_findings import classify, scan_record
+from validate_finding import validate_cwe, validate_cwe_owasp
+
+
+CATALOG = """# max-id: 2000
+89   W  A03  Improper Neutralization of Special Elements used in an SQL Command ('SQL Injection')
+16   C  A05  Configuration
+400  W  -    Uncontrolled Resource Consumption
+not a catalog line
+79   X  A03  Bad kind
+"""
+
+
+class TestCompileCatalog:
+    """Tests for compiling catalog text."""
+
+    def test_lookups(self):
+        """Test IDs are sorted and resolve to their name, kind and OWASP category."""
+        catalog = compile_catalog(CATALOG)
+        assert list(catalog.ids) == [16, 89, 400]
+        assert catalog.name(89).endswith("('SQL Injection')")
+        assert catalog.owasp(89) == "A03" and catalog.owasp(400) is None
+        assert catalog.is_category(16) and not catalog.is_category(89)
+        assert 79 not in catalog and catalog.name(79) is None
+        assert catalog.by_owasp("A05") == [16]
+
+    def test_assigned_range(self):
+        """Test uncatalogued IDs up to max-id exist and IDs beyond it do not."""
+        catalog = compile_catalog(CATALOG)
+        assert catalog.exists(1500) and not catalog.exists(2001) and not catalog.exists(0)
+        assert compile_catalog("400 W - Uncontrolled Resource Consumption").max_id == 400
+
+
+class TestBundledCatalog:
+    """Tests for the catalog shipped in skill/data/."""
+
+    def test_every_owasp_category_mapped(self):
+        """Test every line parses and each OWASP 2021 category has CWEs."""
+        lines = [line for line in CWE_CATALOG.read_text().splitlines() if line and not line.startswith("#")]
+        catalog = load_catalog()
+        assert len(catalog) == len(lines)
+        assert all(catalog.by_owasp(code) for code in OWASP_2021)
+        assert catalog.owasp(918) == "A10" and catalog.name(918) == "Server-Side Request Forgery (SSRF)"
+
+    def test_loaded_once(self):
+        """Test the compiled catalog is reused until the file changes."""
+        assert load_catalog() is load_catalog()
+
+    def test_shipped_with_skill(self):
+        """Test the catalog lives inside skill/, which is what gets installed."""
+        skill_dir = Path(__file__).parent.parent / "skill"
+        assert CWE_CATALOG.is_file() and skill_dir.resolve() in CWE_CATALOG.parents
+
+    def test_fallback_matches_catalog(self):
+        """Test the built-in fallback maps CWEs to the same OWASP categories as the catalog."""
+        catalog, fallback = load_catalog(), fallback_catalog()
+        for code in OWASP_2021:
+            assert fallback.by_owasp(code) == catalog.by_owasp(code)
+        assert [cwe for cwe in catalog.ids if catalog.is_category(cwe) and catalog.owasp(cwe)] == \
+            [cwe for cwe in fallback.ids if fallback.is_category(cwe)]
+        assert fallback.max_id == catalog.max_id
+
+    def test_missing_catalog(self, temp_dir, capsys):
+        """Test a missing catalog loads as None, or as the fallback with one warning."""
+        missing = temp_dir / "missing.txt"
+        assert load_catalog(missing) is None
+        assert load_catalog(missing, fallback=True).owasp(89) == "A03"
+        assert load_catalog(missing, fallback=True).name(89) == ""
+        assert capsys.readouterr().err.count("CWE catalog not found") == 1
+
+
+class TestMissingCatalog:
+    """Tests for validation and import when the catalog file is missing."""
+
+    @pytest.fixture(autouse=True)
+    def missing_catalog(self, temp_dir, monkeypatch):
+        monkeypatch.setattr(cwe_catalog, "CWE_CATALOG", temp_dir / "missing.txt")
+
+    def test_validation_still_checks(self, capsys):
+        """Test unknown IDs, categories and OWASP mismatches are still reported."""
+        assert validate_cwe("CWE-99999")[0] is False
+        assert "category" in validate_cwe("CWE-16")[1]
+        assert validate_cwe("CWE-89") == (True, None)
+        assert "A03:2021" in validate_cwe_owasp("CWE-89", "A01:2021")[1]
+        assert "CWE catalog not found" in capsys.readouterr().err
+
+    def test_classify_still_maps_owasp(self):
+        """Test scanner CWEs still get their OWASP category."""
+        record = scan_record("x", cwe="CWE-918")
+        assert classify(record) == 3
+        assert record["owasp"] == "A10:2021 - Server-Side Request Forgery"
+
+
+class TestCweIds:
+    """Tests for extracting CWE numbers from field values."""
+
+    def test_extracts_all_references(self):
+        """Test every CWE reference in a value is returned in order."""
+        assert cwe_ids("CWE-79: XSS, cwe 80") == [79, 80]
+        assert cwe_ids("79") == [] and cwe_ids("") == []
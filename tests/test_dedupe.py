@@ -0,0 +1,74 @@
+"""
+Tests for dedupe.py
+
+Tests shingling, MinHash signatures and LSH clustering of near-duplicate
+finding texts.
+"""
+
+import random
+import string
+import sys
+from pathlib import Path
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "skill" / "scripts"))
+
+from dedupe import SIGNATURE_SIZE, cluster, shingles, similarity, text_signature
+
+
+SQLI = ("SQL injection in login endpoint\nThe username parameter is concatenated into a SQL query "
+        "without parameterisation, allowing an attacker to read the users table.")
+SQLI_REWORDED = ("SQL injection in the login endpoint\nThe username parameter is concatenated into the "
+                 "SQL query without parameterization, which allows attackers to read the users table.")
+SQLI_OTHER = ("SQL injection in search endpoint\nThe q parameter is concatenated into a SQL query, "
+              "allowing an attacker to dump the products table.")
+RATE_LIMIT = ("Missing rate limiting on login endpoint\nThe login endpoint accepts unlimited password "
+              "attempts, allowing an attacker to brute force user accounts.")
+
+
+class TestSignature:
+    """Tests for shingles and signatures."""
+
+    def test_shingles_stem_and_drop_stop_words(self):
+        """Test shingles are stemmed word bigrams without stop words."""
+        assert shingles("The attackers are allowed") == {"attac allow"}
+        assert shingles("Injection") == {"injec"}
+        assert shingles("") == set()
+
+    def test_signature_is_deterministic(self):
+        """Test signatures have a fixed size, repeat exactly and are None for empty text."""
+        sig = text_signature(SQLI)
+        assert len(sig) == SIGNATURE_SIZE
+        assert sig == text_signature(SQLI)
+        assert similarity(sig, text_signature(SQLI)) == 1.0
+        assert text_signature("  ...  ") is None
+
+    def test_similarity_tracks_wording(self):
+        """Test rewordings score higher than different issues."""
+        sig = text_signature(SQLI)
+        assert similarity(sig, text_signature(SQLI_REWORDED)) >= 0.6
+        assert similarity(sig, text_signature(SQLI_OTHER)) < 0.6
+        assert similarity(sig, text_signature(RATE_LIMIT)) < 0.6
+
+
+class TestCluster:
+    """Tests for clustering texts."""
+
+    def test_rewordings_cluster(self):
+        """Test a reworded finding joins the original and distinct issues stay apart."""
+        assert cluster([SQLI, SQLI_OTHER, SQLI_REWORDED, RATE_LIMIT, ""]) == [0, 1, 0, 3, 4]
+
+    def test_keys_block_clusters(self):
+        """Test texts are only clustered with texts of the same key."""
+        assert cluster([SQLI, SQLI_REWORDED, SQLI], keys=["CWE-89", "CWE-79", "CWE-89"]) == [0, 1, 0]
+
+    def test_scales_linearly_with_high_recall(self):
+        """Test perturbed copies of many random texts are found without false merges."""
+        rng = random.Random(7)
+        vocabulary = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 10))) for _ in range(3000)]
+        originals = [" ".join(rng.choices(vocabulary, k=40)) for _ in range(2000)]
+        copies = [" ".join(w for w in text.split() if rng.random() > 0.05) for text in originals]
+        roots = cluster(originals + copies)
+        found = sum(roots[len(originals) + i] == i for i in range(len(originals)))
+        assert found >= 0.95 * len(originals)
+        assert len(set(roots[:len(originals)])) == len(originals)
@@ -0,0 +1,142 @@
+"""
+Tests for findings_index.py
+
+Tests building the SQLite findings index, incremental updates, filtered and
+full-text queries, and identifier normalization.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "skill" / "scripts"))
+
+from findings_index import (
+    INDEX_FILE,
+    normalize_cwe,
+    normalize_owasp,
+    parse_phase_number,
+    update_index,
+    query_index,
+    format_results,
+)
+
+
+class TestNormalization:
+    """Tests for identifier normalization helpers."""
+
+    def test_normalize_cwe(self):
+        """Test CWE references normalize to CWE-N."""
+        assert normalize_cwe("CWE-89: SQL Injection") == "CWE-89"
+        assert normalize_cwe("cwe 079") == "CWE-79"
+        assert normalize_cwe("89") == "CWE-89"
+        assert normalize_cwe("") == ""
+
+    def test_normalize_owasp(self):
+        """Test OWASP references normalize to Axx."""
+        assert normalize_owasp("A03:2021 - Injection") == "A03"
+        assert normalize_owasp("a3") == "A03"
+        assert normalize_owasp("A10:2021") == "A10"
+        assert normalize_owasp("none") == ""
+
+    def test_parse_phase_number(self):
+        """Test phase numbers are extracted from labels."""
+        assert parse_phase_number("Phase 12 - Synthesis") == 12
+        assert parse_phase_number("Unknown") is None
+
+
+class TestUpdateIndex:
+    """Tests for building and incrementally updating the index."""
+
+    def test_build_index(self, sample_audit_dir):
+        """Test initial build indexes every finding."""
+        stats = update_index(sample_audit_dir)
+        assert stats == {"added": 3, "updated": 0, "removed": 0, "total": 3}
+        assert (sample_audit_dir / INDEX_FILE).exists()
+
+    def test_unchanged_is_noop(self, sample_audit_dir):
+        """Test a second build does not reindex anything."""
+        update_index(sample_audit_dir)
+        stats = update_index(sample_audit_dir)
+        assert stats["added"] == stats["updated"] == stats["removed"] == 0
+
+    def test_changed_and_removed(self, sample_audit_dir):
+        """Test modified files are updated and deleted files removed."""
+        update_index(sample_audit_dir)
+        findings_dir = sample_audit_dir / "findings"
+        finding = findings_dir / "VULN-002.md"
+        finding.write_text(finding.read_text().replace("| Medium |", "| High |  "))
+        (findings_dir / "VULN-003.md").unlink()
+
+        stats = update_index(sample_audit_dir)
+        assert stats == {"added": 0, "updated": 1, "removed": 1, "total": 2}
+        assert [f["id"] for f in query_index(sample_audit_dir, severity=["high"])] == ["VULN-002"]
+
+    def test_rebuild(self, sample_audit_dir):
+        """Test --rebuild reindexes everything."""
+        update_index(sample_audit_dir)
+        stats = update_index(sample_audit_dir, rebuild=True)
+        assert stats["added"] == 3
+
+
+class TestQueryIndex:
+    """Tests for querying the index."""
+
+    @pytest.fixture
+    def indexed_dir(self, sample_audit_dir):
+        update_index(sample_audit_dir)
+        return sample_audit_dir
+
+    def test_query_all_sorted_by_severity(self, indexed_dir):
+        """Test unfiltered queries return everything, most severe first."""
+        ids = [f["id"] for f in query_index(indexed_dir)]
+        assert ids == ["VULN-001", "VULN-002", "VULN-003"]
+
+    def test_query_combined_filters(self, indexed_dir):
+        """Test severity, phase, status and CWE filters combine."""
+        results = query_index(indexed_dir, severity=["critical"], phase=5, status="Open", cwe="89")
+        assert [f["id"] for f in results] == ["VULN-001"]
+        assert query_index(indexed_dir, severity=["critical"], phase=1) == []
+
+    def test_query_owasp(self, indexed_dir):
+        """Test OWASP category filter."""
+        assert [f["id"] for f in query_index(indexed_dir, owasp="A03:2021")] == ["VULN-001"]
+
+    def test_full_text_query(self, indexed_dir):
+        """Test full-text search over description and recommendation."""
+        assert [f["id"] for f in query_index(indexed_dir, text="parameterized")] == ["VULN-001"]
+        assert [f["id"] for f in query_index(indexed_dir, text="HTTPS")] == ["VULN-003"]
+
+    def test_full_text_tracks_updates(self, indexed_dir):
+        """Test the full-text index follows updated findings."""
+        finding = indexed_dir / "findings" / "VULN-003.md"
+        finding.write_text(finding.read_text().replace("HTTPS", "TLS"))
+        update_index(indexed_dir)
+        assert query_index(indexed_dir, text="HTTPS") == []
+        assert [f["id"] for f in query_index(indexed_dir, text="TLS")] == ["VULN-003"]
+
+    def test_limit(self, indexed_dir):
+        """Test result limit."""
+        assert len(query_index(indexed_dir, limit=2)) == 2
+
+    def test_result_shape(self, indexed_dir):
+        """Test results use the same keys as parsed findings."""
+        finding = query_index(indexed_dir, cwe="CWE-89")[0]
+        assert finding["file"] == "VULN-001.md"
+        assert finding["phase"] == "5"
+        assert finding["recommendation"] == "Use parameterized queries."
+
+    def test_format_results(self, indexed_dir):
+        """Test plain-text result formatting."""
+        output = format_results(query_index(indexed_dir))
+        assert "VULN-001" in output
+        assert "\tPhase 5\t" in output
+        assert output.endswith("3 finding(s)")
+
+    def test_format_results_template_phase(self):
+        """Test template phase labels are not prefixed with "Phase" twice."""
+        output = format_results([{"id": "AUTH-001", "severity": "high", "phase": "Phase 1 - Authentication",
+                                  "status": "open", "title": "Weak hashing"}])
+        assert output.splitlines()[0] == "AUTH-001\thigh\tPhase 1\topen\tWeak hashing"
@@ -5,7 +5,9 @@ Tests report generation functionality including markdown, JSON, and CSV output,
 as well as executive summary, findings organization, and remediation roadmap.
 """
 
+import io
 import json
+import pickle
 import sys
 from pathlib import Path
 
@@ -20,6 +22,8 @@ from generate_report import (
     parse_finding,
     load_findings,
     load_audit_context,
+    PARALLEL_THRESHOLD,
+    FindingsCache,
     count_by_severity,
     count_by_phase,
     count_by_status,
@@ -33,6 +37,37 @@ from generate_report import (
     generate_csv_report,
     generate_summary_only,
     _group_by_field,
+    FindingGroups,
+    Finding,
+    read_finding_header,
+    parse_finding_header,
+    iter_findings,
+    write_csv_stream,
+    _external_sort,
+    extract_location,
+    finding_fingerprint,
+    diff_findings,
+    load_baseline,
+    write_delta_report,
+    write_delta_json,
+    write_markdown_report,
+    write_json_report,
+    write_csv_report,
+    extract_cvss,
+    score_findings,
+    summarize_cvss,
+    control_coverage,
+    write_output,
+    write_jsonl_report,
+    write_sarif_report,
+    cluster_duplicates,
+    collapse_duplicates,
+    write_html_report,
+    build_filter_index,
+    write_template_report,
+    BodyRef,
+    cached_bodies,
+    load_body,
 )
 
 
@@ -117,6 +152,134 @@ A test vulnerability.
         assert finding is None
 
 
+class TestFindingRecord:
+    """Tests for the slotted Finding record."""
+
+    def test_mapping_access(self, sample_audit_dir):
+        """Test findings support dict-style reads."""
+        finding = parse_finding(sample_audit_dir / "findings" / "VULN-001.md")
+        assert isinstance(finding, Finding)
+        assert finding["id"] == finding.id == "VULN-001"
+        assert finding.get("cwe") == "CWE-89"
+        assert finding.get("missing", "x") == "x"
+        with pytest.raises(KeyError):
+            finding["missing"]
+
+    def test_no_instance_dict(self, sample_audit_dir):
+        """Test findings do not carry a per-instance __dict__."""
+        finding = parse_finding(sample_audit_dir / "findings" / "VULN-001.md")
+        assert not hasattr(finding, "__dict__")
+
+    def test_enum_values_interned(self, temp_dir):
+        """Test severity, status and phase strings are shared between findings."""
+        for name in ("a", "b"):
+            (temp_dir / f"{name}.md").write_text("| **Severity** | High |\n| **Phase** | 3 |\n| **Status** | Open |\n")
+        a = parse_finding(temp_dir / "a.md")
+        b = parse_finding(temp_dir / "b.md")
+        assert a.severity is b.severity
+        assert a.status is b.status
+        assert a.phase is b.phase
+
+    def test_extract_location(self):
+        """Test affected-file extraction from the supported layouts."""
+        assert extract_location("**Location:** `src/app.py:12`") == "src/app.py:12"
+        assert extract_location("- **File(s):** `path/to/file.ts:10`") == "path/to/file.ts:10"
+        assert extract_location("| **Location** | `api/users.go:3` |") == "api/users.go:3"
+        assert extract_location("No location here") == ""
+
+    def test_dict_round_trip(self, sample_audit_dir):
+        """Test to_dict/from_dict round-trip."""
+        finding = parse_finding(sample_audit_dir / "findings" / "VULN-002.md")
+        assert Finding.from_dict(finding.to_dict()) == finding
+
+
+class TestLazyBody:
+    """Tests for body sections read from the finding file on demand."""
+
+    BODY = "# Lazy\n\n| **ID** | LAZY-1 |\n| **Severity** | High |\n\n## Description\n{desc}\n\n## Impact\nData loss.\n\n## Recommendation\nValidate input.\n"
+
+    def write(self, temp_dir, desc, newline="\n"):
+        path = temp_dir / "lazy.md"
+        path.write_bytes(self.BODY.format(desc=desc).replace("\n", newline).encode("utf-8"))
+        return path
+
+    def test_body_not_held_in_memory(self, temp_dir):
+        """Test parsing records byte spans and reads the text only when asked."""
+        finding = parse_finding(self.write(temp_dir, "Short."))
+        assert isinstance(finding._body, BodyRef)
+        assert finding.body() == ("Short.", "Data loss.", "Validate input.")
+        assert finding.description == "Short."
+
+    def test_full_description_without_limit(self, temp_dir):
+        """Test descriptions are no longer cut at 500 characters."""
+        desc = "Long description sentence. " * 60
+        finding = parse_finding(self.write(temp_dir, desc))
+        assert finding.description == desc.strip()
+        assert finding.to_dict()["description"] == desc.strip()
+
+    def test_non_ascii_offsets(self, temp_dir):
+        """Test byte spans stay aligned after multi-byte characters."""
+        finding = parse_finding(self.write(temp_dir, "Überprüfung — naïve café ✓."))
+        assert finding.body() == ("Überprüfung — naïve café ✓.", "Data loss.", "Validate input.")
+
+    def test_crlf_kept_as_text(self, temp_dir):
+        """Test CRLF files keep their body as newline-normalised text."""
+        finding = parse_finding(self.write(temp_dir, "Line one.\nLine two.", newline="\r\n"))
+        assert not isinstance(finding._body, BodyRef)
+        assert finding.description == "Line one.\nLine two."
+        assert finding.id == "LAZY-1"
+
+    def test_changed_file_reparsed(self, temp_dir):
+        """Test a file edited after parsing is reparsed instead of sliced at stale offsets."""
+        path = self.write(temp_dir, "Before.")
+        finding = parse_finding(path)
+        self.write(temp_dir, "After the file was edited.")
+        assert finding.description == "After the file was edited."
+
+    def test_missing_file_reads_empty(self, temp_dir):
+        """Test a deleted file yields empty sections rather than an error."""
+        path = self.write(temp_dir, "Gone soon.")
+        finding = parse_finding(path)
+        path.unlink()
+        assert finding.body() == ("", "", "")
+
+    def test_mmap_matches_read(self, temp_dir, monkeypatch):
+        """Test memory-mapped reads of large files return the same text."""
+        import generate_report
+        finding = parse_finding(self.write(temp_dir, "Mapped é."))
+        expected = finding.body()
+        monkeypatch.setattr(generate_report, "MMAP_THRESHOLD", 0)
+        assert load_body(finding._body) == expected
+
+    def test_read_once_per_render(self, temp_dir, monkeypatch):
+        """Test a markdown report reads each body once and keeps nothing afterwards."""
+        import generate_report
+        finding = parse_finding(self.write(temp_dir, "Read once."))
+        reads = []
+        monkeypatch.setattr(generate_report, "load_body", lambda ref: reads.append(ref) or load_body(ref))
+        with cached_bodies():
+            write_markdown_report(io.StringIO(), [finding], {})
+            write_csv_report(io.StringIO(), [finding])
+        assert len(reads) == 1
+        assert generate_report._body_cache is None
+        assert finding.description == "Read once." and len(reads) == 2
+
+    def test_pickle_keeps_reference(self, temp_dir):
+        """Test findings sent to worker processes carry spans, not text."""
+        finding = parse_finding(self.write(temp_dir, "x" * 5000))
+        assert len(pickle.dumps(finding)) < 1000
+        assert pickle.loads(pickle.dumps(finding)) == finding
+
+    def test_cache_stores_spans(self, sample_audit_dir):
+        """Test the findings cache stores body spans rather than text."""
+        uncached = load_findings(sample_audit_dir)
+        load_findings(sample_audit_dir, cache=True)
+        with FindingsCache(sample_audit_dir) as cache:
+            data = json.loads(cache.entries()["VULN-001.md"][3])
+        assert "spans" in data and "description" not in data
+        assert load_findings(sample_audit_dir, cache=True) == uncached
+
+
 class TestLoadFindings:
     """Tests for loading findings from directory."""
 
@@ -143,6 +306,110 @@ class TestLoadFindings:
         assert findings == []
 
 
+class TestParallelLoadFindings:
+    """Tests for parsing findings on a worker pool."""
+
+    @pytest.fixture
+    def large_audit_dir(self, temp_dir):
+        """Create an audit directory large enough to trigger parallel parsing."""
+        audit_dir = temp_dir / ".audit"
+        findings_dir = audit_dir / "findings"
+        findings_dir.mkdir(parents=True)
+        severities = ["Critical", "High", "Medium", "Low"]
+        for i in range(PARALLEL_THRESHOLD + 16):
+            (findings_dir / f"GEN-{i:03d}.md").write_text(f"""# Finding {i}
+
+| Field | Value |
+|-------|-------|
+| **ID** | GEN-{i:03d} |
+| **Severity** | {severities[i % 4]} |
+| **Phase** | {i % 13} |
+| **Status** | Open |
+
+## Description
+Generated finding number {i}.
+""")
+        return audit_dir
+
+    @pytest.mark.parametrize("pool", ["process", "thread"])
+    def test_parallel_matches_serial(self, large_audit_dir, pool):
+        """Test that pooled parsing returns the same findings in the same order."""
+        serial = load_findings(large_audit_dir)
+        parallel = load_findings(large_audit_dir, jobs=4, pool=pool)
+        assert parallel == serial
+
+    def test_order_is_deterministic(self, large_audit_dir):
+        """Test that findings keep filename order within a severity."""
+        findings = load_findings(large_audit_dir, jobs=4)
+        critical_ids = [f["id"] for f in findings if f["severity"] == "critical"]
+        assert critical_ids == sorted(critical_ids)
+
+    def test_small_dir_parses_serially(self, sample_audit_dir, monkeypatch):
+        """Test that small directories never start a worker pool."""
+        import generate_report
+
+        def fail(*args, **kwargs):
+            raise AssertionError("pool should not be used for small directories")
+
+        monkeypatch.setattr(generate_report, "ProcessPoolExecutor", fail)
+        findings = load_findings(sample_audit_dir, jobs=4)
+        assert len(findings) == 3
+
+
+class TestFindingsCache:
+    """Tests for the persistent parsed-findings cache."""
+
+    def test_cache_matches_uncached(self, sample_audit_dir):
+        """Test that cached loading returns the same findings."""
+        uncached = load_findings(sample_audit_dir)
+        assert load_findings(sample_audit_dir, cache=True) == uncached
+        assert load_findings(sample_audit_dir, cache=True) == uncached
+        assert (sample_audit_dir / ".cache" / "findings.sqlite").exists()
+
+    def test_unchanged_files_not_reparsed(self, sample_audit_dir, monkeypatch):
+        """Test that a warm cache skips parsing entirely."""
+        import generate_report
+
+        load_findings(sample_audit_dir, cache=True)
+        monkeypatch.setattr(generate_report, "parse_finding", lambda path: pytest.fail("reparsed"))
+        assert len(load_findings(sample_audit_dir, cache=True)) == 3
+
+    def test_changed_file_reparsed(self, sample_audit_dir):
+        """Test that modified files are picked up."""
+        load_findings(sample_audit_dir, cache=True)
+        finding = sample_audit_dir / "findings" / "VULN-002.md"
+        finding.write_text(finding.read_text().replace("| Medium |", "| High |  "))
+        findings = load_findings(sample_audit_dir, cache=True)
+        assert next(f for f in findings if f["id"] == "VULN-002")["severity"] == "high"
+
+    def test_deleted_file_purged(self, sample_audit_dir):
+        """Test that deleted findings are removed from the cache."""
+        load_findings(sample_audit_dir, cache=True)
+        (sample_audit_dir / "findings" / "VULN-003.md").unlink()
+        assert len(load_findings(sample_audit_dir, cache=True)) == 2
+        with FindingsCache(sample_audit_dir) as cache:
+            assert set(cache.entries()) == {"VULN-001.md", "VULN-002.md"}
+
+    def test_parser_version_invalidates(self, sample_audit_dir, monkeypatch):
+        """Test that bumping the parser version forces a reparse."""
+        import generate_report
+
+        load_findings(sample_audit_dir, cache=True)
+        calls = []
+        original = generate_report.parse_finding
+        monkeypatch.setattr(generate_report, "PARSER_VERSION", generate_report.PARSER_VERSION + 1)
+        monkeypatch.setattr(generate_report, "parse_finding", lambda p: calls.append(p) or original(p))
+        load_findings(sample_audit_dir, cache=True)
+        assert len(calls) == 3
+
+    def test_corrupt_cache_falls_back(self, sample_audit_dir):
+        """Test that an unreadable cache file does not break loading."""
+        cache_file = sample_audit_dir / ".cache" / "findings.sqlite"
+        cache_file.parent.mkdir()
+        cache_file.write_bytes(b"not a database" * 100)
+        assert len(load_findings(sample_audit_dir, cache=True)) == 3
+
+
 class TestLoadAuditContext:
     """Tests for loading audit context."""
 
@@ -183,6 +450,61 @@ class TestCountFunctions:
         assert counts["resolved"] >= 1
 
 
+class TestFindingGroups:
+    """Tests for the single-pass grouping engine."""
+
+    @staticmethod
+    def make_finding(fid, severity="medium", phase="1", status="open", owasp="", cwe=""):
+        return {"id": fid, "title": fid, "severity": severity, "phase": phase,
+                "status": status, "owasp": owasp, "cwe": cwe,
+                "description": "", "impact": "", "recommendation": ""}
+
+    def test_phases_grouped_by_number(self):
+        """Test Phase 1 findings are not listed under Phase 10-12."""
+        findings = [
+            self.make_finding("A", phase="1"),
+            self.make_finding("B", phase="Phase 10 - Error Handling"),
+            self.make_finding("C", phase="12"),
+            self.make_finding("D", phase="Unknown"),
+        ]
+        groups = FindingGroups(findings)
+        assert groups.phases() == ["Phase 1", "Phase 10", "Phase 12", "Unknown"]
+        assert groups.ids(groups.by_phase["Phase 1"]) == ["A"]
+        assert groups.ids(groups.by_phase["Phase 10"]) == ["B"]
+
+    def test_phase_section_has_no_cross_listing(self):
+        """Test the phase section lists each finding exactly once."""
+        findings = [self.make_finding("ONE", phase="1"), self.make_finding("TEN", phase="10")]
+        section = generate_findings_by_phase(findings)
+        assert section.count("| ONE |") == 1
+        assert "### Phase 1 (1 findings)" in section
+        assert "### Phase 10 (1 findings)" in section
+
+    def test_remediation_tiers(self):
+        """Test open findings are bucketed into remediation tiers."""
+        findings = [
+            self.make_finding("C", severity="critical"),
+            self.make_finding("H", severity="high"),
+            self.make_finding("H2", severity="high", status="resolved"),
+            self.make_finding("I", severity="informational"),
+        ]
+        groups = FindingGroups(findings)
+        assert groups.remediation == {
+            "immediate": [0], "short_term": [1], "medium_term": [], "backlog": [3],
+        }
+        assert groups.select(groups.remediation["short_term"]) == [findings[1]]
+
+    def test_counts_and_compliance(self, sample_audit_dir):
+        """Test grouped counts agree with the count_by_* helpers."""
+        findings = load_findings(sample_audit_dir)
+        groups = FindingGroups(findings)
+        assert groups.severity_counts() == count_by_severity(findings)
+        assert groups.phase_counts() == count_by_phase(findings)
+        assert groups.status_counts() == count_by_status(findings)
+        assert {k: groups.ids(v) for k, v in groups.by_cwe.items()} == _group_by_field(findings, "cwe")
+        assert {k: groups.ids(v) for k, v in groups.by_owasp.items()} == _group_by_field(findings, "owasp")
+
+
 class TestGenerateExecutiveSummary:
     """Tests for executive summary generation."""
 
@@ -210,6 +532,128 @@ class TestGenerateExecutiveSummary:
         assert "Key Concerns" in summary
 
 
+class TestCvssScoring:
+    """Tests for CVSS extraction and score statistics."""
+
+    VECTOR = "CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:H"
+
+    @pytest.fixture
+    def cvss_audit_dir(self, sample_audit_dir):
+        """Add CVSS rows to the metadata tables of two sample findings."""
+        findings_dir = sample_audit_dir / "findings"
+        for name, value in (("VULN-001.md", f"9.8 ({self.VECTOR})"), ("VULN-003.md", "3.1")):
+            path = findings_dir / name
+            path.write_text(path.read_text().replace(
+                "| **Status** |", f"| **CVSS Score** | {value} |\n| **Status** |"))
+        return sample_audit_dir
+
+    def test_extract_cvss(self):
+        """Test score fields, vectors elsewhere in the body and both together."""
+        assert extract_cvss("| **CVSS Score** | 7.5 |") == "7.5"
+        assert extract_cvss(f"Vector: {self.VECTOR}") == self.VECTOR
+        assert extract_cvss(f"| **CVSS Score** | 9.8 |\n\n{self.VECTOR}") == f"9.8 ({self.VECTOR})"
+        assert extract_cvss("| **Severity** | High |") == ""
+
+    def test_score_findings(self):
+        """Test vector scores win and explicit scores are a fallback."""
+        findings = [
+            {"cvss": f"5.0 ({self.VECTOR})", "status": "open"},
+            {"cvss": "4.2", "status": "open"},
+            {"cvss": "#.#", "status": "open"},
+            {"cvss": "", "status": "open"},
+        ]
+        scores = score_findings(findings)
+        assert scores[0]["score"] == 9.8
+        assert scores[1]["score"] == 4.2
+        assert scores[2] is None and scores[3] is None
+
+    def test_summarize_cvss(self):
+        """Test distribution, percentiles and open-weighted risk."""
+        findings = [
+            {"cvss": self.VECTOR, "status": "open"},
+            {"cvss": "6.0", "status": "open"},
+            {"cvss": "2.0", "status": "resolved"},
+            {"cvss": "", "status": "open"},
+        ]
+        stats = summarize_cvss(findings)
+        assert stats["scored"] == 3 and stats["unscored"] == 1
+        assert stats["median"] == 6.0
+        assert stats["max"] == 9.8
+        assert stats["distribution"]["critical"] == 1
+        assert stats["distribution"]["low"] == 1
+        assert stats["weighted_risk"] == 15.8
+        assert stats["open_scored"] == 2
+        assert summarize_cvss([{"cvss": "", "status": "open"}]) is None
+
+    def test_unscored_v4(self):
+        """Test a v4.0 vector without a score is kept as unscored rather than dropped."""
+        v4 = "CVSS:4.0/AV:N/AC:L/AT:N/PR:N/UI:N/VC:H/VI:H/VA:H/SC:N/SI:N/SA:N"
+        findings = [
+            {"id": "A-1", "cvss": v4, "status": "open"},
+            {"id": "A-2", "cvss": f"9.3 ({v4})", "status": "open"},
+        ]
+        scores = score_findings(findings)
+        assert scores[0]["version"] == "4.0" and scores[0]["score"] is None
+        assert scores[1]["score"] == 9.3
+        stats = summarize_cvss(findings)
+        assert stats["unscored_v4"] == ["A-1"]
+        assert stats["scored"] == 1 and stats["unscored"] == 1
+        only_v4 = summarize_cvss(findings[:1])
+        assert only_v4["scored"] == 0 and only_v4["mean"] is None and only_v4["unscored_v4"] == ["A-1"]
+
+    def test_unscored_v4_reported(self, cvss_audit_dir, monkeypatch, capsys):
+        """Test unscored v4.0 findings are named in the report, its template and on stderr."""
+        import re
+        import generate_report
+        from generate_report import REPORT_TEMPLATE
+        from templating import load_template
+        path = cvss_audit_dir / "findings" / "VULN-002.md"
+        path.write_text(path.read_text().replace(
+            "| **Status** |",
+            "| **CVSS Score** | CVSS:4.0/AV:N/AC:L/AT:N/PR:N/UI:N/VC:H/VI:H/VA:H/SC:N/SI:N/SA:N |\n| **Status** |"))
+        findings = load_findings(cvss_audit_dir)
+        context = load_audit_context(cvss_audit_dir)
+        builtin = io.StringIO()
+        write_markdown_report(builtin, findings, context)
+        assert "**Unscored CVSS v4.0:** 1 finding(s)" in builtin.getvalue()
+        assert "not counted in the CVSS statistics: VULN-002." in builtin.getvalue()
+        templated = io.StringIO()
+        write_template_report(templated, findings, context, load_template(REPORT_TEMPLATE))
+        generated = re.compile(r"\*\*Generated:\*\* .*")
+        assert generated.sub("", templated.getvalue()) == generated.sub("", builtin.getvalue())
+
+        monkeypatch.setattr(sys, "argv", ["generate_report.py", str(cvss_audit_dir), "--format", "json"])
+        generate_report.main()
+        assert "CVSS v4.0 vector but no numeric score" in capsys.readouterr().err
+
+    def test_executive_summary_section(self, cvss_audit_dir):
+        """Test the executive summary shows CVSS statistics only when scored."""
+        findings = load_findings(cvss_audit_dir)
+        summary = generate_executive_summary(findings, load_audit_context(cvss_audit_dir))
+        assert "### CVSS Scores" in summary
+        assert "| **Scored Findings** | 2 of 3 |" in summary
+        assert "| **CVSS-Weighted Open Risk** | 9.8 (1 open) |" in summary
+        assert summary == generate_summary_only(cvss_audit_dir)
+
+    def test_no_section_without_scores(self, sample_audit_dir):
+        """Test audits without CVSS data keep the original summary."""
+        assert "CVSS" not in generate_summary_only(sample_audit_dir)
+
+    def test_json_report(self, cvss_audit_dir):
+        """Test the JSON report carries CVSS statistics and per-finding scores."""
+        report = json.loads(generate_json_report(cvss_audit_dir))
+        assert report["summary"]["cvss"]["scored"] == 2
+        assert len(report["cvss_scores"]) == len(report["findings"])
+        scored = {report["findings"][i]["id"]: s for i, s in enumerate(report["cvss_scores"]) if s}
+        assert scored["VULN-001"]["version"] == "3.1"
+        assert scored["VULN-003"]["score"] == 3.1
+
+    def test_json_control_coverage(self, sample_audit_dir):
+        """Test the JSON report includes per-framework control coverage."""
+        report = json.loads(generate_json_report(sample_audit_dir))
+        assert report["compliance"]["frameworks"]["PCI-DSS"]["6.5"]["findings"] == ["VULN-001"]
+
+
 class TestGenerateFindingsSections:
     """Tests for findings section generation."""
 
@@ -263,6 +707,28 @@ class TestGenerateComplianceSummary:
         if "CWE" in compliance:
             assert "CWE-" in compliance
 
+    def test_control_coverage(self, sample_audit_dir):
+        """Test findings map to framework controls by phase and OWASP category."""
+        findings = load_findings(sample_audit_dir)
+        coverage = control_coverage(FindingGroups(findings))
+        assert list(coverage) == ["SOC 2", "PCI-DSS", "HIPAA", "GDPR", "ISO 27001"]
+        assert coverage["PCI-DSS"]["6.5"]["findings"] == ["VULN-001"]
+        assert coverage["PCI-DSS"]["6.5"]["open"] == 1
+        assert coverage["PCI-DSS"]["8.3"]["findings"] == ["VULN-002"]
+        assert coverage["PCI-DSS"]["3.5"]["findings"] == []
+
+    def test_control_coverage_tables(self, sample_audit_dir):
+        """Test the compliance section renders one coverage table per framework."""
+        compliance = generate_compliance_summary(load_findings(sample_audit_dir))
+        assert "### Control Coverage" in compliance
+        assert "#### ISO 27001" in compliance
+        assert "| 6.5 | Common Vulnerabilities | 1 | VULN-001 |" in compliance
+
+    def test_no_coverage_without_mapped_findings(self):
+        """Test findings without phase or OWASP data get no coverage tables."""
+        findings = [Finding(file="X-1.md", id="X-1", title="T", severity="low", phase="Unknown", status="open")]
+        assert "Control Coverage" not in generate_compliance_summary(findings)
+
 
 class TestGenerateReport:
     """Tests for complete report generation."""
@@ -324,6 +790,13 @@ class TestGenerateJSONReport:
         assert isinstance(data["findings"], list)
         assert len(data["findings"]) == 3
 
+    def test_json_remediation_references_findings(self, sample_audit_dir):
+        """Test remediation lists index into the findings array."""
+        data = json.loads(generate_json_report(sample_audit_dir))
+        immediate = [data["findings"][i]["id"] for i in data["remediation"]["immediate"]]
+        assert immediate == ["VULN-001"]
+        assert data["remediation"]["backlog"] == []
+
     def test_json_remediation_priorities(self, sample_audit_dir):
         """Test JSON remediation priorities."""
         json_str = generate_json_report(sample_audit_dir)
@@ -361,6 +834,270 @@ class TestGenerateCSVReport:
         assert "Critical" in csv_str or "critical" in csv_str
 
 
+class TestStreamingWriters:
+    """Tests for renderers that write straight to a file handle."""
+
+    def test_write_markdown_to_file(self, sample_audit_dir, temp_dir):
+        """Test markdown renderer writes the full report to a file."""
+        findings = load_findings(sample_audit_dir)
+        context = load_audit_context(sample_audit_dir)
+        path = temp_dir / "report.md"
+        with open(path, "w", encoding="utf-8") as out:
+            write_markdown_report(out, findings, context)
+        content = path.read_text(encoding="utf-8")
+        assert content.startswith("# Security Audit Report")
+        assert "Remediation Roadmap" in content
+        assert content.endswith("*Report generated by Codebase Security Audit Framework*\n")
+
+    def test_write_json_matches_generate(self, sample_audit_dir, temp_dir):
+        """Test incremental JSON encoding produces the same document."""
+        findings = load_findings(sample_audit_dir)
+        context = load_audit_context(sample_audit_dir)
+        path = temp_dir / "report.json"
+        with open(path, "w", encoding="utf-8") as out:
+            write_json_report(out, findings, context)
+        streamed = json.loads(path.read_text(encoding="utf-8"))
+        generated = json.loads(generate_json_report(sample_audit_dir))
+        streamed["metadata"].pop("generated_at")
+        generated["metadata"].pop("generated_at")
+        assert streamed == generated
+
+    def test_write_csv_to_file(self, sample_audit_dir, temp_dir):
+        """Test CSV renderer output matches the string variant."""
+        findings = load_findings(sample_audit_dir)
+        path = temp_dir / "findings.csv"
+        with open(path, "w", encoding="utf-8", newline="") as out:
+            write_csv_report(out, findings)
+        assert path.read_bytes().decode("utf-8") == generate_csv_report(sample_audit_dir)
+
+
+class TestJsonlReport:
+    """Tests for JSON Lines output."""
+
+    def test_one_finding_per_line_then_summary(self, sample_audit_dir):
+        """Test each line is a compact finding and the last is the summary."""
+        findings = load_findings(sample_audit_dir)
+        out = io.StringIO()
+        write_jsonl_report(out, findings)
+        lines = out.getvalue().splitlines()
+        records = [json.loads(line) for line in lines]
+        assert len(records) == len(findings) + 1
+        assert all(r["record"] == "finding" for r in records[:-1])
+        assert records[0]["id"] == findings[0].id and ": " not in lines[0]
+        summary = records[-1]
+        assert summary["record"] == "summary"
+        report = json.loads(generate_json_report(sample_audit_dir))["summary"]
+        for key in ("total_findings", "risk_level", "by_severity", "by_status", "by_phase"):
+            assert summary[key] == report[key]
+
+    def test_stream_matches_loaded(self, sample_audit_dir, monkeypatch):
+        """Test --stream writes the same records, in directory order."""
+        import generate_report
+        monkeypatch.setattr(sys, "argv", ["generate_report.py", str(sample_audit_dir),
+                                          "--format", "jsonl", "--stream"])
+        generate_report.main()
+        records = [json.loads(line) for line in (sample_audit_dir / "findings.jsonl").open()]
+        expected = {f.id: f.to_dict() for f in load_findings(sample_audit_dir)}
+        for record in records[:-1]:
+            assert {k: v for k, v in record.items() if k != "record"} == expected[record["id"]]
+        assert records[-1]["total_findings"] == len(expected)
+
+
+class TestSarifReport:
+    """Tests for SARIF 2.1.0 output."""
+
+    @staticmethod
+    def _finding(**fields):
+        base = dict(file="x.md", id="X-1", title="T", severity="high", phase="Phase 3", status="open")
+        base.update(fields)
+        return Finding(**base)
+
+    def test_results_and_deduplicated_rules(self):
+        """Test each finding is a result and findings sharing a CWE share one rule."""
+        findings = [
+            self._finding(id="API-1", cwe="CWE-89: SQL Injection", owasp="A03:2021 - Injection",
+                          location="src/db.py:10-12", description="Raw query."),
+            self._finding(id="API-2", cwe="cwe 89", severity="medium", location="src/other.py"),
+            self._finding(id="LOGIC-1", title="Race in checkout", severity="low", status="resolved"),
+        ]
+        out = io.StringIO()
+        write_sarif_report(out, findings)
+        log = json.loads(out.getvalue())
+        assert log["version"] == "2.1.0"
+        run = log["runs"][0]
+        rules = run["tool"]["driver"]["rules"]
+        assert [r["id"] for r in rules] == ["CWE-89", "LOGIC-1"]
+        assert "external/cwe/cwe-89" in rules[0]["properties"]["tags"]
+        assert "owasp/A03:2021" in rules[0]["properties"]["tags"]
+        assert rules[1]["shortDescription"]["text"] == "Race in checkout"
+
+        first, second, third = run["results"]
+        assert first["ruleIndex"] == second["ruleIndex"] == 0
+        assert (first["level"], second["level"]) == ("error", "warning")
+        assert first["message"]["text"] == "T\n\nRaw query."
+        location = first["locations"][0]["physicalLocation"]
+        assert location["artifactLocation"]["uri"] == "src/db.py"
+        assert location["region"] == {"startLine": 10, "endLine": 12}
+        assert "region" not in second["locations"][0]["physicalLocation"]
+        assert third["kind"] == "pass" and "locations" not in third
+        assert first["partialFingerprints"]["auditFinding/v1"] == finding_fingerprint(findings[0])
+
+    def test_stream_matches_loaded(self, sample_audit_dir, monkeypatch):
+        """Test --stream writes the same results and rules as the loaded report."""
+        import generate_report
+        monkeypatch.setattr(sys, "argv", ["generate_report.py", str(sample_audit_dir),
+                                          "--format", "sarif", "--stream"])
+        generate_report.main()
+        streamed = json.loads((sample_audit_dir / "findings.sarif").read_text())["runs"][0]
+        out = io.StringIO()
+        write_sarif_report(out, load_findings(sample_audit_dir))
+        loaded = json.loads(out.getvalue())["runs"][0]
+
+        def by_id(run):
+            return {r["properties"]["id"]: {**r, "ruleIndex": None} for r in run["results"]}
+
+        assert by_id(streamed) == by_id(loaded)
+        rules = [{r["id"]: r for r in run["tool"]["driver"]["rules"]} for run in (streamed, loaded)]
+        assert rules[0] == rules[1]
+
+    def test_stream_rule_for_body_cwe(self, sample_audit_dir, monkeypatch):
+        """Test a CWE given only below the metadata table still gets a driver rule when streamed."""
+        import generate_report
+        (sample_audit_dir / "findings" / "FE-001.md").write_text(
+            "# Stored XSS\n\n| Field | Value |\n|-------|-------|\n| **ID** | FE-001 |\n"
+            "| **Severity** | High |\n| **Phase** | 6 |\n\n## Details\n\n**CWE:** CWE-79\n")
+        monkeypatch.setattr(sys, "argv", ["generate_report.py", str(sample_audit_dir),
+                                          "--format", "sarif", "--stream"])
+        generate_report.main()
+        run = json.loads((sample_audit_dir / "findings.sarif").read_text())["runs"][0]
+        rule_ids = [r["id"] for r in run["tool"]["driver"]["rules"]]
+        result = next(r for r in run["results"] if r["properties"]["id"] == "FE-001")
+        assert result["ruleId"] == "CWE-79"
+        assert rule_ids[result["ruleIndex"]] == "CWE-79"
+
+    def test_stream_parses_once(self, sample_audit_dir, monkeypatch):
+        """Test --stream reads the findings directory in one pass for both rules and results."""
+        import generate_report
+        passes = []
+        iter_findings = generate_report.iter_findings
+
+        def counting_iter_findings(*args, **kwargs):
+            passes.append(args)
+            return iter_findings(*args, **kwargs)
+
+        monkeypatch.setattr(generate_report, "iter_findings", counting_iter_findings)
+        monkeypatch.setattr(sys, "argv", ["generate_report.py", str(sample_audit_dir),
+                                          "--format", "sarif", "--stream"])
+        generate_report.main()
+        assert len(passes) == 1
+        run = json.loads((sample_audit_dir / "findings.sarif").read_text())["runs"][0]
+        assert len(run["results"]) == 3 and run["tool"]["driver"]["rules"]
+
+    def test_spooled_to_disk(self, sample_audit_dir, monkeypatch):
+        """Test results past SARIF_SPOOL_SIZE go through a temporary file unchanged."""
+        import generate_report
+        findings = load_findings(sample_audit_dir)
+        in_memory = io.StringIO()
+        write_sarif_report(in_memory, findings)
+        monkeypatch.setattr(generate_report, "SARIF_SPOOL_SIZE", 1)
+        spooled = io.StringIO()
+        write_sarif_report(spooled, findings)
+        assert spooled.getvalue() == in_memory.getvalue()
+
+
+class TestHtmlReport:
+    """Tests for the offline HTML report."""
+
+    @staticmethod
+    def _load_js(path, prefix):
+        text = path.read_text(encoding="utf-8")
+        assert text.startswith(prefix)
+        return text[len(prefix):].rstrip().rstrip(";")
+
+    def test_filter_index(self, sample_audit_dir):
+        """Test facets are dictionary-encoded with codes aligned to the findings."""
+        findings = load_findings(sample_audit_dir)
+        facets = build_filter_index(FindingGroups(findings))
+        severity = facets["severity"]
+        assert severity["values"] == ["critical", "medium", "low"]
+        assert [severity["values"][c] for c in severity["codes"]] == [f.severity for f in findings]
+        cwe = facets["cwe"]
+        assert cwe["values"] == ["CWE-89", "CWE-521", ""]
+        assert cwe["counts"] == [1, 1, 1]
+        assert facets["phase"]["values"] == ["Phase 1", "Phase 5", "Phase 7"]
+
+    def test_shell_and_shards(self, sample_audit_dir, monkeypatch):
+        """Test the shell references a versioned data directory holding the index and shards."""
+        import generate_report
+        monkeypatch.setattr(generate_report, "HTML_SHARD_SIZE", 2)
+        findings = load_findings(sample_audit_dir)
+        context = load_audit_context(sample_audit_dir)
+        data_dir = sample_audit_dir / "report-data"
+        out = io.StringIO()
+        write_html_report(out, findings, context, data_dir)
+
+        shell = out.getvalue()
+        [version_dir] = data_dir.iterdir()
+        assert f'src="report-data/{version_dir.name}/index.js"' in shell
+        assert "<title>Security Audit Report - Test Application</title>" in shell
+        index = json.loads(self._load_js(version_dir / "index.js", "window.AUDIT_INDEX = "))
+        assert index["total"] == 3 and index["shards"] == 2
+        assert index["summary"]["by_severity"]["critical"] == 1
+        shard = self._load_js(version_dir / "shard-00001.js", "auditShard(1,").rstrip(")")
+        row = json.loads(shard)[0]
+        assert dict(zip(index["columns"], row))["id"] == findings[2].id
+
+    def test_old_versions_pruned(self, sample_audit_dir, monkeypatch):
+        """Test only the previous data version is kept beside the new one."""
+        import generate_report
+        monkeypatch.setattr(sys, "argv", ["generate_report.py", str(sample_audit_dir), "--format", "html"])
+        for _ in range(3):
+            generate_report.main()
+        versions = sorted(p.name for p in (sample_audit_dir / "report-data").iterdir())
+        assert len(versions) == 2
+        assert versions[-1] in (sample_audit_dir / "final-report.html").read_text()
+
+
+class TestTemplateReport:
+    """Tests for template-driven markdown reports."""
+
+    def test_default_template_matches_builtin(self, sample_audit_dir):
+        """Test the shipped template reproduces the built-in markdown report."""
+        import re
+        from generate_report import REPORT_TEMPLATE
+        from templating import load_template
+        findings = load_findings(sample_audit_dir)
+        context = load_audit_context(sample_audit_dir)
+        builtin = io.StringIO()
+        write_markdown_report(builtin, findings, context)
+        templated = io.StringIO()
+        write_template_report(templated, findings, context, load_template(REPORT_TEMPLATE))
+        generated = re.compile(r"\*\*Generated:\*\* .*")
+        assert generated.sub("", templated.getvalue()) == generated.sub("", builtin.getvalue())
+
+    def test_template_flag(self, sample_audit_dir, temp_dir, monkeypatch):
+        """Test --template renders a custom layout into final-report.md."""
+        import generate_report
+        template = temp_dir / "custom.md.tmpl"
+        template.write_text("# {{ context.project_name }}\n{% for f in findings %}\n- {{ f.id }}\n{% endfor %}\n")
+        monkeypatch.setattr(sys, "argv", ["generate_report.py", str(sample_audit_dir),
+                                          "--template", str(template)])
+        generate_report.main()
+        assert (sample_audit_dir / "final-report.md").read_text() == \
+            "# Test Application\n- VULN-001\n- VULN-002\n- VULN-003\n"
+
+    def test_invalid_template(self, sample_audit_dir, temp_dir, monkeypatch, capsys):
+        """Test a template that does not compile is reported without a traceback."""
+        import generate_report
+        template = temp_dir / "bad.md.tmpl"
+        template.write_text("{% for f in findings %}")
+        monkeypatch.setattr(sys, "argv", ["generate_report.py", str(sample_audit_dir),
+                                          "--template", str(template)])
+        with pytest.raises(SystemExit):
+            generate_report.main()
+        assert "unclosed for block" in capsys.readouterr().err
+
+
 class TestGenerateSummaryOnly:
     """Tests for summary-only generation."""
 
@@ -373,6 +1110,93 @@ class TestGenerateSummaryOnly:
         assert "Findings by Phase" not in summary
 
 
+class TestHeaderOnlySummary:
+    """Tests for the header-only --summary-only fast path."""
+
+    def test_header_stops_at_first_section_after_table(self, sample_audit_dir):
+        """Test header reads stop before the finding body."""
+        header = read_finding_header(sample_audit_dir / "findings" / "VULN-001.md")
+        assert "| **CWE** | CWE-89 |" in header
+        assert "## Description" not in header
+        assert "parameterized" not in header
+
+    def test_header_keeps_heading_before_table(self, temp_dir):
+        """Test a '## Classification' heading before the table is not a stop point."""
+        path = temp_dir / "AUTH-001.md"
+        path.write_text("# Title\n\n## Classification\n\n| **Severity** | High |\n| **Phase** | 1 |\n\n## Summary\nBody\n")
+        finding = parse_finding_header(path)
+        assert finding.severity == "high"
+        assert finding.phase == "1"
+        assert finding.description == ""
+
+    def test_header_matches_full_parse_metadata(self, sample_audit_dir):
+        """Test header-only parsing agrees with full parsing on metadata."""
+        path = sample_audit_dir / "findings" / "VULN-002.md"
+        full = parse_finding(path)
+        header = parse_finding_header(path)
+        for field in ("id", "severity", "phase", "status", "owasp", "cwe"):
+            assert header[field] == full[field]
+
+    def test_summary_matches_full_summary(self, sample_audit_dir):
+        """Test the fast path renders the same summary as the full pipeline."""
+        findings = load_findings(sample_audit_dir)
+        context = load_audit_context(sample_audit_dir)
+        assert generate_summary_only(sample_audit_dir) == generate_executive_summary(findings, context)
+
+    def test_key_concerns_top_k(self, temp_dir):
+        """Test key concerns keep the most severe findings in file order."""
+        audit_dir = temp_dir / ".audit"
+        findings_dir = audit_dir / "findings"
+        findings_dir.mkdir(parents=True)
+        for i, severity in enumerate(["High", "Low", "High", "Critical", "High", "Critical"]):
+            (findings_dir / f"F-{i}.md").write_text(f"| **ID** | F-{i} |\n| **Severity** | {severity} |\n| **Phase** | 1 |\n")
+        summary = generate_summary_only(audit_dir)
+        concerns = summary.split("### Key Concerns")[1]
+        assert concerns.index("F-3") < concerns.index("F-5") < concerns.index("F-0")
+        assert "F-2" not in concerns
+        assert "| **Total Findings** | 6 |" in summary
+
+
+class TestStreamingMode:
+    """Tests for the constant-memory --stream mode."""
+
+    def test_iter_findings_is_lazy(self, sample_audit_dir):
+        """Test iter_findings yields findings without building a list."""
+        it = iter_findings(sample_audit_dir)
+        assert not isinstance(it, list)
+        assert sorted(f["id"] for f in it) == ["VULN-001", "VULN-002", "VULN-003"]
+
+    def test_iter_findings_missing_dir(self, temp_dir):
+        """Test iter_findings on a directory without findings."""
+        assert list(iter_findings(temp_dir)) == []
+
+    def test_stream_csv_unsorted_has_all_rows(self, sample_audit_dir):
+        """Test streamed CSV contains every finding."""
+        import io
+        out = io.StringIO()
+        write_csv_stream(out, sample_audit_dir)
+        lines = out.getvalue().strip().split("\n")
+        assert len(lines) == 4
+        assert "ID" in lines[0]
+
+    def test_stream_csv_sorted_matches_csv_report(self, sample_audit_dir):
+        """Test --stream --sorted output equals the in-memory CSV report."""
+        import io
+        out = io.StringIO()
+        write_csv_stream(out, sample_audit_dir, sort=True)
+        assert out.getvalue() == generate_csv_report(sample_audit_dir)
+
+    def test_external_sort_merges_runs(self):
+        """Test the on-disk merge sort across several runs."""
+        rows = [[str(n), f"f{n % 7}"] for n in range(50, 0, -1)]
+        result = list(_external_sort(iter(rows), key=lambda r: int(r[0]), run_size=8))
+        assert [int(r[0]) for r in result] == list(range(1, 51))
+
+    def test_stream_summary_matches(self, sample_audit_dir):
+        """Test the streamed summary equals the regular summary."""
+        assert generate_summary_only(sample_audit_dir, stream=True) == generate_summary_only(sample_audit_dir)
+
+
 class TestGroupByField:
     """Tests for grouping utility."""
 
@@ -396,3 +1220,259 @@ class TestGroupByField:
         grouped = _group_by_field(findings, "category")
         assert "auth" in grouped
         assert "" not in grouped  # Empty strings filtered out
+
+
+class TestDuplicateClusters:
+    """Tests for near-duplicate clustering in reports."""
+
+    DESCRIPTION = ("The username parameter is concatenated into a SQL query without "
+                   "parameterisation, allowing an attacker to read the users table.")
+
+    def make_findings(self):
+        reworded = self.DESCRIPTION.replace("a SQL", "the SQL").replace("allowing an attacker", "which allows attackers")
+        return [
+            Finding("a.md", "API-002", "SQL injection in login", "medium", "Phase 3", "open",
+                    cwe="CWE-89", description=self.DESCRIPTION),
+            Finding("b.md", "API-001", "Stored XSS in comments", "high", "Phase 3", "open",
+                    cwe="CWE-79", description="Comment bodies are rendered without escaping."),
+            Finding("c.md", "AUTH-004", "SQL injection in the login", "high", "Phase 1", "open",
+                    cwe="CWE-89: SQL Injection", description=reworded),
+            Finding("d.md", "API-003", "SQL injection in login", "critical", "Phase 3", "resolved",
+                    cwe="CWE-89", description=self.DESCRIPTION),
+        ]
+
+    def test_clusters_and_representative(self):
+        """Test rewordings cluster and the most severe unresolved member represents them."""
+        findings = self.make_findings()
+        clusters = cluster_duplicates(findings)
+        assert len(clusters) == 1
+        assert clusters[0]["id"] == "DUP-001"
+        assert [f.id for f in clusters[0]["members"]] == ["AUTH-004", "API-002", "API-003"]
+        assert clusters[0]["representative"].id == "AUTH-004"
+        assert [f.id for f in collapse_duplicates(findings, clusters)] == ["API-001", "AUTH-004"]
+
+    def test_report_sections(self):
+        """Test the markdown, template and JSON reports list the clusters."""
+        from generate_report import REPORT_TEMPLATE
+        from templating import load_template
+        findings = self.make_findings()
+        clusters = cluster_duplicates(findings)
+        out = io.StringIO()
+        write_markdown_report(out, collapse_duplicates(findings, clusters), {}, duplicates=clusters, collapsed=True)
+        report = out.getvalue()
+        assert "## Possible Duplicates" in report
+        assert "| DUP-001 | AUTH-004: SQL injection in the login | API-002, API-003 |" in report
+        assert "| Total Findings | 2 |" in report
+        out = io.StringIO()
+        write_template_report(out, findings, {}, load_template(REPORT_TEMPLATE), duplicates=clusters)
+        assert "| DUP-001 | AUTH-004: SQL injection in the login | API-002, API-003 |" in out.getvalue()
+        out = io.StringIO()
+        write_json_report(out, findings, {}, duplicates=clusters)
+        assert json.loads(out.getvalue())["duplicates"] == {
+            "collapsed": False,
+            "clusters": [{"id": "DUP-001", "representative": "AUTH-004",
+                          "members": ["AUTH-004", "API-002", "API-003"]}],
+        }
+        out = io.StringIO()
+        write_json_report(out, findings, {})
+        assert "duplicates" not in json.loads(out.getvalue())
+
+    def test_cli_collapse(self, sample_audit_dir, monkeypatch):
+        """Test --collapse-duplicates implies --dedupe and reports no clusters for distinct findings."""
+        import generate_report
+        monkeypatch.setattr(sys, "argv", ["generate_report.py", str(sample_audit_dir),
+                                          "--format", "json", "--collapse-duplicates"])
+        generate_report.main()
+        report = json.loads((sample_audit_dir / "final-report.json").read_text())
+        assert report["duplicates"] == {"collapsed": True, "clusters": []}
+        assert report["summary"]["total_findings"] == len(load_findings(sample_audit_dir))
+
+
+class TestDeltaReport:
+    """Tests for audit-to-audit delta reports."""
+
+    @staticmethod
+    def make_finding(fid, title="Issue", severity="high", status="open", cwe="CWE-89", location=""):
+        return Finding(file=f"{fid}.md", id=fid, title=title, severity=severity, phase="1",
+                       status=status, cwe=cwe, location=location)
+
+    def test_fingerprint_normalisation(self):
+        """Test fingerprints ignore case, whitespace and line numbers."""
+        a = self.make_finding("auth-001", title="SQL  Injection", location="./src/db.py:10")
+        b = self.make_finding("AUTH-001", title="sql injection", location="src/db.py:42")
+        c = self.make_finding("AUTH-001", title="sql injection", location="src/other.py:42")
+        assert finding_fingerprint(a) == finding_fingerprint(b)
+        assert finding_fingerprint(a) != finding_fingerprint(c)
+
+    def test_diff_categories(self):
+        """Test new, fixed, regressed and unchanged classification."""
+        baseline = [
+            self.make_finding("A-1"),
+            self.make_finding("A-2"),
+            self.make_finding("A-3", status="resolved"),
+            self.make_finding("A-4"),
+            self.make_finding("A-5", status="resolved"),
+        ]
+        current = [
+            self.make_finding("A-1"),
+            self.make_finding("A-2", status="resolved"),
+            self.make_finding("A-3"),
+            self.make_finding("A-6"),
+        ]
+        delta = diff_findings(baseline, current)
+        assert [e["id"] for e in delta["new"]] == ["A-6"]
+        assert [e["id"] for e in delta["regressed"]] == ["A-3"]
+        assert [e["id"] for e in delta["fixed"]] == ["A-2", "A-4"]
+        assert [e["id"] for e in delta["unchanged"]] == ["A-1"]
+        assert next(e for e in delta["fixed"] if e["id"] == "A-4")["status"] == "removed"
+
+    def test_retitled_finding_matches_by_id(self):
+        """Test a finding whose title changed is matched on its ID."""
+        delta = diff_findings([self.make_finding("A-1", title="Old")],
+                              [self.make_finding("A-1", title="New", severity="critical")])
+        assert delta["new"] == [] and delta["fixed"] == []
+        assert delta["unchanged"][0]["baseline_severity"] == "high"
+
+    def test_baseline_from_json_report(self, sample_audit_dir, temp_dir):
+        """Test a previous JSON report is enough as a baseline."""
+        baseline_file = temp_dir / "baseline.json"
+        baseline_file.write_text(generate_json_report(sample_audit_dir), encoding="utf-8")
+        (sample_audit_dir / "findings" / "VULN-002.md").unlink()
+
+        delta = diff_findings(load_baseline(baseline_file), load_findings(sample_audit_dir))
+        assert [e["id"] for e in delta["fixed"]] == ["VULN-002"]
+        assert len(delta["unchanged"]) == 2
+
+    def test_baseline_from_project_root(self, sample_audit_dir):
+        """Test a project root baseline resolves to its .audit directory."""
+        baseline = load_baseline(sample_audit_dir.parent)
+        assert len(baseline) == 3
+        with pytest.raises(ValueError):
+            load_baseline(sample_audit_dir / "findings")
+
+    def test_unreadable_baseline_exits(self, sample_audit_dir, temp_dir, monkeypatch, capsys):
+        """Test malformed baselines are reported on stderr with exit status 1."""
+        import generate_report
+        baseline_file = temp_dir / "baseline.json"
+        for text in ('{"findings": [', '"not a report"'):
+            baseline_file.write_text(text, encoding="utf-8")
+            with pytest.raises(ValueError):
+                load_baseline(baseline_file)
+        monkeypatch.setattr(sys, "argv", ["generate_report.py", str(sample_audit_dir),
+                                          "--diff", str(baseline_file), "--stdout"])
+        with pytest.raises(SystemExit) as exit_info:
+            generate_report.main()
+        assert exit_info.value.code == 1
+        assert "Cannot read baseline" in capsys.readouterr().err
+
+    def test_delta_renderers(self, sample_audit_dir):
+        """Test markdown and JSON delta output."""
+        import io
+        delta = diff_findings([], load_findings(sample_audit_dir))
+        md = io.StringIO()
+        write_delta_report(md, delta, {}, Path("baseline.json"))
+        assert "## Changes Since Baseline" in md.getvalue()
+        assert "### 🆕 New (3)" in md.getvalue()
+        js = io.StringIO()
+        write_delta_json(js, delta, {}, Path("baseline.json"))
+        data = json.loads(js.getvalue())
+        assert data["summary"] == {"new": 3, "regressed": 0, "fixed": 0, "unchanged": 0}
+
+
+class TestProfiling:
+    """Tests for --profile stage timing."""
+
+    def test_profiler_attributes_nested_calls_to_outer_stage(self):
+        """Test nested instrumented calls count once, toward the outermost stage."""
+        import types
+        from profiling import Profiler
+
+        module = types.SimpleNamespace()
+        module.inner = lambda: "abc"
+        module.outer = lambda: module.inner() * 2
+        profiler = Profiler(trace_memory=False)
+        profiler.start()
+        profiler.instrument(module, {"outer": ["outer"], "inner": ["inner"]}, sizes={"outer": len})
+        with profiler.phase("run"):
+            module.outer()
+            module.inner()
+        profiler.stop()
+
+        stages = {(s["parent"], s["name"]): s for s in profiler.summary()["stages"]}
+        assert stages[("run", "outer")]["calls"] == 1
+        assert stages[("run", "outer")]["bytes"] == 6
+        assert stages[("run", "inner")]["calls"] == 1
+        assert module.inner() == "abc" and not hasattr(module.outer, "__wrapped__")
+
+    def test_profile_flag(self, sample_audit_dir, temp_dir, monkeypatch, capsys):
+        """Test --profile prints a stage table and --profile-json writes a trace."""
+        import generate_report
+        original = generate_report.read_file
+        trace = temp_dir / "profile.json"
+        monkeypatch.setattr(sys, "argv", ["generate_report.py", str(sample_audit_dir),
+                                          "--format", "all", "--no-cache", "--profile-json", str(trace)])
+        generate_report.main()
+
+        err = capsys.readouterr().err
+        assert "write final-report.md" in err
+        assert "findings: 3" in err
+        data = json.loads(trace.read_text())
+        stages = {(s["parent"], s["name"]): s for s in data["stages"]}
+        assert stages[("load", "read")]["calls"] == 3
+        assert stages[("load", "context")]["calls"] == 1
+        assert stages[("load", "read")]["bytes"] > 0
+        assert stages[(None, "write findings.csv")]["bytes"] == (sample_audit_dir / "findings.csv").stat().st_size
+        assert data["peak_memory_bytes"] > 0
+        # Instrumentation is removed once the run finishes
+        assert generate_report.read_file is original
+
+
+class TestAtomicOutput:
+    """Tests for atomic, concurrent report writes."""
+
+    def test_write_output_replaces_file(self, temp_dir):
+        """Test output is renamed into place with no temporary files left behind."""
+        path = temp_dir / "report.md"
+        path.write_text("old")
+        write_output(path, lambda out: out.write("new\n"))
+        assert path.read_text() == "new\n"
+        assert [p.name for p in temp_dir.iterdir()] == ["report.md"]
+
+    def test_failed_write_keeps_previous_file(self, temp_dir):
+        """Test a renderer error leaves the previous file intact and cleans up."""
+        path = temp_dir / "report.md"
+        path.write_text("old")
+
+        def fail(out):
+            out.write("partial")
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            write_output(path, fail)
+        assert path.read_text() == "old"
+        assert [p.name for p in temp_dir.iterdir()] == ["report.md"]
+
+    def test_format_all_with_gzip(self, sample_audit_dir, monkeypatch):
+        """Test --format all writes every output plus a gzip archive of the JSON."""
+        import gzip
+        import generate_report
+        monkeypatch.setattr(sys, "argv", ["generate_report.py", str(sample_audit_dir),
+                                          "--format", "all", "--no-cache", "--compress", "gzip"])
+        generate_report.main()
+
+        assert not list(sample_audit_dir.glob(".*.tmp"))
+        csv_text = (sample_audit_dir / "findings.csv").read_bytes().decode("utf-8")
+        assert csv_text == generate_csv_report(sample_audit_dir)
+        # The archive is the written report compressed, not a second rendering
+        with gzip.open(sample_audit_dir / "final-report.json.gz", "rb") as fh:
+            assert fh.read() == (sample_audit_dir / "final-report.json").read_bytes()
+        assert (sample_audit_dir / "final-report.md").read_text().startswith("# Security Audit Report")
+
+    def test_zstd_requires_package(self, sample_audit_dir, monkeypatch):
+        """Test --compress zstd is rejected when zstandard is not installed."""
+        import generate_report
+        monkeypatch.setattr(generate_report, "zstandard", None)
+        monkeypatch.setattr(sys, "argv", ["generate_report.py", str(sample_audit_dir),
+                                          "--format", "json", "--compress", "zstd"])
+        with pytest.raises(SystemExit):
+            generate_report.parse_args()
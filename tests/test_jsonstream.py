@@ -0,0 +1,79 @@
+"""
+Tests for jsonstream.py
+
+Tests walking JSON documents incrementally across read-chunk boundaries,
+skipping unconsumed values and reporting malformed input.
+"""
+
+import io
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "skill" / "scripts"))
+
+from jsonstream import JsonStream, JsonStreamError
+
+
+DOCUMENT = {
+    "skip": {"nested": ["a", {"b": "}]\"["}], "n": -1.5e3},
+    "results": [{"id": 1, "text": "café \\ \"quoted\""}, 12345, None, [], {}],
+    "after": True,
+}
+
+
+def walk(text: str, chunk_size: int) -> dict:
+    """Collect ``results`` and ``after`` from a document, leaving other values unread."""
+    stream = JsonStream(io.StringIO(text), chunk_size)
+    found = {"results": []}
+    for key in stream.members():
+        if key == "results":
+            for _ in stream.items():
+                found["results"].append(stream.value())
+        elif key == "after":
+            found["after"] = stream.value()
+    return found
+
+
+class TestJsonStream:
+    """Tests for the incremental JSON reader."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 1 << 16])
+    def test_chunk_boundaries(self, chunk_size):
+        """Test values are decoded the same whatever the read chunk size."""
+        found = walk(json.dumps(DOCUMENT, indent=1), chunk_size)
+        assert found == {"results": DOCUMENT["results"], "after": True}
+
+    def test_unconsumed_values_skipped(self):
+        """Test members and items the caller only peeks at are skipped."""
+        stream = JsonStream(io.StringIO('{"a": [1, [2, 3], "x"], "b": {"c": "d"}}'), 2)
+        seen = []
+        for key in stream.members():
+            seen.append((key, stream.peek()))
+            if key == "a":
+                seen += [index for index in stream.items()]
+        assert seen == [("a", "["), 0, 1, 2, ("b", "{")]
+        assert stream.peek() == ""
+
+    def test_offset(self):
+        """Test the offset points at the next value in the document."""
+        text = '{"pad": "' + "x" * 100 + '", "v": 7}'
+        stream = JsonStream(io.StringIO(text), 8)
+        for key in stream.members():
+            if key == "v":
+                assert text[stream.offset] == "7"
+
+    @pytest.mark.parametrize("text", ['{"a": [1, 2', '{"a" 1}', '{"a": "x', '[1 2]', ''])
+    def test_malformed(self, text):
+        """Test truncated or invalid documents raise JsonStreamError."""
+        with pytest.raises(JsonStreamError):
+            stream = JsonStream(io.StringIO(text), 4)
+            if stream.peek() == "[":
+                for _ in stream.items():
+                    stream.value()
+            else:
+                for _ in stream.members():
+                    pass
@@ -0,0 +1,168 @@
+"""
+Tests for portfolio_report.py
+
+Tests loading project summaries, combining them into a portfolio rollup, and
+rendering the markdown and JSON portfolio reports.
+"""
+
+import io
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "skill" / "scripts"))
+
+from portfolio_report import (
+    resolve_audit_dir,
+    load_project,
+    load_portfolio,
+    build_rollup,
+    unique_names,
+    write_markdown_rollup,
+    write_json_rollup,
+)
+
+
+@pytest.fixture
+def portfolio(sample_audit_dir, temp_dir):
+    """Create a second, lower-risk project next to the sample audit."""
+    second = temp_dir / "billing" / ".audit"
+    (second / "findings").mkdir(parents=True)
+    (second / "findings" / "API-001.md").write_text('''# Verbose Errors
+
+| Field | Value |
+|-------|-------|
+| **ID** | API-001 |
+| **Severity** | High |
+| **Phase** | 10 |
+| **Status** | Open |
+| **OWASP** | A05:2021 |
+| **CWE** | CWE-209 |
+''')
+    (second / "findings" / "API-002.md").write_text('''# SQL Injection in Search
+
+| Field | Value |
+|-------|-------|
+| **ID** | API-002 |
+| **Severity** | Medium |
+| **Phase** | 3 |
+| **Status** | Open |
+| **OWASP** | A03:2021 |
+| **CWE** | CWE-89: SQL Injection |
+''')
+    return [sample_audit_dir, second]
+
+
+class TestResolveAuditDir:
+    """Tests for audit directory resolution."""
+
+    def test_project_root(self, sample_audit_dir):
+        """Test a project root resolves to its .audit directory."""
+        assert resolve_audit_dir(sample_audit_dir.parent) == sample_audit_dir.resolve()
+
+    def test_audit_dir(self, sample_audit_dir):
+        """Test an .audit directory is used as-is."""
+        assert resolve_audit_dir(sample_audit_dir) == sample_audit_dir.resolve()
+
+
+class TestLoadProject:
+    """Tests for per-project summaries."""
+
+    def test_project_summary(self, sample_audit_dir):
+        """Test counts, risk level and queue of a project summary."""
+        project = load_project(sample_audit_dir)
+        assert project["name"] == "Test Application"
+        assert project["risk_level"] == "Critical"
+        assert project["total_findings"] == 3
+        assert project["open_findings"] == 2
+        assert project["by_severity"]["critical"] == 1
+        assert project["owasp"] == {"A03": 1}
+        assert project["cwe"]["CWE-89"] == {"critical": 1}
+        assert [e["id"] for e in project["queue"]] == ["VULN-001", "VULN-002"]
+
+    def test_name_falls_back_to_directory(self, portfolio):
+        """Test projects without audit context are named after their directory."""
+        assert load_project(portfolio[1])["name"] == "billing"
+
+    def test_reuses_existing_cache_only(self, sample_audit_dir):
+        """Test loading does not create a findings cache."""
+        load_project(sample_audit_dir)
+        assert not (sample_audit_dir / ".cache").exists()
+
+    def test_jobs_read_like_generate_report(self, portfolio):
+        """Test unset and negative --jobs values load the same summaries instead of failing."""
+        assert load_portfolio(portfolio, jobs=None) == load_portfolio(portfolio, jobs=-1)
+
+    def test_load_portfolio_parallel_matches_serial(self, portfolio):
+        """Test pooled loading returns the same summaries in input order."""
+        assert load_portfolio(portfolio, jobs=2) == load_portfolio(portfolio, jobs=1)
+
+
+class TestBuildRollup:
+    """Tests for combining project summaries."""
+
+    def test_totals_and_ordering(self, portfolio):
+        """Test portfolio totals and riskiest-first project order."""
+        rollup = build_rollup(load_portfolio(portfolio, jobs=1))
+        assert rollup["summary"]["projects"] == 2
+        assert rollup["summary"]["total_findings"] == 5
+        assert rollup["summary"]["by_risk_level"] == {"Critical": 1, "High": 0, "Medium": 1, "Low": 0}
+        assert [p["name"] for p in rollup["projects"]] == ["Test Application", "billing"]
+
+    def test_cwe_heatmap_merges_projects(self, portfolio):
+        """Test CWE rows combine normalized IDs across projects."""
+        rollup = build_rollup(load_portfolio(portfolio, jobs=1))
+        row = rollup["heatmaps"]["cwe"]["CWE-89"]
+        assert row["projects"] == 2
+        assert row["critical"] == 1 and row["medium"] == 1
+
+    def test_owasp_heatmap(self, portfolio):
+        """Test OWASP heatmap has a row per project."""
+        rollup = build_rollup(load_portfolio(portfolio, jobs=1))
+        assert rollup["heatmaps"]["owasp"]["billing"]["A05"] == 1
+        assert rollup["heatmaps"]["owasp"]["Test Application"]["A05"] == 0
+
+    def test_shared_directory_names_kept_apart(self, portfolio, temp_dir):
+        """Test projects in same-named directories each keep their heatmap row."""
+        projects = []
+        for parent in ("a", "b"):
+            audit_dir = temp_dir / parent / "billing" / ".audit"
+            (audit_dir / "findings").mkdir(parents=True)
+            projects.append(load_project(audit_dir))
+        assert [p["name"] for p in unique_names(projects)] == ["billing (a/billing)", "billing (b/billing)"]
+        rollup = build_rollup(projects + [load_project(portfolio[1])])
+        assert len(rollup["heatmaps"]["owasp"]) == 3
+        assert f"billing ({portfolio[1].parent.parent.name}/billing)" in rollup["heatmaps"]["owasp"]
+
+    def test_global_queue_ordered_by_severity(self, portfolio):
+        """Test the remediation queue is severity-ordered and limited."""
+        rollup = build_rollup(load_portfolio(portfolio, jobs=1), queue_limit=2)
+        assert [e["id"] for e in rollup["remediation_queue"]] == ["VULN-001", "API-001"]
+        assert rollup["remediation_queue_total"] == 4
+
+
+class TestRenderRollup:
+    """Tests for portfolio report rendering."""
+
+    def test_markdown(self, portfolio):
+        """Test markdown report sections."""
+        out = io.StringIO()
+        write_markdown_rollup(out, build_rollup(load_portfolio(portfolio, jobs=1)))
+        report = out.getvalue()
+        assert "# Security Portfolio Report" in report
+        assert "## OWASP Top 10 Heatmap" in report
+        assert "## CWE Heatmap" in report
+        assert "## Global Remediation Queue" in report
+        assert "| billing | Medium |" in report
+
+    def test_json(self, portfolio):
+        """Test JSON report is valid and complete."""
+        out = io.StringIO()
+        write_json_rollup(out, build_rollup(load_portfolio(portfolio, jobs=1)))
+        data = json.loads(out.getvalue())
+        assert data["summary"]["projects"] == 2
+        assert "generated_at" in data["metadata"]
+        assert "queue" not in data["projects"][0]
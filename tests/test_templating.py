@@ -0,0 +1,127 @@
+"""
+Tests for templating.py
+
+Tests compiling templates with output tags, filters, conditionals and loops,
+rejecting unsafe or malformed templates, and caching compiled templates.
+"""
+
+import io
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "skill" / "scripts"))
+
+import templating
+from templating import Template, TemplateError, load_template
+
+
+def render(source: str, **context) -> str:
+    out = io.StringIO()
+    Template(source).render(out, context)
+    return out.getvalue()
+
+
+class TestRendering:
+    """Tests for template rendering."""
+
+    def test_output_and_lookups(self):
+        """Test dotted lookups resolve mapping keys and attributes, and None renders empty."""
+        class Item:
+            id = "A-1"
+        assert render("{{ item.id }} {{ data.name }} [{{ missing }}] {{ data.tags[1] }}",
+                      item=Item(), data={"name": "x", "tags": ["a", "b"]}) == "A-1 x [] b"
+
+    def test_filters(self):
+        """Test filters chain left to right and take arguments."""
+        assert render('{{ s | truncate(3, "...") | upper }}', s="abcdef") == "ABC..."
+        assert render('{{ ids | join(", ") | default("-") }}', ids=[]) == "-"
+        assert render("{{ ids | length }} {{ sev | title }}", ids=[1, 2], sev="high") == "2 High"
+
+    def test_conditionals(self):
+        """Test if / elif / else branches."""
+        source = "{% if n > 1 %}many{% elif n == 1 %}one{% else %}none{% endif %}"
+        assert [render(source, n=n) for n in (0, 1, 5)] == ["none", "one", "many"]
+
+    def test_loops(self):
+        """Test loops, tuple unpacking, loop.index and scoping."""
+        source = "{% for k, v in pairs %}{{ loop.index }}:{{ k }}={{ v }} {% endfor %}{{ k }}"
+        assert render(source, pairs=[("a", 1), ("b", 2)], k="outer") == "1:a=1 2:b=2 outer"
+
+    def test_block_lines_trimmed(self):
+        """Test block tags and comments alone on a line leave no blank lines."""
+        source = "start\n{# note #}\n{% for x in xs %}\n- {{ x }}\n{% endfor %}\nend\n"
+        assert render(source, xs=[1, 2]) == "start\n- 1\n- 2\nend\n"
+
+
+class TestCompileErrors:
+    """Tests for rejecting invalid templates."""
+
+    @pytest.mark.parametrize("source", [
+        "{{ open('x') }}",
+        "{{ f.__class__ }}",
+        "{{ x | nosuchfilter }}",
+        "{% for x in xs %}",
+        "{% endif %}",
+        "{% while x %}",
+    ])
+    def test_rejected(self, source):
+        """Test calls, private attributes, unknown filters and unbalanced blocks are rejected."""
+        with pytest.raises(TemplateError):
+            Template(source)
+
+    def test_error_reports_line(self):
+        """Test errors name the template line."""
+        with pytest.raises(TemplateError, match="line 3"):
+            Template("a\nb\n{{ x | bad }}\n", "t.md")
+
+
+class TestLoadTemplate:
+    """Tests for the compiled-template cache."""
+
+    def test_cached_until_modified(self, temp_dir):
+        """Test a template is compiled once and recompiled when the file changes."""
+        path = temp_dir / "t.tmpl"
+        path.write_text("v1 {{ x }}")
+        first = load_template(path)
+        assert load_template(path) is first
+        path.write_text("v2 {{ x }}")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        second = load_template(path)
+        assert second is not first
+        out = io.StringIO()
+        second.render(out, {"x": 1})
+        assert out.getvalue() == "v2 1"
+
+    def test_compiled_code_cached_on_disk(self, temp_dir, monkeypatch):
+        """Test a later run loads the compiled template from cache_dir instead of compiling."""
+        path = temp_dir / "t.tmpl"
+        path.write_text("{% for x in xs %}{{ x }},{% endfor %}")
+        cache_dir = temp_dir / ".cache"
+        load_template(path, cache_dir)
+        assert len(list(cache_dir.glob("template-*.bin"))) == 1
+
+        monkeypatch.setattr(templating, "_cache", {})
+        monkeypatch.setattr(templating, "_Compiler", None)
+        out = io.StringIO()
+        load_template(path, cache_dir).render(out, {"xs": [1, 2]})
+        assert out.getvalue() == "1,2,"
+
+    def test_disk_cache_invalidated_by_edit(self, temp_dir, monkeypatch):
+        """Test an edited template is recompiled rather than read from cache_dir."""
+        path = temp_dir / "t.tmpl"
+        path.write_text("v1")
+        cache_dir = temp_dir / ".cache"
+        load_template(path, cache_dir)
+        path.write_text("v2")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        monkeypatch.setattr(templating, "_cache", {})
+        out = io.StringIO()
+        load_template(path, cache_dir).render(out, {})
+        assert out.getvalue() == "v2"
@@ -2,7 +2,8 @@
 Tests for validate_finding.py
 
 Tests finding document validation including required fields, severity validation,
-OWASP/CWE reference validation, and phase validation.
+OWASP/CWE reference validation, and phase validation, and the cross-finding
+consistency check of an audit directory.
 """
 
 import sys
@@ -14,11 +15,14 @@ import pytest
 sys.path.insert(0, str(Path(__file__).parent.parent / "skill" / "scripts"))
 
 from validate_finding import (
+    check_audit,
     extract_field,
     validate_severity,
     validate_status,
     validate_owasp,
+    validate_cvss,
     validate_cwe,
+    validate_cwe_owasp,
     validate_phase,
     validate_finding,
     VALID_SEVERITIES,
@@ -163,6 +167,52 @@ class TestCWEValidation:
         valid, error = validate_cwe("CWE")
         assert not valid
 
+    def test_unknown_cwe_id(self):
+        """Test CWE IDs beyond the catalog's assigned range are rejected."""
+        valid, error = validate_cwe("CWE-99999")
+        assert not valid
+        assert "CWE-99999" in error
+
+    def test_cwe_category(self):
+        """Test CWE categories are flagged in favour of a specific weakness."""
+        valid, error = validate_cwe("CWE-16")
+        assert not valid
+        assert "category" in error
+
+    def test_cwe_owasp_consistency(self):
+        """Test a CWE must fit the OWASP 2021 category it is filed under."""
+        assert validate_cwe_owasp("CWE-89", "A03:2021 - Injection")[0]
+        valid, error = validate_cwe_owasp("CWE-89", "A01:2021")
+        assert not valid
+        assert "A03:2021" in error
+        # Any matching CWE, unmapped CWEs and other Top 10 editions pass
+        assert validate_cwe_owasp("CWE-79, CWE-352", "A01:2021")[0]
+        assert validate_cwe_owasp("CWE-400", "A05:2021")[0]
+        assert validate_cwe_owasp("CWE-89", "A1:2017 - Injection")[0]
+        assert validate_cwe_owasp("", "A01")[0]
+
+
+class TestCVSSValidation:
+    """Tests for CVSS v4.0 score validation."""
+
+    V4 = "CVSS:4.0/AV:N/AC:L/AT:N/PR:N/UI:N/VC:H/VI:H/VA:H/SC:N/SI:N/SA:N"
+
+    def test_v4_without_score(self):
+        """Test a v4.0 vector alone is flagged, since v4 vectors are not scored."""
+        valid, error = validate_cvss(self.V4, f"| **CVSS Score** | {self.V4} |")
+        assert not valid
+        assert "numeric score" in error
+
+    def test_v4_with_score(self):
+        """Test a v4.0 vector with its numeric score passes."""
+        assert validate_cvss(f"9.3 ({self.V4})", f"| **CVSS Score** | 9.3 ({self.V4}) |") == (True, None)
+        assert validate_cvss("9.3", f"| **CVSS Score** | 9.3 |\n\nVector: {self.V4}") == (True, None)
+
+    def test_v3_vector_alone(self):
+        """Test v3 vectors need no separate score."""
+        vector = "CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:H"
+        assert validate_cvss("", f"Vector: {vector}") == (True, None)
+
 
 class TestPhaseValidation:
     """Tests for phase validation."""
@@ -270,6 +320,7 @@ PoC here
         assert result["fields"]["phase"] == "3"
         assert result["fields"]["id"] == "TEST-001"
         assert "CWE-79" in result["fields"]["cwe"]
+        assert result["fields"]["cwe_name"] == "Improper Neutralization of Input During Web Page Generation ('Cross-site Scripting')"
 
     def test_invalid_owasp_generates_warning(self):
         """Test that invalid OWASP reference generates warning."""
@@ -294,3 +345,82 @@ PoC here
 """
         result = validate_finding(content)
         assert any("cwe" in w.lower() for w in result["warnings"])
+
+    def test_cwe_owasp_mismatch_generates_warning(self):
+        """Test that a CWE outside the finding's OWASP category generates a warning."""
+        content = """
+| Field | Value |
+|-------|-------|
+| **Severity** | High |
+| **Phase** | 3 |
+| **OWASP** | A02:2021 |
+| **CWE** | CWE-89 |
+"""
+        result = validate_finding(content)
+        assert result["valid"]
+        assert any("A03:2021" in w for w in result["warnings"])
+
+
+def write_finding(findings_dir: Path, name: str, finding_id: str, phase: str, severity: str = "High",
+                  body: str = "") -> None:
+    """Write a minimal finding file."""
+    (findings_dir / name).write_text(
+        f"# [{finding_id}] Title\n\n| Field | Value |\n|-------|-------|\n"
+        f"| **ID** | {finding_id} |\n| **Severity** | {severity} |\n| **Phase** | {phase} |\n\n{body}\n"
+    )
+
+
+class TestCheckAudit:
+    """Tests for cross-finding consistency checks of an audit directory."""
+
+    def test_consistent_audit(self, sample_audit_dir):
+        """Test an audit without conflicts passes with no warnings."""
+        result = check_audit(sample_audit_dir)
+        assert result == {"valid": True, "errors": [], "warnings": [], "findings": 3}
+
+    def test_duplicate_ids_and_prefix_mismatch(self, temp_dir):
+        """Test duplicate IDs are errors and prefixes of another phase are warnings."""
+        findings_dir = temp_dir / "findings"
+        findings_dir.mkdir()
+        write_finding(findings_dir, "auth-001.md", "AUTH-001", "Phase 1 - Authentication")
+        write_finding(findings_dir, "auth-001-copy.md", "AUTH-001", "Phase 1 - Authentication")
+        write_finding(findings_dir, "auth-002.md", "AUTH-002", "Phase 5 - Data Layer")
+        write_finding(findings_dir, "perf-001.md", "PERF-001", "Phase 5")
+        result = check_audit(temp_dir)
+        assert not result["valid"]
+        assert result["errors"] == ["Duplicate ID AUTH-001 in auth-001-copy.md, auth-001.md"]
+        assert len(result["warnings"]) == 1
+        assert "AUTH-002" in result["warnings"][0] and "Phase 5" in result["warnings"][0]
+
+    def test_stale_references(self, temp_dir):
+        """Test mentions of finding IDs that do not exist are reported, other IDs are not."""
+        findings_dir = temp_dir / "findings"
+        findings_dir.mkdir()
+        write_finding(findings_dir, "api-001.md", "API-001", "3",
+                      body="Chains with AUTH-001 and API-009 (CWE-89, CVE-2023-1234).")
+        write_finding(findings_dir, "auth-001.md", "AUTH-001", "1", body="See API-001.")
+        result = check_audit(temp_dir)
+        assert result["valid"]
+        assert result["warnings"] == ["api-001.md: references API-009, which no finding has"]
+
+    def test_audit_context(self, temp_dir):
+        """Test audit-context.md listings, phase counts and totals are checked against disk."""
+        findings_dir = temp_dir / "findings"
+        findings_dir.mkdir()
+        write_finding(findings_dir, "auth-001.md", "AUTH-001", "1", severity="Critical")
+        write_finding(findings_dir, "auth-002.md", "AUTH-002", "1")
+        (temp_dir / "audit-context.md").write_text(
+            "## Phase Status\n\n| Phase | Name | Status | Findings | Date Completed |\n"
+            "|-------|------|--------|----------|----------------|\n"
+            "| 0 | Reconnaissance | Completed | 0 | |\n| 1 | Authentication | Completed | 3 | |\n\n"
+            "## Findings Summary\n\n| ID | Title | Severity | Phase | Status |\n|----|----|----|----|----|\n"
+            "| AUTH-001 | Weak hashing | Critical | 1 | Open |\n| AUTH-003 | Gone | High | 1 | Open |\n\n"
+            "**Totals:** Critical: 1 | High: 2 | Medium: 0 | Low: 0 | Info: 0\n"
+        )
+        result = check_audit(temp_dir)
+        assert result["errors"] == ["audit-context.md lists AUTH-003, but no finding file has that ID"]
+        assert result["warnings"] == [
+            "AUTH-002 is missing from the audit-context.md Findings Summary",
+            "audit-context.md counts 3 findings for Phase 1, 2 on disk",
+            "audit-context.md totals 2 high findings, 1 on disk",
+        ]